@@ -0,0 +1,67 @@
+"""Dekodieren von API-Antworten: ``json`` + Roh-Features vs. ``decode_warnings``.
+
+Ohne Dateien mit synthetischen Antworten im Format der echten API, sonst
+mit aufgezeichneten Antworten, z.B.::
+
+    curl -o wien.json "https://warnungen.zamg.at/wsapp/api/getWarningsForCoords?lon=16.37&lat=48.21&lang=de"
+    python -m benchmarks.bench_decode wien.json
+    python -m benchmarks.bench_decode --sizes 1 10 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from custom_components.geosphere_wetterwarnung.model import (
+    WarningRecord,
+    decode_warnings,
+)
+
+from .common import median_ms
+from .payloads import make_api_body
+
+ROUNDS = 30
+
+
+def _stdlib_decode(body: bytes) -> list[WarningRecord]:
+    """Bisheriger Weg: ``json.loads`` und danach Umwandlung."""
+    props = json.loads(body).get("properties", {}) or {}
+    return [
+        WarningRecord.from_feature(feature)
+        for feature in props.get("warnings", []) or []
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", type=Path, nargs="*", help="aufgezeichnete Antworten")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+
+    if args.files:
+        bodies = [(path.name, path.read_bytes()) for path in args.files]
+    else:
+        now_ts = int(time.time())
+        bodies = [
+            (f"{size} Warnungen", make_api_body(size, now_ts)) for size in args.sizes
+        ]
+
+    print(
+        f"{'Antwort':<20} {'KiB':>8} {'Warn.':>6} {'json ms':>9} "
+        f"{'decode ms':>10} {'Faktor':>7}"
+    )
+    for name, body in bodies:
+        warnings = decode_warnings(body)
+        assert warnings == _stdlib_decode(body)
+        stdlib_ms = median_ms(lambda: _stdlib_decode(body), ROUNDS)
+        fast_ms = median_ms(lambda: decode_warnings(body), ROUNDS)
+        print(
+            f"{name[:20]:<20} {len(body) / 1024:>8.1f} {len(warnings):>6} "
+            f"{stdlib_ms:>9.3f} {fast_ms:>10.3f} {stdlib_ms / fast_ms:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""HTTP-Client: geteilte Session von Home Assistant vs. eigener Client.
+
+Fährt gegen den lokalen API-Ersatz mehrere Abruf-Zyklen über dieselben
+Koordinaten, einmal wie bisher über ``async_get_clientsession`` (nur
+``timeout=10``, keine eigenen Header) und einmal über ``SharedFetcher`` mit
+eigenem Client. Zwischen den Zyklen liegt ``--interval`` Sekunden Pause wie
+zwischen zwei Scan-Intervallen. Verglichen werden neue TCP-Verbindungen und
+übertragene Bytes (gezählt vom Server) sowie die Zyklusdauer.
+
+    python -m benchmarks.bench_http --coords 50 --cycles 3 --interval 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.geosphere_wetterwarnung.fetcher import SharedFetcher
+
+from .fake_api import FakeApiConfig, start_server
+from .loadtest import make_coords
+
+PARALLEL = 4
+
+
+def _urls(base_url: str, count: int) -> list[str]:
+    return [
+        f"{base_url}/getWarningsForCoords?lon={coord.split(',')[1]}"
+        f"&lat={coord.split(',')[0]}&lang=de"
+        for coord in make_coords(count).split(";")
+    ]
+
+
+async def _cycles(
+    fetch: Callable[[str], Awaitable[None]],
+    urls: list[str],
+    cycles: int,
+    interval: float,
+) -> list[float]:
+    semaphore = asyncio.Semaphore(PARALLEL)
+
+    async def _limited(url: str) -> None:
+        async with semaphore:
+            await fetch(url)
+
+    durations = []
+    for cycle in range(cycles):
+        if cycle:
+            await asyncio.sleep(interval)
+        started = time.perf_counter()
+        await asyncio.gather(*(_limited(url) for url in urls))
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+async def _run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        rows = []
+
+        # Bisheriger Weg: geteilte Session von Home Assistant
+        api = FakeApiConfig(latency_ms=args.latency_ms)
+        runner, base_url = await start_server(api)
+        session = async_get_clientsession(hass)
+
+        async def fetch_shared_session(url: str) -> None:
+            async with session.get(url, timeout=10) as resp:
+                await resp.read()
+
+        durations = await _cycles(
+            fetch_shared_session, _urls(base_url, args.coords), args.cycles,
+            args.interval,
+        )
+        rows.append(("HA-Session", dict(api.stats), durations, None))
+        await runner.cleanup()
+
+        # Eigener Client der gemeinsamen Abfrage-Schicht
+        api = FakeApiConfig(latency_ms=args.latency_ms)
+        runner, base_url = await start_server(api)
+        fetcher = SharedFetcher(hass)
+
+        async def decode(body: bytes) -> int:
+            return len(body)
+
+        async def fetch_own_client(url: str) -> None:
+            await fetcher.async_fetch(url, decode, max_age=0)
+
+        durations = await _cycles(
+            fetch_own_client, _urls(base_url, args.coords), args.cycles,
+            args.interval,
+        )
+        rows.append(("eigener Client", dict(api.stats), durations, fetcher.as_dict()))
+        await fetcher.async_close()
+        await runner.cleanup()
+        await hass.async_stop(force=True)
+
+    print(
+        f"{args.coords} Koordinaten, {args.cycles} Zyklen, "
+        f"{args.interval:g} s Pause\n"
+    )
+    print(
+        f"{'':<16} {'Abfragen':>9} {'Verbind.':>9} {'Bytes':>10} "
+        f"{'B/Abfrage':>10} {'Zyklus ms':>10}"
+    )
+    for name, stats, durations, _ in rows:
+        print(
+            f"{name:<16} {stats['requests']:>9} {stats['connections']:>9} "
+            f"{stats['bytes_sent']:>10} "
+            f"{stats['bytes_sent'] / max(stats['requests'], 1):>10.0f} "
+            f"{statistics.median(durations):>10.1f}"
+        )
+    client = rows[-1][3]
+    print(
+        f"\nEigener Client: {client['connections_reused']} wiederverwendete / "
+        f"{client['connections_created']} neue Verbindungen, "
+        f"{client['wire_bytes']} Bytes übertragen, "
+        f"{client['body_bytes']} Bytes entpackt"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--coords", type=int, default=50)
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--interval", type=float, default=20.0)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Modus "je Ort": Kosten je Tick bei vielen Orten.
+
+Misst für ``LOCATIONS`` Orte x 16 Entitäten das Aufteilen der Warnungen auf
+die Orte, das Anlegen der Entitäten und einen Tick des Koordinators
+(``async_update_listeners``), wenn kein, ein bzw. jeder Ort neue Warnungen
+hat. Das Schreiben in die State Machine wird nur gezählt, nicht ausgeführt.
+
+    python -m benchmarks.bench_locations [anzahl_orte ...]
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import tempfile
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.geosphere_wetterwarnung.binary_sensor import (
+    CurrentSummaryBinarySensor,
+    UpcomingSummaryBinarySensor,
+    WarningTypeBinarySensor,
+)
+from custom_components.geosphere_wetterwarnung.const import (
+    CONF_EXTRA_COORDS,
+    CONF_INCLUDE_HOME,
+    CONF_PER_LOCATION,
+)
+from custom_components.geosphere_wetterwarnung.coordinator import (
+    geosphereCoordinator,
+)
+from custom_components.geosphere_wetterwarnung.model import WarningRecord
+from custom_components.geosphere_wetterwarnung.sensor import WarningLevelSensor
+
+from .common import GRACE_SECONDS, make_coordinator, median_ms
+from .payloads import make_coordinate_responses
+
+LOCATIONS = 500
+WARNINGS_PER_LOCATION = 3
+ROUNDS = 20
+
+
+def _make_coordinator(hass: HomeAssistant, locations: int) -> geosphereCoordinator:
+    extra = ";".join(
+        f"{46.5 + idx * 0.005:.4f},{9.6 + idx * 0.013:.4f},Ort {idx}"
+        for idx in range(locations)
+    )
+    return make_coordinator(
+        hass,
+        {
+            CONF_EXTRA_COORDS: extra,
+            CONF_INCLUDE_HOME: False,
+            CONF_PER_LOCATION: True,
+        },
+    )
+
+
+def _make_entities(coordinator: geosphereCoordinator) -> list:
+    entities: list = []
+    for location, name in coordinator.configured_locations().items():
+        kwargs = {
+            "coordinator": coordinator,
+            "entry_id": "bench",
+            "location": location,
+            "location_name": name,
+        }
+        entities.append(UpcomingSummaryBinarySensor(**kwargs))
+        entities.append(CurrentSummaryBinarySensor(**kwargs))
+        for wtype in range(1, 8):
+            entities.append(WarningTypeBinarySensor(wtype=wtype, **kwargs))
+            entities.append(WarningLevelSensor(wtype=wtype, **kwargs))
+    return entities
+
+
+def bench(
+    hass: HomeAssistant, locations: int
+) -> tuple[dict[str, float], geosphereCoordinator]:
+    now_ts = int(dt_util.utcnow().timestamp())
+    coordinator = _make_coordinator(hass, locations)
+    coords = [
+        tuple(float(part) for part in label.split(","))
+        for label in coordinator.configured_locations()
+    ]
+    responses = make_coordinate_responses(
+        locations * WARNINGS_PER_LOCATION, locations, now_ts
+    )
+    results = [
+        {
+            "status": 200,
+            "warnings": [
+                WarningRecord.from_feature(w) for w in resp["properties"]["warnings"]
+            ],
+            "error": None,
+        }
+        for resp in responses
+    ]
+    combined = [w for result in results for w in result["warnings"]]
+    timings: dict[str, float] = {}
+
+    def build_locations() -> dict:
+        warnings, keys = coordinator._merge_with_grace(
+            combined, coords, now_ts, GRACE_SECONDS, False
+        )
+        return {
+            "properties": {"warnings": warnings},
+            "locations": coordinator._build_locations(
+                coords, results, warnings, keys, now_ts, GRACE_SECONDS
+            ),
+        }
+
+    timings["build_locations"] = median_ms(build_locations, ROUNDS)
+    data = build_locations()
+
+    entities: list = []
+    timings["create_entities"] = median_ms(
+        lambda: entities.__setitem__(slice(None), _make_entities(coordinator)), 5
+    )
+    writes = 0
+
+    def count_write() -> None:
+        nonlocal writes
+        writes += 1
+
+    for entity in entities:
+        entity.async_write_ha_state = count_write
+        coordinator.async_add_listener(
+            entity._handle_coordinator_update, entity.coordinator_context
+        )
+
+    def tick() -> None:
+        coordinator.async_update_listeners()
+
+    coordinator.data = data
+    tick()
+
+    # Gleiche Daten (z.B. Grenz-Timer ohne Wechsel): nichts neu auszuwerten
+    writes = 0
+    timings["tick_unchanged"] = median_ms(tick, ROUNDS)
+    unchanged_writes = writes
+
+    # Ein Ort bekommt eine zusätzliche Warnung, alle anderen unverändert
+    first = next(iter(data["locations"]))
+    changed = dict(data["locations"])
+    extra_warning = combined[-1]
+    state = {"toggle": False}
+
+    def tick_one_changed() -> None:
+        state["toggle"] = not state["toggle"]
+        warnings = data["locations"][first]["properties"]["warnings"]
+        if state["toggle"]:
+            warnings = warnings + [extra_warning]
+        changed[first] = {"properties": {"warnings": warnings}}
+        coordinator.data = {
+            "properties": data["properties"],
+            "locations": dict(changed),
+        }
+        tick()
+
+    writes = 0
+    timings["tick_one_location_changed"] = median_ms(tick_one_changed, ROUNDS)
+    one_changed_writes = writes / ROUNDS
+
+    # Alle Orte mit neuen Datenobjekten (schlechtester Fall)
+    def tick_all_changed() -> None:
+        coordinator.data = {
+            "properties": data["properties"],
+            "locations": {
+                label: {"properties": {"warnings": list(loc["properties"]["warnings"])}}
+                for label, loc in data["locations"].items()
+            },
+        }
+        tick()
+
+    timings["tick_all_locations_new"] = median_ms(tick_all_changed, 5)
+
+    timings["entities"] = len(entities)
+    timings["writes_unchanged_tick"] = unchanged_writes / ROUNDS
+    timings["writes_one_changed_tick"] = one_changed_writes
+    return timings, coordinator
+
+
+async def _run(sizes: list[int]) -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for size in sizes:
+            print(f"\n{size} Orte")
+            timings, coordinator = bench(hass, size)
+            for name, value in timings.items():
+                unit = "ms" if not name.startswith(("entities", "writes")) else ""
+                print(f"  {name:<32} {value:>10.3f} {unit}")
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [LOCATIONS]
+    asyncio.run(_run(sizes))
+
+
+if __name__ == "__main__":
+    main()
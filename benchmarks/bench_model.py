@@ -0,0 +1,61 @@
+"""Speicher je Warnung: Roh-Feature der API vs. ``WarningRecord``.
+
+Dekodiert eine Antwort im Format von ``getWarningsForCoords`` (mit den
+Textfeldern der echten API) und misst per ``tracemalloc``, was das Halten
+der Warnungen kostet, sowie die einmalige Umwandlung.
+
+    python -m benchmarks.bench_model [anzahl_warnungen ...]
+"""
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from custom_components.geosphere_wetterwarnung.model import WarningRecord
+
+from .payloads import make_api_body
+
+
+def _retained_bytes(build: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]
+    now_ts = int(time.time())
+    print(f"{'warnings':>9} {'raw B/w':>9} {'record B/w':>11} {'parse ms':>9}")
+    for size in sizes:
+        body = make_api_body(size, now_ts)
+        raw_bytes = _retained_bytes(
+            lambda: json.loads(body)["properties"]["warnings"]
+        )
+        record_bytes = _retained_bytes(
+            lambda: [
+                WarningRecord.from_feature(feature)
+                for feature in json.loads(body)["properties"]["warnings"]
+            ]
+        )
+        features = json.loads(body)["properties"]["warnings"]
+        started = time.perf_counter()
+        for feature in features:
+            WarningRecord.from_feature(feature)
+        parse_ms = (time.perf_counter() - started) * 1000
+        print(
+            f"{size:>9} {raw_bytes / max(size, 1):>9.0f} "
+            f"{record_bytes / max(size, 1):>11.0f} {parse_ms:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Warnregionen lokal auflösen: Zuordnung prüfen und Dauer messen.
+
+Baut den ``RegionIndex`` aus ``fixtures/getWarnstatus.json`` (Antwort im
+Format von ``getWarnstatus``, auf fünf Regionen mit vereinfachten
+Geometrien gekürzt: konkaves Polygon, Überlappung, MultiPolygon, Polygon mit
+Loch, GeometryCollection) und prüft bekannte Punkte innerhalb, außerhalb
+und auf Kanten. Danach wird ``resolve`` für viele Punkte gemessen.
+
+    python -m benchmarks.bench_regions [anzahl_punkte ...]
+
+Endet mit Exit-Code 1, wenn ein Punkt falsch zugeordnet wird.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+from custom_components.geosphere_wetterwarnung.region_index import RegionIndex
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "getWarnstatus.json"
+
+# (Beschreibung, lat, lon, erwartete Warnungs-Keys)
+CASES: list[tuple[str, float, float, set[str]]] = [
+    (
+        "Wien, zwei überlappende Regionen",
+        48.2082,
+        16.3738,
+        {"warnid:22101", "warnid:22102"},
+    ),
+    ("Wien, nur äußere Region", 48.12, 16.55, {"warnid:22101"}),
+    ("Einbuchtung, in der Bounding-Box", 48.28, 16.4, set()),
+    ("nördlich von Wien", 48.4, 16.4, set()),
+    ("Graz, erster Teil des MultiPolygons", 47.07, 15.44, {"warnid:22103"}),
+    ("Murtal, zweiter Teil des MultiPolygons", 47.05, 14.3, {"warnid:22103"}),
+    ("zwischen den Teilen", 47.05, 15.0, set()),
+    ("Salzburg, Außenring", 47.72, 13.05, {"warnid:22104"}),
+    ("Salzburg, im Loch", 47.8, 13.15, set()),
+    ("Innsbruck, GeometryCollection", 47.26, 11.39, {"warnid:22105"}),
+    ("Vorarlberg, keine Region", 47.3, 9.8, set()),
+    # Kanten: Even-odd-Regel zählt linke/untere Kanten zur Region,
+    # rechte/obere nicht
+    ("Wien, untere Kante", 48.1, 16.4, {"warnid:22101"}),
+    ("Wien, linke Kante", 48.2, 16.2, {"warnid:22101"}),
+    ("Wien, rechte Kante", 48.15, 16.6, set()),
+    ("Loch, linke Kante (gehört zum Loch)", 47.8, 13.1, set()),
+    (
+        "Gitterlinie 16,3 im Innenbereich",
+        48.2,
+        16.3,
+        {"warnid:22101", "warnid:22102"},
+    ),
+]
+
+
+def _check(index: RegionIndex) -> int:
+    """Bekannte Punkte prüfen; liefert die Anzahl der Abweichungen."""
+    results = index.resolve([(lat, lon) for _, lat, lon, _ in CASES])
+    failures = 0
+    for (name, lat, lon, expected), warnings in zip(CASES, results):
+        found = {w.key for w in warnings}
+        ok = found == expected
+        failures += not ok
+        print(
+            f"{'ok  ' if ok else 'FEHL'} {name:<40} {lat:>8.4f} {lon:>8.4f} "
+            f"{','.join(sorted(found)) or '-'}"
+            + ("" if ok else f" (erwartet {','.join(sorted(expected)) or '-'})")
+        )
+    return failures
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]
+    body = FIXTURE.read_bytes()
+
+    started = time.perf_counter()
+    index = RegionIndex.from_body(body)
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"{len(index)} Regionen, Index in {build_ms:.2f} ms\n")
+
+    failures = _check(index)
+
+    rnd = random.Random(1)
+    print(f"\n{'Punkte':>8} {'resolve ms':>11} {'µs/Punkt':>9}")
+    for size in sizes:
+        coords = [
+            (rnd.uniform(46.4, 49.0), rnd.uniform(9.5, 17.2)) for _ in range(size)
+        ]
+        started = time.perf_counter()
+        index.resolve(coords)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"{size:>8} {elapsed:>11.2f} {elapsed * 1000 / size:>9.2f}")
+
+    if failures:
+        print(f"\n{failures} Punkt(e) falsch zugeordnet")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
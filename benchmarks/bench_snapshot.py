@@ -0,0 +1,149 @@
+"""CPU pro Coordinator-Tick: Scans je Entität vs. gemeinsamer Snapshot.
+
+Aufruf aus dem Repo-Root (Home Assistant muss installiert sein, eine
+laufende Instanz wird nicht benötigt)::
+
+    python -m benchmarks.bench_snapshot [anzahl_warnungen ...]
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import make_coordinator
+from .payloads import make_records, make_warnings
+from .run import make_entities
+
+ROUNDS = 50
+
+
+# --- Auswertung wie vor dem Snapshot (jede Entität scannt selbst) ---------
+
+
+def _legacy_split(data, now_ts):
+    active, future = [], []
+    for w in data.get("properties", {}).get("warnings", []) or []:
+        raw = w.get("properties", {}).get("rawinfo", {})
+        start = int(raw.get("start", 0))
+        end = int(raw.get("end", 0))
+        if start <= now_ts <= end:
+            active.append(w)
+        elif start > now_ts:
+            future.append(w)
+    return active, future
+
+
+def _legacy_filter(warnings, wtype):
+    res = []
+    for w in warnings:
+        raw = w.get("properties", {}).get("rawinfo", {})
+        try:
+            wt = int(raw.get("wtype", 0))
+        except (TypeError, ValueError):
+            wt = 0
+        if wt == wtype:
+            res.append(w)
+    return res
+
+
+def _legacy_highest(warnings):
+    level = 0
+    for w in warnings:
+        raw = w.get("properties", {}).get("rawinfo", {})
+        try:
+            lv = int(raw.get("wlevel", 0))
+        except (TypeError, ValueError):
+            lv = 0
+        level = max(level, lv)
+    return level
+
+
+def _legacy_group(warnings):
+    result = {}
+    for w in warnings:
+        props = w.get("properties", {})
+        raw = props.get("rawinfo", {})
+        try:
+            wtype = int(raw.get("wtype", 0))
+            level = int(raw.get("wlevel", 0))
+        except (TypeError, ValueError):
+            continue
+        if wtype == 0:
+            continue
+        entry = result.get(wtype)
+        if entry is None or level > entry["level"]:
+            result[wtype] = {"level": level, "text": props.get("text", "")}
+    return result
+
+
+def legacy_tick(data, now_ts) -> None:
+    """Scans wie sie pro Tick von den 17 Entitäten ausgelöst wurden."""
+    for _summary in range(2):
+        # is_on über state, icon und extra_state_attributes
+        for _ in range(3):
+            _legacy_split(data, now_ts)
+        active, future = _legacy_split(data, now_ts)
+        _legacy_group(active)
+        _legacy_group(future)
+    for wtype in range(1, 8):
+        # WarningTypeBinarySensor
+        for _ in range(3):
+            active, _ = _legacy_split(data, now_ts)
+            _legacy_filter(active, wtype)
+        active, future = _legacy_split(data, now_ts)
+        _legacy_highest(_legacy_filter(active, wtype) + _legacy_filter(future, wtype))
+        # WarningLevelSensor
+        for _ in range(2):
+            active, _ = _legacy_split(data, now_ts)
+            _legacy_highest(_legacy_filter(active, wtype))
+
+
+# --- Auswertung über den Snapshot -----------------------------------------
+
+
+def snapshot_tick(coordinator, entities, data) -> None:
+    # Neue Daten pro Tick erzwingen einen neuen Snapshot
+    coordinator.data = dict(data)
+    for entity in entities:
+        entity.state
+        entity.icon
+        entity.extra_state_attributes
+
+
+def _time(func, *args) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(*args)
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+async def _main(sizes: list[int]) -> None:
+    now_ts = int(dt_util.utcnow().timestamp())
+    print(f"{'warnings':>9} {'legacy ms':>10} {'snapshot ms':>12} {'factor':>7}")
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for size in sizes:
+            data = {"properties": {"warnings": make_warnings(size, now_ts)}}
+            records = {"properties": {"warnings": make_records(size, now_ts)}}
+            coordinator = make_coordinator(hass)
+            entities = [
+                entity
+                for items in make_entities(coordinator, "bench").values()
+                for entity in items
+            ]
+            legacy_ms = _time(legacy_tick, data, now_ts)
+            snapshot_ms = _time(snapshot_tick, coordinator, entities, records)
+            print(
+                f"{size:>9} {legacy_ms:>10.3f} {snapshot_ms:>12.3f} "
+                f"{legacy_ms / snapshot_ms:>6.1f}x"
+            )
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main([int(arg) for arg in sys.argv[1:]] or [10, 100, 300, 1000]))
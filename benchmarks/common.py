@@ -0,0 +1,63 @@
+"""Gemeinsame Helfer der Benchmarks: Koordinator anlegen und Zeit messen."""
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Any, Callable
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+
+from custom_components.geosphere_wetterwarnung.const import DOMAIN
+from custom_components.geosphere_wetterwarnung.coordinator import (
+    geosphereCoordinator,
+)
+
+GRACE_SECONDS = 600
+
+
+def make_coordinator(
+    hass: HomeAssistant,
+    data: dict[str, Any] | None = None,
+    options: dict[str, Any] | None = None,
+    title: str = "bench",
+) -> geosphereCoordinator:
+    """Koordinator mit eigenem Config-Entry, ohne laufende Instanz.
+
+    Ohne ``options`` gilt eine Halte-Frist von ``GRACE_SECONDS``.
+    """
+    entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=title,
+        data=dict(data or {}),
+        source=config_entries.SOURCE_USER,
+        options={"grace_period": GRACE_SECONDS} if options is None else options,
+    )
+    config_entries.current_entry.set(entry)
+    return geosphereCoordinator(hass, entry)
+
+
+def median_ms(
+    func: Callable[[], Any], rounds: int | None = None, budget: float = 0.3
+) -> float:
+    """Median in ms je Aufruf.
+
+    Mit ``rounds`` genau so viele Wiederholungen, sonst so viele, wie ins
+    Zeitbudget (Sekunden) passen, mindestens 5 und höchstens 1000.
+    """
+    samples: list[float] = []
+    deadline = time.perf_counter() + budget
+    while True:
+        if rounds is not None:
+            if len(samples) >= rounds:
+                break
+        elif len(samples) >= 5 and (
+            time.perf_counter() >= deadline or len(samples) >= 1000
+        ):
+            break
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
@@ -0,0 +1,230 @@
+"""Lokaler Ersatz für ``/wsapp/api/getWarningsForCoords`` für Lasttests.
+
+Liefert deterministische Warnungen je Koordinate (benachbarte Koordinaten
+teilen sich regionale Warnungen); ``getWarnstatus`` liefert die Regionen aus
+``fixtures/getWarnstatus.json`` mit auf jetzt verschobenen Zeiten. Kann Latenz, Timeouts, 5xx-Antworten
+und kaputtes JSON einstreuen. Antwortet gzip-komprimiert, wenn der Client es
+anbietet, und zählt übertragene Bytes und TCP-Verbindungen.
+
+    python -m benchmarks.fake_api --port 8765 --latency-ms 80 --error-rate 0.02
+
+Die Integration zeigt darauf über die Entry-Daten
+``api_base_url = "http://127.0.0.1:8765/wsapp/api"``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import random
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aiohttp import web
+
+BASE_PATH = "/wsapp/api"
+WARNSTATUS_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "getWarnstatus.json"
+
+
+@dataclass
+class FakeApiConfig:
+    warnings_per_coord: int = 3
+    # Gittergröße in Grad, innerhalb derer Koordinaten dieselben Warnungen sehen
+    region_size: float = 0.5
+    # Lognormal verteilte Latenz: Median in ms und Streuung (sigma)
+    latency_ms: float = 50.0
+    latency_sigma: float = 0.5
+    timeout_rate: float = 0.0
+    timeout_seconds: float = 15.0
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    seed: int = 1
+    stats: dict[str, int] = field(
+        default_factory=lambda: {
+            "requests": 0,
+            "ok": 0,
+            "timeouts": 0,
+            "errors": 0,
+            "malformed": 0,
+            "bytes_sent": 0,
+            "connections": 0,
+        }
+    )
+
+
+def _region_warnings(config: FakeApiConfig, lat: float, lon: float) -> list[dict]:
+    cell = (int(lat // config.region_size), int(lon // config.region_size))
+    rnd = random.Random(hash((config.seed, cell)))
+    now_ts = int(time.time())
+    warnings = []
+    for idx in range(config.warnings_per_coord):
+        start = now_ts + rnd.randint(-6 * 3600, 24 * 3600)
+        warnings.append(
+            {
+                "type": "Feature",
+                "properties": {
+                    "text": f"Testwarnung {cell[0]}/{cell[1]}/{idx}",
+                    "rawinfo": {
+                        "warnid": f"{cell[0]}-{cell[1]}-{idx}",
+                        "wtype": rnd.randint(1, 7),
+                        "wlevel": rnd.randint(1, 3),
+                        "start": str(start),
+                        "end": str(start + rnd.randint(3600, 2 * 86400)),
+                    },
+                },
+            }
+        )
+    return warnings
+
+
+def _warnstatus() -> dict:
+    """Regionen der Fixture; die früheste Warnung begann vor einer Stunde."""
+    collection = json.loads(WARNSTATUS_FIXTURE.read_text(encoding="utf-8"))
+    raws = [feature["properties"]["rawinfo"] for feature in collection["features"]]
+    shift = int(time.time()) - 3600 - min(int(raw["start"]) for raw in raws)
+    for raw in raws:
+        raw["start"] = str(int(raw["start"]) + shift)
+        raw["end"] = str(int(raw["end"]) + shift)
+    return collection
+
+
+def make_app(config: FakeApiConfig) -> web.Application:
+    rnd = random.Random(config.seed)
+    transports: weakref.WeakSet = weakref.WeakSet()
+
+    def _json_response(request: web.Request, text: str) -> web.Response:
+        body = text.encode()
+        headers = {}
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+        config.stats["bytes_sent"] += len(body)
+        return web.Response(
+            status=200, body=body, headers=headers, content_type="application/json"
+        )
+
+    async def _simulate(request: web.Request) -> web.Response | None:
+        """Latenz und Fehler einstreuen; ``None`` = regulär antworten."""
+        config.stats["requests"] += 1
+        if request.transport is not None and request.transport not in transports:
+            transports.add(request.transport)
+            config.stats["connections"] += 1
+        delay = rnd.lognormvariate(0, config.latency_sigma) * config.latency_ms / 1000
+        roll = rnd.random()
+
+        if roll < config.timeout_rate:
+            config.stats["timeouts"] += 1
+            await asyncio.sleep(config.timeout_seconds)
+        else:
+            await asyncio.sleep(delay)
+        roll -= config.timeout_rate
+
+        if roll < 0:
+            return web.Response(status=504, text="timeout")
+        if roll < config.error_rate:
+            config.stats["errors"] += 1
+            return web.Response(status=503, text="Service Unavailable")
+        roll -= config.error_rate
+        if roll < config.malformed_rate:
+            config.stats["malformed"] += 1
+            return web.Response(
+                status=200,
+                text='{"properties": {"warnings": [',
+                content_type="application/json",
+            )
+        return None
+
+    async def warnings_for_coords(request: web.Request) -> web.StreamResponse:
+        if (response := await _simulate(request)) is not None:
+            return response
+        try:
+            lat = float(request.query["lat"])
+            lon = float(request.query["lon"])
+        except (KeyError, ValueError):
+            return web.Response(status=400, text="lat/lon required")
+
+        config.stats["ok"] += 1
+        body = {
+            "type": "FeatureCollection",
+            "properties": {"warnings": _region_warnings(config, lat, lon)},
+        }
+        return _json_response(request, json.dumps(body))
+
+    async def warnstatus(request: web.Request) -> web.StreamResponse:
+        if (response := await _simulate(request)) is not None:
+            return response
+        config.stats["ok"] += 1
+        return _json_response(request, json.dumps(_warnstatus()))
+
+    app = web.Application()
+    app.router.add_get(f"{BASE_PATH}/getWarningsForCoords", warnings_for_coords)
+    app.router.add_get(f"{BASE_PATH}/getWarnstatus", warnstatus)
+    return app
+
+
+async def start_server(
+    config: FakeApiConfig, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, str]:
+    """Server starten; gibt Runner und Basis-URL für ``api_base_url`` zurück."""
+    runner = web.AppRunner(make_app(config))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    sockets = site._server.sockets  # noqa: SLF001
+    bound_port = sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}{BASE_PATH}"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = FakeApiConfig()
+    parser.add_argument("--warnings", type=int, default=defaults.warnings_per_coord)
+    parser.add_argument("--region-size", type=float, default=defaults.region_size)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--latency-sigma", type=float, default=defaults.latency_sigma)
+    parser.add_argument("--timeout-rate", type=float, default=defaults.timeout_rate)
+    parser.add_argument("--timeout-seconds", type=float, default=defaults.timeout_seconds)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--malformed-rate", type=float, default=defaults.malformed_rate)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def config_from_args(args: argparse.Namespace) -> FakeApiConfig:
+    return FakeApiConfig(
+        warnings_per_coord=args.warnings,
+        region_size=args.region_size,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        timeout_rate=args.timeout_rate,
+        timeout_seconds=args.timeout_seconds,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    )
+
+
+async def _serve(config: FakeApiConfig, host: str, port: int) -> None:
+    runner, base_url = await start_server(config, host, port)
+    print(f"api_base_url: {base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Lokaler GeoSphere-API-Ersatz")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_arguments(parser)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(config_from_args(args), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
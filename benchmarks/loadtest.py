@@ -0,0 +1,215 @@
+"""Lasttest des Koordinators gegen den lokalen API-Ersatz (``fake_api``).
+
+Startet den Ersatz-Server im selben Prozess, legt einen nicht gestarteten
+Home-Assistant-Kern mit ``zone.home`` an und fährt mehrere Aktualisierungs-
+Zyklen über viele Koordinaten. Berichtet Zykluslatenz, Fehlerbehandlung
+(HTTP-Fehler, Breaker-Zustände) und Speicherbedarf. Mit ``--entries`` laufen
+mehrere Einträge gleichzeitig, deren Koordinaten sich jeweils zur Hälfte
+überschneiden (gemeinsame Abfrage-Schicht).
+
+    python -m benchmarks.loadtest --coords 300 --cycles 10
+    python -m benchmarks.loadtest --coords 100 --entries 4
+    python -m benchmarks.loadtest --coords 500 --error-rate 0.05 --timeout-rate 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import resource
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.geosphere_wetterwarnung.const import (
+    CONF_API_BASE_URL,
+    CONF_EXTRA_COORDS,
+    CONF_SCAN_INTERVAL,
+    CONF_MAX_PARALLEL_REQUESTS,
+    CONF_UPDATE_DEADLINE,
+    DEFAULT_MAX_PARALLEL_REQUESTS,
+    DEFAULT_UPDATE_DEADLINE,
+)
+from custom_components.geosphere_wetterwarnung.coordinator import (
+    geosphereCoordinator,
+)
+from custom_components.geosphere_wetterwarnung.fetcher import (
+    SharedFetcher,
+    async_get_fetcher,
+)
+
+from .common import make_coordinator
+from .fake_api import FakeApiConfig, add_arguments, config_from_args, start_server
+
+HOME = (48.2082, 16.3738)
+SCAN_INTERVAL = 60
+
+
+def make_coords(count: int, offset: int = 0) -> str:
+    """Koordinaten über Österreich verteilt, als ``extra_coords``-Text."""
+    coords = []
+    for idx in range(offset, offset + count):
+        lat = 46.5 + (idx * 0.037) % 2.5
+        lon = 9.6 + (idx * 0.113) % 7.4
+        coords.append(f"{lat:.4f},{lon:.4f}")
+    return ";".join(coords)
+
+
+def _expire(fetcher: SharedFetcher) -> None:
+    """Geteilte Ergebnisse als veraltet markieren; ETag/Body-Hash bleiben."""
+    for cached in fetcher._cache.values():  # noqa: SLF001
+        cached["fetched_at"] = float("-inf")
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def run_loadtest(
+    api_config: FakeApiConfig,
+    coords: int,
+    cycles: int,
+    parallel: int,
+    deadline: int,
+    entries: int = 1,
+) -> dict[str, Any]:
+    runner, base_url = await start_server(api_config)
+    tracemalloc.start()
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            hass.states.async_set(
+                "zone.home", "0", {"latitude": HOME[0], "longitude": HOME[1]}
+            )
+            coordinators: list[geosphereCoordinator] = []
+            for idx in range(entries):
+                coordinators.append(
+                    make_coordinator(
+                        hass,
+                        {
+                            CONF_API_BASE_URL: base_url,
+                            CONF_EXTRA_COORDS: make_coords(
+                                coords - 1, idx * coords // 2
+                            ),
+                            CONF_MAX_PARALLEL_REQUESTS: parallel,
+                            CONF_UPDATE_DEADLINE: deadline,
+                            CONF_SCAN_INTERVAL: SCAN_INTERVAL,
+                        },
+                        options={},
+                        title=f"loadtest {idx}",
+                    )
+                )
+
+            durations: list[float] = []
+            failed_cycles = 0
+            http_status: collections.Counter = collections.Counter()
+            fetcher = async_get_fetcher(hass)
+            for _ in range(cycles):
+                # Zyklen folgen direkt aufeinander; so tun, als wäre ein
+                # Scan-Intervall vergangen (geteilte Ergebnisse veraltet)
+                _expire(fetcher)
+                started = time.perf_counter()
+                await asyncio.gather(
+                    *(coordinator.async_refresh() for coordinator in coordinators)
+                )
+                durations.append(time.perf_counter() - started)
+                for coordinator in coordinators:
+                    if not coordinator.last_update_success:
+                        failed_cycles += 1
+                    http_status[str(coordinator.last_http_status)] += 1
+
+            healths = [
+                health
+                for coordinator in coordinators
+                for health in coordinator.coordinate_health.values()
+            ]
+            breaker_states = collections.Counter(health.state for health in healths)
+            last_errors = collections.Counter(
+                health.last_error for health in healths if health.last_error
+            )
+            warnings = sum(
+                len((coordinator.data or {}).get("properties", {}).get("warnings", []))
+                for coordinator in coordinators
+            )
+            fetcher_stats = fetcher.as_dict()
+            for coordinator in coordinators:
+                await coordinator.async_shutdown()
+            await hass.async_stop(force=True)
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await runner.cleanup()
+
+    return {
+        "entries": entries,
+        "coords": coords,
+        "cycles": cycles,
+        "cycle_p50": statistics.median(durations),
+        "cycle_p95": _percentile(durations, 95),
+        "cycle_max": max(durations),
+        "failed_cycles": failed_cycles,
+        "http_status": dict(http_status),
+        "breaker_states": dict(breaker_states),
+        "last_errors": dict(last_errors.most_common(5)),
+        "warnings": warnings,
+        "server": dict(api_config.stats),
+        "shared_fetcher": fetcher_stats,
+        "tracemalloc_peak_mb": peak / 1024 / 1024,
+        # Linux liefert KiB
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _print(result: dict[str, Any]) -> None:
+    print(
+        f"{result['entries']} Einträge x {result['coords']} Koordinaten, "
+        f"{result['cycles']} Zyklen"
+    )
+    print(
+        "  Zyklus      p50 {cycle_p50:.3f} s  p95 {cycle_p95:.3f} s  "
+        "max {cycle_max:.3f} s".format(**result)
+    )
+    print(f"  Fehlzyklen  {result['failed_cycles']}")
+    print(f"  HTTP-Status {result['http_status']}")
+    print(f"  Breaker     {result['breaker_states']}")
+    for error, count in result["last_errors"].items():
+        print(f"    {count:>5} x {error}")
+    print(f"  Warnungen   {result['warnings']}")
+    print(f"  Server      {result['server']}")
+    print(f"  Geteilt     {result['shared_fetcher']}")
+    print(
+        "  Speicher    tracemalloc-Peak {tracemalloc_peak_mb:.1f} MiB, "
+        "max RSS {max_rss_mb:.1f} MiB".format(**result)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--coords", type=int, default=300)
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--entries", type=int, default=1)
+    parser.add_argument("--parallel", type=int, default=DEFAULT_MAX_PARALLEL_REQUESTS)
+    parser.add_argument("--deadline", type=int, default=DEFAULT_UPDATE_DEADLINE)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    result = asyncio.run(
+        run_loadtest(
+            config_from_args(args),
+            coords=args.coords,
+            cycles=args.cycles,
+            parallel=args.parallel,
+            deadline=args.deadline,
+            entries=args.entries,
+        )
+    )
+    _print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Synthetische ``getWarningsForCoords``-Antworten für Benchmarks."""
+from __future__ import annotations
+
+import json
+import random
+from typing import Any
+
+from custom_components.geosphere_wetterwarnung.model import WarningRecord
+
+SIZES = (0, 10, 100, 1_000, 10_000)
+
+
+def make_warning(idx: int, now_ts: int, rnd: random.Random) -> dict[str, Any]:
+    start = now_ts + rnd.randint(-86400, 86400)
+    return {
+        "type": "Feature",
+        "properties": {
+            "text": f"Warnung {idx}: Sturmböen bis 90 km/h",
+            "rawinfo": {
+                "warnid": str(100000 + idx),
+                "wtype": rnd.randint(1, 7),
+                "wlevel": rnd.randint(1, 3),
+                "start": str(start),
+                "end": str(start + rnd.randint(3600, 3 * 86400)),
+            },
+        },
+    }
+
+
+def make_warnings(count: int, now_ts: int, seed: int = 1) -> list[dict[str, Any]]:
+    rnd = random.Random(seed)
+    return [make_warning(idx, now_ts, rnd) for idx in range(count)]
+
+
+# Textfelder, wie sie die API zusätzlich zu ``rawinfo`` liefert
+_API_TEXTS = {
+    "auswirkungen": "Umstürzende Bäume, herabfallende Äste. " * 4,
+    "empfehlungen": "Aufenthalt im Freien vermeiden, Fenster schließen. " * 4,
+    "meteotext": "Ein Tiefdruckgebiet zieht über den Alpenraum. " * 6,
+}
+
+
+def make_api_body(count: int, now_ts: int, seed: int = 1) -> bytes:
+    """Antwort-Body von ``getWarningsForCoords`` mit allen Feldern der API."""
+    rnd = random.Random(seed)
+    warnings: list[dict[str, Any]] = []
+    for idx in range(count):
+        warning = make_warning(idx, now_ts, rnd)
+        raw = warning["properties"]["rawinfo"]
+        warning["properties"].update(
+            {
+                "warnid": int(raw["warnid"]),
+                "chgid": f"{idx}-1",
+                "verid": f"{idx}-1-1",
+                "begin": raw["start"],
+                "end": raw["end"],
+                "create": raw["start"],
+                **_API_TEXTS,
+            }
+        )
+        warnings.append(warning)
+    body = {"type": "FeatureCollection", "properties": {"warnings": warnings}}
+    return json.dumps(body).encode()
+
+
+def make_records(count: int, now_ts: int, seed: int = 1) -> list[WarningRecord]:
+    """Wie ``make_warnings``, aber bereits dekodiert (wie im Coordinator)."""
+    return [WarningRecord.from_feature(w) for w in make_warnings(count, now_ts, seed)]
+
+
+def make_coordinate_responses(
+    count: int, coordinates: int, now_ts: int, overlap: float = 0.5, seed: int = 1
+) -> list[dict[str, Any]]:
+    """``count`` Warnungen auf ``coordinates`` Antworten verteilen.
+
+    Ein Anteil ``overlap`` jeder Antwort sind regionale Warnungen, die auch
+    benachbarte Koordinaten melden (wie bei der echten API).
+    """
+    rnd = random.Random(seed)
+    warnings = make_warnings(count, now_ts, seed)
+    responses: list[dict[str, Any]] = []
+    per_coord = max(1, count // max(1, coordinates)) if count else 0
+    for idx in range(coordinates):
+        own = warnings[idx * per_coord : (idx + 1) * per_coord]
+        shared = [
+            rnd.choice(warnings) for _ in range(int(len(own) * overlap))
+        ] if warnings else []
+        responses.append(
+            {"type": "FeatureCollection", "properties": {"warnings": own + shared}}
+        )
+    return responses
@@ -0,0 +1,197 @@
+"""Micro-Benchmarks der Hot-Paths der Warnungsauswertung.
+
+Läuft offline: Home Assistant muss installiert sein, es wird aber nur ein
+nicht gestarteter ``HomeAssistant``-Kern angelegt, keine API aufgerufen.
+
+    python -m benchmarks.run                      # alle Größen, JSON nach benchmarks/results/
+    python -m benchmarks.run --sizes 0 10 100     # nur bestimmte Größen
+    python -m benchmarks.run --compare benchmarks/results/0.1.2.json
+
+Ergebnisse sind Mediane in Millisekunden je Aufruf und werden als JSON mit
+Integrations-Version abgelegt, damit Versionen verglichen werden können.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import tempfile
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.geosphere_wetterwarnung.binary_sensor import (
+    ApiStatusBinarySensor,
+    CurrentSummaryBinarySensor,
+    UpcomingSummaryBinarySensor,
+    WarningTypeBinarySensor,
+)
+from custom_components.geosphere_wetterwarnung.const import DOMAIN
+from custom_components.geosphere_wetterwarnung.coordinator import (
+    geosphereCoordinator,
+)
+from custom_components.geosphere_wetterwarnung.model import WarningRecord
+from custom_components.geosphere_wetterwarnung.sensor import WarningLevelSensor
+from custom_components.geosphere_wetterwarnung.snapshot import (
+    WarningBucket,
+    WarningSnapshot,
+    _build_summary_lines,
+)
+
+from .common import GRACE_SECONDS, make_coordinator, median_ms
+from .payloads import SIZES, make_coordinate_responses
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+COORDINATES = 50
+
+
+def make_entities(coordinator: geosphereCoordinator, entry_id: str) -> dict[str, list]:
+    return {
+        "UpcomingSummaryBinarySensor": [
+            UpcomingSummaryBinarySensor(coordinator=coordinator, entry_id=entry_id)
+        ],
+        "CurrentSummaryBinarySensor": [
+            CurrentSummaryBinarySensor(coordinator=coordinator, entry_id=entry_id)
+        ],
+        "ApiStatusBinarySensor": [
+            ApiStatusBinarySensor(coordinator=coordinator, entry_id=entry_id)
+        ],
+        "WarningTypeBinarySensor": [
+            WarningTypeBinarySensor(coordinator=coordinator, entry_id=entry_id, wtype=w)
+            for w in range(1, 8)
+        ],
+        "WarningLevelSensor": [
+            WarningLevelSensor(coordinator=coordinator, entry_id=entry_id, wtype=w)
+            for w in range(1, 8)
+        ],
+    }
+
+
+def bench_size(hass: HomeAssistant, size: int) -> dict[str, float]:
+    now_ts = int(dt_util.utcnow().timestamp())
+    responses = make_coordinate_responses(size, COORDINATES, now_ts)
+    features = [w for resp in responses for w in resp["properties"]["warnings"]]
+    coords = [(47.0 + i / 100, 15.0 + i / 100) for i in range(COORDINATES)]
+    results: dict[str, float] = {}
+
+    # Einmal je Antwort beim Dekodieren
+    results["parse_warnings"] = median_ms(
+        lambda: [WarningRecord.from_feature(w) for w in features]
+    )
+    combined = [WarningRecord.from_feature(w) for w in features]
+
+    def grace_merge() -> None:
+        coordinator = make_coordinator(hass)
+        # Erst befüllen, dann die Hälfte verschwinden lassen (Halte-Frist greift)
+        coordinator._merge_with_grace(combined, coords, now_ts, GRACE_SECONDS, False)
+        coordinator._merge_with_grace(
+            combined[: len(combined) // 2], coords, now_ts + 60, GRACE_SECONDS, False
+        )
+
+    results["grace_merge"] = median_ms(grace_merge)
+
+    # Eingeschwungener Zustand: die Hälfte wird gehalten, Antworten unverändert
+    steady = make_coordinator(hass)
+    steady._merge_with_grace(combined, coords, now_ts, GRACE_SECONDS, False)
+    steady._merge_with_grace(
+        combined[: len(combined) // 2], coords, now_ts + 60, GRACE_SECONDS, False
+    )
+    results["grace_merge_steady"] = median_ms(
+        lambda: steady._merge_with_grace([], coords, now_ts + 120, GRACE_SECONDS, True)
+    )
+
+    data = {"properties": {"warnings": combined}}
+    results["split_warnings_by_time"] = median_ms(lambda: WarningSnapshot(data, now_ts))
+
+    snapshot = WarningSnapshot(data, now_ts)
+    active = list(snapshot.active.warnings)
+    results["group_by_type_with_max_level"] = median_ms(lambda: WarningBucket(active))
+    grouped = snapshot.active.grouped
+    results["build_summary_lines"] = median_ms(lambda: _build_summary_lines(grouped))
+
+    coordinator = make_coordinator(hass)
+    coordinator.data = data
+    entities = make_entities(coordinator, "bench")
+    for name, items in entities.items():
+
+        def attributes(items=items) -> None:
+            # Snapshot ist gebaut: misst nur den Anteil der Entität
+            for entity in items:
+                entity.extra_state_attributes
+
+        results[f"extra_state_attributes.{name}"] = median_ms(attributes)
+
+    def full_tick() -> None:
+        # Neue Daten je Aufruf: Snapshot wird wie pro Tick neu gebaut
+        coordinator.data = dict(data)
+        for items in entities.values():
+            for entity in items:
+                entity.state
+                entity.icon
+                entity.extra_state_attributes
+
+    results["entity_tick"] = median_ms(full_tick)
+    return results
+
+
+async def _run(sizes: list[int]) -> dict[str, dict[str, float]]:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        results = {str(size): bench_size(hass, size) for size in sizes}
+        await hass.async_stop(force=True)
+    return results
+
+
+def _version() -> str:
+    manifest = ROOT / "custom_components" / DOMAIN / "manifest.json"
+    return json.loads(manifest.read_text())["version"]
+
+
+def _print(results: dict[str, dict[str, float]], baseline: dict | None) -> None:
+    for size, benches in results.items():
+        print(f"\n{size} warnings")
+        for name, value in benches.items():
+            line = f"  {name:<52} {value:>10.3f} ms"
+            old = (baseline or {}).get(size, {}).get(name)
+            if old:
+                line += f"  ({value / old:>5.2f}x vs. baseline)"
+            print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(SIZES))
+    parser.add_argument("--output", type=Path, help="JSON-Ergebnisdatei")
+    parser.add_argument("--compare", type=Path, help="Ergebnisdatei als Baseline")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args.sizes))
+    baseline = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+    _print(results, baseline)
+
+    output = args.output or RESULTS_DIR / f"{_version()}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "version": _version(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "created": dt_util.utcnow().isoformat(),
+                "coordinates": COORDINATES,
+                "unit": "ms (median)",
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    print(f"\nErgebnisse: {output}")
+
+
+if __name__ == "__main__":
+    main()
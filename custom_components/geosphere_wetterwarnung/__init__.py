@@ -1,25 +1,83 @@
 from __future__ import annotations
 
+import time
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
-from .coordinator import geosphereCoordinator
+from .const import (
+    DOMAIN,
+    DATA_FETCHER,
+    SERVICE_GET_DETAILS,
+    SERVICE_GET_WARNINGS,
+    SERVICE_PROFILE,
+)
+from .coordinator import geosphereCoordinator, async_remove_stored_state
+from .profiling import PROFILE_SCHEMA, async_handle_profile
+from .services import (
+    DETAILS_SCHEMA,
+    WARNINGS_SCHEMA,
+    async_handle_details,
+    async_handle_warnings,
+)
 
 PLATFORMS: list[str] = ["sensor", "binary_sensor"]
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """YAML setup (not used)."""
+    """YAML setup (not used); registriert die Dienste."""
+
+    async def _async_profile(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_profile(hass, call)
+
+    async def _async_details(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_details(hass, call)
+
+    async def _async_warnings(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_warnings(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DETAILS,
+        _async_details,
+        schema=DETAILS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_WARNINGS,
+        _async_warnings,
+        schema=WARNINGS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up GeoSphere Wetterwarnung from a config entry."""
+    started = time.monotonic()
     coordinator = geosphereCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    if await coordinator.async_restore():
+        # Entitäten starten sofort mit dem gespeicherten Stand,
+        # der erste echte Abruf läuft im Hintergrund.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
@@ -28,6 +86,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Geänderte Optionen (z.B. Koordinaten im Modus "je Ort") ändern die
+    # Entitäten: Eintrag neu laden
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(coordinator.tracker.async_start())
+    coordinator.setup_duration = round(time.monotonic() - started, 3)
 
     return True
 
@@ -39,12 +102,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id, None)
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN, None)
+            # Letzter Eintrag: gemeinsame Abfrage-Schicht samt Session schließen
+            fetcher = hass.data.pop(DATA_FETCHER, None)
+            if fetcher is not None:
+                await fetcher.async_close()
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Gespeicherten Stand beim Entfernen löschen."""
+    await async_remove_stored_state(hass, entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload when options change."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
 
 
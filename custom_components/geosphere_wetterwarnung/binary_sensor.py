@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
@@ -9,9 +9,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -25,8 +23,17 @@ from .const import (
     ATTR_HTTP_CODE,
     ATTR_HTTP_RESPONSE,
     ATTR_LAST_REQUEST,
+    ATTR_COORDINATE_HEALTH,
+    ATTR_CYCLE_DURATION,
+    ATTR_CHANGE_DETECTION,
+    ATTR_COORDINATE_CACHE,
+    ATTR_STATE_WRITES,
+    ATTR_UPDATE_INTERVAL,
+    ATTR_RESTORED_FROM,
+    ATTR_SETUP_DURATION,
 )
-from .coordinator import geosphereCoordinator
+from .coordinator import REGIONS_HEALTH_LABEL, geosphereCoordinator
+from .entity import GeosphereEntity
 
 
 
@@ -69,118 +76,37 @@ async def async_setup_entry(
             )
         )
 
-    async_add_entities(entities)
-
-
-def _get_warnings(data: dict[str, Any]) -> list[dict[str, Any]]:
-    return data.get("properties", {}).get("warnings", []) or []
-
-
-def _now_ts() -> int:
-    return int(dt_util.utcnow().timestamp())
-
-
-def _split_warnings_by_time(
-    data: dict[str, Any]
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    warnings = _get_warnings(data)
-    now_ts = _now_ts()
-    active: list[dict[str, Any]] = []
-    future: list[dict[str, Any]] = []
-    for w in warnings:
-        raw = w.get("properties", {}).get("rawinfo", {})
-        start = int(raw.get("start", 0))
-        end = int(raw.get("end", 0))
-        if start <= now_ts <= end:
-            active.append(w)
-        elif start > now_ts:
-            future.append(w)
-    return active, future
-
-
-def _filter_by_type(
-    warnings: list[dict[str, Any]], wtype: int
-) -> list[dict[str, Any]]:
-    res: list[dict[str, Any]] = []
-    for w in warnings:
-        raw = w.get("properties", {}).get("rawinfo", {})
-        try:
-            wt = int(raw.get("wtype", 0))
-        except (TypeError, ValueError):
-            wt = 0
-        if wt == wtype:
-            res.append(w)
-    return res
-
-
-def _first_start(warnings: list[dict[str, Any]]) -> int | None:
-    first: int | None = None
-    for w in warnings:
-        raw = w.get("properties", {}).get("rawinfo", {})
-        try:
-            start = int(raw.get("start", 0))
-        except (TypeError, ValueError):
-            continue
-        if first is None or start < first:
-            first = start
-    return first
-
-
-def _highest_level(warnings: list[dict[str, Any]]) -> int:
-    level = 0
-    for w in warnings:
-        raw = w.get("properties", {}).get("rawinfo", {})
-        try:
-            lv = int(raw.get("wlevel", 0))
-        except (TypeError, ValueError):
-            lv = 0
-        if lv > level:
-            level = lv
-    return level
-
-
-def _group_by_type_with_max_level(
-    warnings: list[dict[str, Any]]
-) -> Dict[int, Dict[str, Any]]:
-    result: Dict[int, Dict[str, Any]] = {}
-    for w in warnings:
-        props = w.get("properties", {})
-        raw = props.get("rawinfo", {})
-        try:
-            wtype = int(raw.get("wtype", 0))
-            level = int(raw.get("wlevel", 0))
-        except (TypeError, ValueError):
-            continue
-
-        if wtype == 0:
-            continue
+    # Modus "je Ort": Vorwarnung, Warnung und Typ-Sensoren je Koordinate
+    if coordinator.per_location:
+        for location, location_name in coordinator.configured_locations().items():
+            entities.append(
+                UpcomingSummaryBinarySensor(
+                    coordinator=coordinator,
+                    entry_id=entry.entry_id,
+                    location=location,
+                    location_name=location_name,
+                )
+            )
+            entities.append(
+                CurrentSummaryBinarySensor(
+                    coordinator=coordinator,
+                    entry_id=entry.entry_id,
+                    location=location,
+                    location_name=location_name,
+                )
+            )
+            for wtype in range(1, 8):
+                entities.append(
+                    WarningTypeBinarySensor(
+                        coordinator=coordinator,
+                        entry_id=entry.entry_id,
+                        wtype=wtype,
+                        location=location,
+                        location_name=location_name,
+                    )
+                )
 
-        entry = result.get(wtype)
-        if entry is None or level > entry["level"]:
-            result[wtype] = {
-                "level": level,
-                "text": props.get("text", ""),
-                "start": int(raw.get("start", 0)),
-                "end": int(raw.get("end", 0)),
-            }
-    return result
-
-
-def _build_summary_lines(grouped: Dict[int, Dict[str, Any]]) -> List[str]:
-    items = [
-        (wtype, data["level"], data.get("text", ""))
-        for wtype, data in grouped.items()
-    ]
-    items.sort(key=lambda x: x[1], reverse=True)
-
-    lines: List[str] = []
-    for wtype, level, text in items:
-        typename = WARNING_TYPES.get(wtype, str(wtype))
-        if text:
-            lines.append(f"Level {level}: {typename} – {text}")
-        else:
-            lines.append(f"Level {level}: {typename}")
-    return lines
+    async_add_entities(entities)
 
 
 def _icon_for_type(wtype: int) -> str:
@@ -201,51 +127,40 @@ def _icon_for_type(wtype: int) -> str:
     return "mdi:alert-circle"
 
 
-class WarningTypeBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class WarningTypeBinarySensor(GeosphereEntity, BinarySensorEntity):
     """Binary sensor Ein/Aus je Warnungstyp."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.SAFETY
 
-    def __init__(self, coordinator: geosphereCoordinator, entry_id: str, wtype: int):
-        super().__init__(coordinator)
-        self._entry_id = entry_id
+    def __init__(
+        self,
+        coordinator: geosphereCoordinator,
+        entry_id: str,
+        wtype: int,
+        location: str | None = None,
+        location_name: str | None = None,
+    ):
+        super().__init__(coordinator, entry_id, location, location_name)
         self._wtype = wtype
 
         typename = WARNING_TYPES.get(wtype, f"Typ {wtype}")
-        self._attr_unique_id = f"{entry_id}_wtype_{wtype}"
+        self._attr_unique_id = f"{self._id_prefix}_wtype_{wtype}"
         self._attr_name = f"{typename} Warnung"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-            name="GeoSphere Wetterwarnungen",
-            manufacturer="ZAMG / Geosphere Austria",
-        )
-
     @property
     def icon(self) -> str:
         return _icon_for_type(self._wtype) if self.is_on else "mdi:check-circle"
 
     @property
     def is_on(self) -> bool:
-        data = self.coordinator.data or {}
-        active, _ = _split_warnings_by_time(data)
-        active_for_type = _filter_by_type(active, self._wtype)
-        return len(active_for_type) > 0
+        return len(self.snapshot.active.for_type(self._wtype)) > 0
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        active, future = _split_warnings_by_time(data)
-
-        relevant: list[dict[str, Any]] = []
-        relevant.extend(_filter_by_type(active, self._wtype))
-        relevant.extend(_filter_by_type(future, self._wtype))
+        snapshot = self.snapshot
 
         attrs: dict[str, Any] = {}
-        first_start = _first_start(relevant)
+        first_start = snapshot.type_first_start.get(self._wtype)
 
         if first_start is not None:
             dt = dt_util.as_local(
@@ -254,51 +169,35 @@ class WarningTypeBinarySensor(CoordinatorEntity, BinarySensorEntity):
             attrs[ATTR_FIRST_START] = dt.isoformat()
 
         # Level-Attribut: höchstes Level aus allen relevanten Warnungen (aktuell + zukünftig)
-        attrs["Level"] = _highest_level(relevant) if relevant else 0
+        attrs["Level"] = snapshot.type_relevant_level.get(self._wtype, 0)
 
         attrs["icon_color"] = "red" if self.is_on else "green"
 
         return attrs
 
 
-class CurrentSummaryBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class CurrentSummaryBinarySensor(GeosphereEntity, BinarySensorEntity):
     """Summen-Warnung aktuell -> Name: Warnung."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.SAFETY
-
-    def __init__(self, coordinator: geosphereCoordinator, entry_id: str):
-        super().__init__(coordinator)
-        self._entry_id = entry_id
-        self._attr_unique_id = f"{entry_id}_warnung_aktuell"
+    # Listen und mehrzeilige Texte nicht bei jedem Schreiben aufzeichnen;
+    # vollständig über den Dienst get_details und die Diagnose
+    _unrecorded_attributes = frozenset({ATTR_WARNUNG_DATEN, ATTR_WARNUNG_TEXT})
+
+    def __init__(
+        self,
+        coordinator: geosphereCoordinator,
+        entry_id: str,
+        location: str | None = None,
+        location_name: str | None = None,
+    ):
+        super().__init__(coordinator, entry_id, location, location_name)
+        self._attr_unique_id = f"{self._id_prefix}_warnung_aktuell"
         self._attr_name = "Warnung"
-        self._last_is_on: bool | None = None
-        self._last_level: int | None = None
-
-    def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        active, _ = _split_warnings_by_time(data)
-        grouped = _group_by_type_with_max_level(active)
-        is_on = len(active) > 0
-        level = max((info["level"] for info in grouped.values()), default=0)
-
-        self._last_is_on = is_on
-        self._last_level = level
-        super()._handle_coordinator_update()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-            name="GeoSphere Wetterwarnungen",
-            manufacturer="ZAMG / Geosphere Austria",
-        )
 
     @property
     def is_on(self) -> bool:
-        data = self.coordinator.data or {}
-        active, _ = _split_warnings_by_time(data)
-        return len(active) > 0
+        return len(self.snapshot.active) > 0
 
     @property
     def icon(self) -> str:
@@ -306,74 +205,39 @@ class CurrentSummaryBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        active, _ = _split_warnings_by_time(data)
-
-        grouped = _group_by_type_with_max_level(active)
-        items = _build_summary_lines(grouped)
-
-        active_list: List[Dict[str, Any]] = []
-        for wtype, info in grouped.items():
-            typename = WARNING_TYPES.get(wtype, str(wtype))
-            start_dt = dt_util.as_local(
-                datetime.fromtimestamp(info["start"], tz=dt_util.UTC)
-            )
-            end_dt = dt_util.as_local(
-                datetime.fromtimestamp(info["end"], tz=dt_util.UTC)
-            )
-            active_list.append(
-                {
-                    "type": typename,
-                    "level": info["level"],
-                    "text": info.get("text", ""),
-                    "start": start_dt.isoformat(),
-                    "end": end_dt.isoformat(),
-                }
-            )
-
-        # Level: höchstes Level aller aktiven Warnungen, oder 0
-        if grouped:
-            max_level = max(info["level"] for info in grouped.values())
-            text = "\n".join(items)
-        else:
-            max_level = 0
-            text = "Keine"
+        active = self.snapshot.active
 
         attrs: dict[str, Any] = {
-            ATTR_WARNUNG_DATEN: active_list,
-            ATTR_WARNUNG_TEXT: text,
-            "Level": max_level,
+            ATTR_WARNUNG_DATEN: [dict(item) for item in active.details],
+            ATTR_WARNUNG_TEXT: active.text,
+            # Level: höchstes Level aller aktiven Warnungen, oder 0
+            "Level": active.level,
             "icon_color": "red" if self.is_on else "green",
         }
 
         return attrs
 
 
-class UpcomingSummaryBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class UpcomingSummaryBinarySensor(GeosphereEntity, BinarySensorEntity):
     """Vorwarnung, sobald eine Warnung bekannt ist (zukünftige Warnungen)."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.SAFETY
-
-    def __init__(self, coordinator: geosphereCoordinator, entry_id: str):
-        super().__init__(coordinator)
-        self._entry_id = entry_id
-        self._attr_unique_id = f"{entry_id}_vorwarnung"
+    _unrecorded_attributes = frozenset({ATTR_VORWARNUNG_DATEN, ATTR_VORWARNUNG_TEXT})
+
+    def __init__(
+        self,
+        coordinator: geosphereCoordinator,
+        entry_id: str,
+        location: str | None = None,
+        location_name: str | None = None,
+    ):
+        super().__init__(coordinator, entry_id, location, location_name)
+        self._attr_unique_id = f"{self._id_prefix}_vorwarnung"
         self._attr_name = "Vorwarnung"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-            name="GeoSphere Wetterwarnungen",
-            manufacturer="ZAMG / Geosphere Austria",
-        )
-
     @property
     def is_on(self) -> bool:
-        data = self.coordinator.data or {}
-        _, future = _split_warnings_by_time(data)
-        return len(future) > 0
+        return len(self.snapshot.future) > 0
 
     @property
     def icon(self) -> str:
@@ -381,66 +245,46 @@ class UpcomingSummaryBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        _, future = _split_warnings_by_time(data)
-
-        grouped = _group_by_type_with_max_level(future)
-        items = _build_summary_lines(grouped)
-
-        future_list: List[Dict[str, Any]] = []
-        for wtype, info in grouped.items():
-            typename = WARNING_TYPES.get(wtype, str(wtype))
-            start_dt = dt_util.as_local(
-                datetime.fromtimestamp(info["start"], tz=dt_util.UTC)
-            )
-            end_dt = dt_util.as_local(
-                datetime.fromtimestamp(info["end"], tz=dt_util.UTC)
-            )
-            future_list.append(
-                {
-                    "type": typename,
-                    "level": info["level"],
-                    "text": info.get("text", ""),
-                    "start": start_dt.isoformat(),
-                    "end": end_dt.isoformat(),
-                }
-            )
-
-        if grouped:
-            max_level = max(info["level"] for info in grouped.values())
-            text = "\n".join(items)
-        else:
-            max_level = 0
-            text = "Keine"
+        future = self.snapshot.future
 
         attrs: dict[str, Any] = {
-            ATTR_VORWARNUNG_DATEN: future_list,
-            ATTR_VORWARNUNG_TEXT: text,
-            "Level": max_level,
+            ATTR_VORWARNUNG_DATEN: [dict(item) for item in future.details],
+            ATTR_VORWARNUNG_TEXT: future.text,
+            "Level": future.level,
             "icon_color": "red" if self.is_on else "green",
         }
 
         return attrs
 
 
-class ApiStatusBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class ApiStatusBinarySensor(GeosphereEntity, BinarySensorEntity):
     """Warnung API – zeigt Fehler beim letzten API-Call."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    # Verfolgte Positionen wären im Recorder sonst ein Bewegungsprofil;
+    # reine Zähler gehören nicht in die Historie
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_COORDINATE_HEALTH,
+            ATTR_HTTP_RESPONSE,
+            ATTR_CHANGE_DETECTION,
+            ATTR_COORDINATE_CACHE,
+            ATTR_STATE_WRITES,
+        }
+    )
 
     def __init__(self, coordinator: geosphereCoordinator, entry_id: str):
-        super().__init__(coordinator)
-        self._entry_id = entry_id
+        super().__init__(coordinator, entry_id)
         self._attr_unique_id = f"{entry_id}_api_status"
         self._attr_name = "Warnung API"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-            name="GeoSphere Wetterwarnungen",
-            manufacturer="ZAMG / Geosphere Austria",
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Status/Zeitpunkt auch bei unveränderten Warnungen aktualisieren
+        self.async_on_remove(
+            self.coordinator.async_add_status_listener(
+                self._handle_coordinator_update
+            )
         )
 
     @property
@@ -464,6 +308,53 @@ class ApiStatusBinarySensor(CoordinatorEntity, BinarySensorEntity):
             last_local = dt_util.as_local(self.coordinator.last_request_utc)
             attrs[ATTR_LAST_REQUEST] = last_local.isoformat()
 
+        # Solange noch kein Abruf gelungen ist: Alter des gespeicherten Stands
+        if self.coordinator.restored_from is not None:
+            attrs[ATTR_RESTORED_FROM] = dt_util.as_local(
+                self.coordinator.restored_from
+            ).isoformat()
+
+        # Dauer des Setups (Sekunden), zum Vergleich mit/ohne gespeichertem Stand
+        if self.coordinator.setup_duration is not None:
+            attrs[ATTR_SETUP_DURATION] = self.coordinator.setup_duration
+
+        # Aktuelles (ggf. adaptives) Abfrage-Intervall in Sekunden
+        if self.coordinator.update_interval is not None:
+            attrs[ATTR_UPDATE_INTERVAL] = int(
+                self.coordinator.update_interval.total_seconds()
+            )
+
+        # Dauer des letzten Zyklus (Sekunden)
+        if getattr(self.coordinator, "last_cycle_duration", None) is not None:
+            attrs[ATTR_CYCLE_DURATION] = self.coordinator.last_cycle_duration
+
+        # Zustand je Ort: Breaker, Fehler in Folge, Latenz, letzter Fehler
+        # (Anzeigename statt "lat,lon"; unbekannte Punkte nur durchnummeriert)
+        names = self.coordinator.location_names()
+        names[REGIONS_HEALTH_LABEL] = REGIONS_HEALTH_LABEL
+        attrs[ATTR_COORDINATE_HEALTH] = {
+            names.get(label, f"Ort {idx}"): health.as_dict()
+            for idx, (label, health) in enumerate(
+                self.coordinator.coordinate_health.items(), start=1
+            )
+        }
+
+        # Änderungserkennung: unveränderte (Treffer) / geänderte Antworten
+        attrs[ATTR_CHANGE_DETECTION] = {
+            "hits": self.coordinator.unchanged_responses,
+            "misses": self.coordinator.changed_responses,
+            "unchanged_cycles": self.coordinator.unchanged_cycles,
+        }
+
+        # Abfragen je Koordinate, die ohne eigene HTTP-Abfrage bedient wurden
+        attrs[ATTR_COORDINATE_CACHE] = self.coordinator.coordinate_cache_stats()
+
+        # Geschriebene / unterdrückte States aller Entitäten
+        attrs[ATTR_STATE_WRITES] = {
+            "written": self.coordinator.state_writes,
+            "suppressed": self.coordinator.suppressed_writes,
+        }
+
         # Http Response bei Fehlern/Partial Failures
         if (
             getattr(self.coordinator, "had_partial_failure", False)
@@ -15,9 +15,179 @@ from .const import (
     MIN_GRACE_PERIOD,
     MAX_GRACE_PERIOD,
     STEP_GRACE_PERIOD,
+    CONF_MAX_PARALLEL_REQUESTS,
+    DEFAULT_MAX_PARALLEL_REQUESTS,
+    MIN_PARALLEL_REQUESTS,
+    MAX_PARALLEL_REQUESTS,
+    CONF_UPDATE_DEADLINE,
+    DEFAULT_UPDATE_DEADLINE,
+    MIN_UPDATE_DEADLINE,
+    MAX_UPDATE_DEADLINE,
+    STEP_UPDATE_DEADLINE,
+    CONF_REGION_INDEX,
+    DEFAULT_REGION_INDEX,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_NAME,
+    DEFAULT_NAME,
+    CONF_INCLUDE_HOME,
+    DEFAULT_INCLUDE_HOME,
+    CONF_PER_LOCATION,
+    DEFAULT_PER_LOCATION,
+    CONF_TRACKED_ENTITIES,
+    DEFAULT_TRACKED_ENTITIES,
+    CONF_TRACKER_DISTANCE,
+    DEFAULT_TRACKER_DISTANCE,
+    MIN_TRACKER_DISTANCE,
+    MAX_TRACKER_DISTANCE,
+    STEP_TRACKER_DISTANCE,
+    CONF_COORD_PRECISION,
+    DEFAULT_COORD_PRECISION,
+    MIN_COORD_PRECISION,
+    MAX_COORD_PRECISION,
 )
 
 
+def _build_schema(defaults) -> vol.Schema:
+    """Formular für Config- und Options-Flow (gleiche Felder)."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_SCAN_INTERVAL,
+                default=defaults.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=30,
+                    max=600,
+                    step=30,
+                    unit_of_measurement="s",
+                    mode="slider",
+                )
+            ),
+            vol.Optional(
+                CONF_INCLUDE_HOME,
+                default=defaults.get(CONF_INCLUDE_HOME, DEFAULT_INCLUDE_HOME),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_EXTRA_COORDS,
+                default=defaults.get(CONF_EXTRA_COORDS, DEFAULT_EXTRA_COORDS),
+            ): selector.TextSelector(
+                selector.TextSelectorConfig(multiline=False)
+            ),
+            vol.Optional(
+                CONF_TRACKED_ENTITIES,
+                default=defaults.get(CONF_TRACKED_ENTITIES, DEFAULT_TRACKED_ENTITIES),
+            ): selector.EntitySelector(
+                selector.EntitySelectorConfig(
+                    domain=["zone", "person", "device_tracker"], multiple=True
+                )
+            ),
+            vol.Optional(
+                CONF_TRACKER_DISTANCE,
+                default=defaults.get(CONF_TRACKER_DISTANCE, DEFAULT_TRACKER_DISTANCE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=MIN_TRACKER_DISTANCE,
+                    max=MAX_TRACKER_DISTANCE,
+                    step=STEP_TRACKER_DISTANCE,
+                    unit_of_measurement="m",
+                    mode="slider",
+                )
+            ),
+            vol.Optional(
+                CONF_PER_LOCATION,
+                default=defaults.get(CONF_PER_LOCATION, DEFAULT_PER_LOCATION),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_GRACE_PERIOD,
+                default=defaults.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=MIN_GRACE_PERIOD,
+                    max=MAX_GRACE_PERIOD,
+                    step=STEP_GRACE_PERIOD,
+                    unit_of_measurement="s",
+                    mode="slider",
+                )
+            ),
+            vol.Optional(
+                CONF_MAX_PARALLEL_REQUESTS,
+                default=defaults.get(
+                    CONF_MAX_PARALLEL_REQUESTS, DEFAULT_MAX_PARALLEL_REQUESTS
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=MIN_PARALLEL_REQUESTS,
+                    max=MAX_PARALLEL_REQUESTS,
+                    step=1,
+                    mode="slider",
+                )
+            ),
+            vol.Optional(
+                CONF_UPDATE_DEADLINE,
+                default=defaults.get(CONF_UPDATE_DEADLINE, DEFAULT_UPDATE_DEADLINE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=MIN_UPDATE_DEADLINE,
+                    max=MAX_UPDATE_DEADLINE,
+                    step=STEP_UPDATE_DEADLINE,
+                    unit_of_measurement="s",
+                    mode="slider",
+                )
+            ),
+            vol.Optional(
+                CONF_COORD_PRECISION,
+                default=defaults.get(CONF_COORD_PRECISION, DEFAULT_COORD_PRECISION),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=MIN_COORD_PRECISION,
+                    max=MAX_COORD_PRECISION,
+                    step=1,
+                    mode="slider",
+                )
+            ),
+            vol.Optional(
+                CONF_REGION_INDEX,
+                default=defaults.get(CONF_REGION_INDEX, DEFAULT_REGION_INDEX),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_ADAPTIVE_POLLING,
+                default=defaults.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+            ): selector.BooleanSelector(),
+        }
+    )
+
+
+def _entry_data(user_input: dict) -> dict:
+    """Eingaben mit Defaults für fehlende optionale Felder."""
+    return {
+        CONF_SCAN_INTERVAL: user_input[CONF_SCAN_INTERVAL],
+        CONF_INCLUDE_HOME: user_input.get(CONF_INCLUDE_HOME, DEFAULT_INCLUDE_HOME),
+        CONF_EXTRA_COORDS: user_input.get(CONF_EXTRA_COORDS, DEFAULT_EXTRA_COORDS),
+        CONF_TRACKED_ENTITIES: list(
+            user_input.get(CONF_TRACKED_ENTITIES, DEFAULT_TRACKED_ENTITIES)
+        ),
+        CONF_TRACKER_DISTANCE: user_input.get(
+            CONF_TRACKER_DISTANCE, DEFAULT_TRACKER_DISTANCE
+        ),
+        CONF_PER_LOCATION: user_input.get(CONF_PER_LOCATION, DEFAULT_PER_LOCATION),
+        CONF_GRACE_PERIOD: user_input.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD),
+        CONF_MAX_PARALLEL_REQUESTS: user_input.get(
+            CONF_MAX_PARALLEL_REQUESTS, DEFAULT_MAX_PARALLEL_REQUESTS
+        ),
+        CONF_UPDATE_DEADLINE: user_input.get(
+            CONF_UPDATE_DEADLINE, DEFAULT_UPDATE_DEADLINE
+        ),
+        CONF_COORD_PRECISION: user_input.get(
+            CONF_COORD_PRECISION, DEFAULT_COORD_PRECISION
+        ),
+        CONF_REGION_INDEX: user_input.get(CONF_REGION_INDEX, DEFAULT_REGION_INDEX),
+        CONF_ADAPTIVE_POLLING: user_input.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        ),
+    }
+
+
 class geosphereWeatherConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Config-Flow fÇ¬r GeosphÇÏre Wetterwarnung."""
 
@@ -28,58 +198,24 @@ class geosphereWeatherConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return OptionsFlowHandler(config_entry)
 
     async def async_step_user(self, user_input=None) -> FlowResult:
-        # Nur eine Instanz zulassen
-        if self._async_current_entries():
-            return self.async_abort(reason="single_instance_allowed")
-
+        # Mehrere Einträge (z.B. je Standortgruppe) teilen sich die Abfragen
         if user_input is not None:
-            seconds = user_input[CONF_SCAN_INTERVAL]
-            extra_coords = user_input.get(CONF_EXTRA_COORDS, DEFAULT_EXTRA_COORDS)
-            grace_period = user_input.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD)
+            name = str(user_input.get(CONF_NAME, DEFAULT_NAME)).strip()
+            data = _entry_data(user_input)
+            if name:
+                data[CONF_NAME] = name
             return self.async_create_entry(
-                title="GeosphÇÏre Wetterwarnung",
-                data={
-                    CONF_SCAN_INTERVAL: seconds,
-                    CONF_EXTRA_COORDS: extra_coords,
-                    CONF_GRACE_PERIOD: grace_period,
-                },
+                title=f"GeoSphere Wetterwarnung {name}".strip(),
+                data=data,
             )
 
-        # Slider: 30 bis 600, Schritt 30, Einheit "s"; Textfeld fÇ¬r Extra-Koordinaten
+        # Name nur beim Anlegen; Slider für Intervall, Halte-Frist und
+        # Parallelität; Textfeld für Extra-Koordinaten
         data_schema = vol.Schema(
             {
-                vol.Required(
-                    CONF_SCAN_INTERVAL,
-                    default=DEFAULT_SCAN_INTERVAL,
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=30,
-                        max=600,
-                        step=30,
-                        unit_of_measurement="s",
-                        mode="slider",
-                    )
-                ),
-                vol.Optional(
-                    CONF_EXTRA_COORDS,
-                    default=DEFAULT_EXTRA_COORDS,
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(multiline=False)
-                ),
-                vol.Optional(
-                    CONF_GRACE_PERIOD,
-                    default=DEFAULT_GRACE_PERIOD,
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=MIN_GRACE_PERIOD,
-                        max=MAX_GRACE_PERIOD,
-                        step=STEP_GRACE_PERIOD,
-                        unit_of_measurement="s",
-                        mode="slider",
-                    )
-                ),
+                vol.Optional(CONF_NAME, default=DEFAULT_NAME): selector.TextSelector(),
             }
-        )
+        ).extend(_build_schema({}).schema)
 
         return self.async_show_form(step_id="user", data_schema=data_schema)
 
@@ -97,53 +233,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None) -> FlowResult:
         if user_input is not None:
-            seconds = user_input[CONF_SCAN_INTERVAL]
-            extra_coords = user_input.get(CONF_EXTRA_COORDS, DEFAULT_EXTRA_COORDS)
-            grace_period = user_input.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD)
-            return self.async_create_entry(
-                title="",
-                data={
-                    CONF_SCAN_INTERVAL: seconds,
-                    CONF_EXTRA_COORDS: extra_coords,
-                    CONF_GRACE_PERIOD: grace_period,
-                },
-            )
+            return self.async_create_entry(title="", data=_entry_data(user_input))
 
         defaults = self.config_entry.options or self.config_entry.data
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_SCAN_INTERVAL,
-                    default=defaults.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=30,
-                        max=600,
-                        step=30,
-                        unit_of_measurement="s",
-                        mode="slider",
-                    )
-                ),
-                vol.Optional(
-                    CONF_EXTRA_COORDS,
-                    default=defaults.get(CONF_EXTRA_COORDS, DEFAULT_EXTRA_COORDS),
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(multiline=False)
-                ),
-                vol.Optional(
-                    CONF_GRACE_PERIOD,
-                    default=defaults.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=MIN_GRACE_PERIOD,
-                        max=MAX_GRACE_PERIOD,
-                        step=STEP_GRACE_PERIOD,
-                        unit_of_measurement="s",
-                        mode="slider",
-                    )
-                ),
-            }
-        )
+        data_schema = _build_schema(defaults)
 
         return self.async_show_form(step_id="init", data_schema=data_schema)
-
+
@@ -3,9 +3,97 @@ DOMAIN = "geosphere_wetterwarnung"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_EXTRA_COORDS = "extra_coords"
 CONF_GRACE_PERIOD = "grace_period"
+CONF_MAX_PARALLEL_REQUESTS = "max_parallel_requests"
+CONF_UPDATE_DEADLINE = "update_deadline"
+CONF_REGION_INDEX = "region_index"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_API_BASE_URL = "api_base_url"
+CONF_NAME = "name"
+CONF_INCLUDE_HOME = "include_home"
+CONF_PER_LOCATION = "per_location"
+CONF_TRACKED_ENTITIES = "tracked_entities"
+CONF_TRACKER_DISTANCE = "tracker_distance"
+CONF_COORD_PRECISION = "coord_precision"
 DEFAULT_SCAN_INTERVAL = 60  # Sekunden
 DEFAULT_EXTRA_COORDS = ""
 DEFAULT_GRACE_PERIOD = 600
+DEFAULT_MAX_PARALLEL_REQUESTS = 4
+DEFAULT_UPDATE_DEADLINE = 30  # Sekunden für den gesamten Abruf-Zyklus
+DEFAULT_REGION_INDEX = False  # Regionen einmal laden statt je Koordinate fragen
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_NAME = ""
+DEFAULT_INCLUDE_HOME = True
+DEFAULT_PER_LOCATION = False  # eigene Entitäten je Koordinate
+DEFAULT_TRACKED_ENTITIES: list[str] = []  # Zonen, Personen, Device-Tracker
+DEFAULT_TRACKER_DISTANCE = 1000  # Meter, ab denen ein Tracker neu abgefragt wird
+# Geohash-Länge, auf deren Zellmitte Koordinaten gerundet abgefragt werden
+# (z.B. 6 = ca. 600 x 800 m); 0 = exakte Koordinaten, Raster nur auf Wunsch
+DEFAULT_COORD_PRECISION = 0
+
+# Anzeigename der Koordinate aus zone.home im Modus "je Ort"
+HOME_LOCATION_NAME = "Zuhause"
+
+DEFAULT_API_BASE_URL = "https://warnungen.zamg.at/wsapp/api"
+
+# Timeouts je HTTP-Abfrage (Sekunden): Verbindungsaufbau, Pause beim Lesen
+# und Gesamtdauer (die Zyklus-Deadline begrenzt zusätzlich)
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 10
+REQUEST_TIMEOUT = 20
+
+# Eigener HTTP-Client für die GeoSphere-API
+HTTP_MAX_CONNECTIONS = 16  # je Host, wie MAX_PARALLEL_REQUESTS
+HTTP_KEEPALIVE = 90  # Sekunden; länger als das Standard-Scan-Intervall
+HTTP_DNS_CACHE_TTL = 300  # Sekunden
+HTTP_USER_AGENT_URL = "https://github.com/chackl1990/hass-geosphere-wetterwarnung"
+
+# Gemeinsame Abfrage-Schicht aller Einträge (hass.data-Schlüssel)
+DATA_FETCHER = f"{DOMAIN}_fetcher"
+# Ergebnis teilen, wenn jünger als Faktor x Update-Intervall des Abfragenden
+SHARED_MAX_AGE_FACTOR = 0.5
+SHARED_CACHE_TTL = 3600  # Sekunden ohne Abfrage, bis eine URL vergessen wird
+SHARED_CACHE_EVICT_INTERVAL = 300  # Sekunden zwischen zwei Aufräumläufen
+
+# Obergrenze des Halte-Caches (aktuelle + gehaltene Warnungen); darüber
+# werden gehaltene Warnungen mit der frühesten Ablaufzeit verdrängt
+GRACE_CACHE_MAX_ENTRIES = 5000
+
+# Gespeicherter Stand (HA-Storage)
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30  # Sekunden, Schreibvorgänge werden zusammengefasst
+
+# Circuit-Breaker je Koordinate
+BREAKER_FAILURE_THRESHOLD = 3  # Fehler in Folge bis zum Öffnen
+BREAKER_OPEN_SECONDS = 300  # erste Sperrzeit, verdoppelt sich je fehlgeschlagener Probe
+BREAKER_MAX_OPEN_SECONDS = 3600
+
+# Messwerte: Anzahl der letzten Werte für die rollierenden Perzentile
+METRICS_WINDOW = 100
+
+# Dienst zum Profilen von Abruf-Zyklen
+SERVICE_PROFILE = "profile"
+ATTR_CONFIG_ENTRY = "config_entry"
+ATTR_CYCLES = "cycles"
+ATTR_TOP = "top"
+PROFILE_MAX_CYCLES = 20
+PROFILE_DEFAULT_TOP = 25
+
+# Dienst für die (nicht aufgezeichneten) Warnungsdetails
+SERVICE_GET_DETAILS = "get_details"
+ATTR_LOCATION = "location"
+
+# Dienst für Warnungen an beliebigen Koordinaten
+SERVICE_GET_WARNINGS = "get_warnings"
+ATTR_LATITUDE = "latitude"
+ATTR_LONGITUDE = "longitude"
+# So alt darf ein (auch von den Abrufen der Einträge geteiltes) Ergebnis sein
+QUERY_CACHE_TTL = 300  # Sekunden
+
+# Events zum Lebenszyklus einzelner Warnungen
+EVENT_WARNING_ISSUED = f"{DOMAIN}_warning_issued"
+EVENT_WARNING_UPDATED = f"{DOMAIN}_warning_updated"
+EVENT_WARNING_LEVEL_CHANGED = f"{DOMAIN}_warning_level_changed"
+EVENT_WARNING_EXPIRED = f"{DOMAIN}_warning_expired"
 
 MIN_SCAN_INTERVAL = 30
 MAX_SCAN_INTERVAL = 600
@@ -15,6 +103,36 @@ MIN_GRACE_PERIOD = 0
 MAX_GRACE_PERIOD = 3600
 STEP_GRACE_PERIOD = 60
 
+MIN_TRACKER_DISTANCE = 100
+MAX_TRACKER_DISTANCE = 10000
+STEP_TRACKER_DISTANCE = 100
+
+# Verfolgte Positionen: höchstens eine neue Abfrage je Zeitraum (Sekunden)
+# und so viele zuletzt genutzte Anker je Entität
+TRACKER_DEBOUNCE = 60
+TRACKER_AREA_CACHE = 8
+
+# Zeitabhängige Attribute (Restdauer) bei aktiver Warnung so oft neu (Sekunden)
+REMAINING_REFRESH_INTERVAL = 60
+
+MIN_COORD_PRECISION = 0
+MAX_COORD_PRECISION = 9
+
+MIN_PARALLEL_REQUESTS = 1
+MAX_PARALLEL_REQUESTS = 16
+
+# Adaptives Polling (Sekunden)
+ADAPTIVE_FAST_INTERVAL = 30  # kurz vor Warnungsbeginn / nach neuer Warnung
+ADAPTIVE_LEAD_TIME = 3600  # "kurz vor Beginn" = innerhalb dieser Zeit
+ADAPTIVE_ISSUED_HOLD = 900  # so lange nach einer neuen Warnung schnell abfragen
+ADAPTIVE_IDLE_FACTOR = 4  # ohne Warnungen: Scan-Intervall x Faktor
+ADAPTIVE_MAX_INTERVAL = 1800  # Obergrenze für Leerlauf und Fehler-Backoff
+ADAPTIVE_JITTER = 0.2  # +/- Anteil Zufall beim Fehler-Backoff
+
+MIN_UPDATE_DEADLINE = 10
+MAX_UPDATE_DEADLINE = 120
+STEP_UPDATE_DEADLINE = 5
+
 # Namen für die Anzeige
 WARNING_TYPES = {
     0: "Keine",
@@ -44,4 +162,12 @@ ATTR_WARNUNG_TEXT = "Warnung Text"
 ATTR_HTTP_CODE = "http_code"
 ATTR_HTTP_RESPONSE = "http_response"
 ATTR_LAST_REQUEST = "last_request"
+ATTR_COORDINATE_HEALTH = "coordinate_health"
+ATTR_CYCLE_DURATION = "cycle_duration"
+ATTR_CHANGE_DETECTION = "change_detection"
+ATTR_COORDINATE_CACHE = "coordinate_cache"
+ATTR_STATE_WRITES = "state_writes"
+ATTR_UPDATE_INTERVAL = "update_interval"
+ATTR_RESTORED_FROM = "restored_from"
+ATTR_SETUP_DURATION = "setup_duration"
 
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import List, Tuple
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_time_interval,
+)
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
@@ -16,7 +23,57 @@ from .const import (
     DEFAULT_EXTRA_COORDS,
     CONF_GRACE_PERIOD,
     DEFAULT_GRACE_PERIOD,
+    CONF_MAX_PARALLEL_REQUESTS,
+    DEFAULT_MAX_PARALLEL_REQUESTS,
+    CONF_UPDATE_DEADLINE,
+    DEFAULT_UPDATE_DEADLINE,
+    MIN_PARALLEL_REQUESTS,
+    CONF_REGION_INDEX,
+    DEFAULT_REGION_INDEX,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    ADAPTIVE_FAST_INTERVAL,
+    ADAPTIVE_IDLE_FACTOR,
+    ADAPTIVE_ISSUED_HOLD,
+    ADAPTIVE_JITTER,
+    ADAPTIVE_LEAD_TIME,
+    ADAPTIVE_MAX_INTERVAL,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
+    CONF_API_BASE_URL,
+    DEFAULT_API_BASE_URL,
+    CONF_INCLUDE_HOME,
+    DEFAULT_INCLUDE_HOME,
+    CONF_PER_LOCATION,
+    DEFAULT_PER_LOCATION,
+    CONF_TRACKED_ENTITIES,
+    DEFAULT_TRACKED_ENTITIES,
+    CONF_TRACKER_DISTANCE,
+    DEFAULT_TRACKER_DISTANCE,
+    CONF_COORD_PRECISION,
+    DEFAULT_COORD_PRECISION,
+    HOME_LOCATION_NAME,
+    SHARED_MAX_AGE_FACTOR,
+    GRACE_CACHE_MAX_ENTRIES,
+    REMAINING_REFRESH_INTERVAL,
+)
+from .events import WarningEvents
+from .fetcher import async_get_fetcher
+from .geohash import cell_center
+from .grace import GraceCache
+from .health import CoordinateHealth
+from .model import WarningRecord, decode_warnings
+from .metrics import (
+    METRIC_CYCLE,
+    METRIC_FANOUT,
+    METRIC_GRACE_MERGE,
+    UpdateMetrics,
 )
+from .region_index import RegionIndex
+from .snapshot import WarningSnapshot
+from .tracking import LocationTracker
+
+REGIONS_HEALTH_LABEL = "regions"
 
 class _NoopLogger:
     def __getattr__(self, name):
@@ -26,72 +83,60 @@ class _NoopLogger:
 _NOOP_LOGGER = _NoopLogger()
 
 
-def _parse_extra_coords(text: str) -> List[Tuple[float, float]]:
-    """Parse Eingabe 'lat1,lon1;lat2,lon2' zu Float-Tupeln."""
+def _parse_locations(text: str) -> List[Tuple[float, float, Optional[str]]]:
+    """Parse Eingabe 'lat1,lon1[,Name1];lat2,lon2' zu (lat, lon, Name)."""
     if not text:
         return []
-    coords: List[Tuple[float, float]] = []
+    locations: List[Tuple[float, float, Optional[str]]] = []
     for part in text.split(";"):
         part = part.strip()
         if not part:
             continue
-        pieces = part.split(",")
-        if len(pieces) != 2:
+        pieces = part.split(",", 2)
+        if len(pieces) < 2:
             continue
         try:
             lat = float(pieces[0].strip())
             lon = float(pieces[1].strip())
         except (TypeError, ValueError):
             continue
-        coords.append((lat, lon))
-    return coords
-
-
-def _warning_key(warning: dict) -> str:
-    raw = warning.get("properties", {}).get("rawinfo", {})
-    for key in ("id", "awcode", "warnid", "wcode"):
-        val = raw.get(key)
-        if val:
-            return f"{key}:{val}"
-    return "|".join(
-        [
-            str(raw.get("wtype", "")),
-            str(raw.get("wlevel", "")),
-            str(raw.get("start", "")),
-            str(raw.get("end", "")),
-        ]
-    )
+        name = pieces[2].strip() if len(pieces) == 3 else ""
+        locations.append((lat, lon, name or None))
+    return locations
+
+
+def _parse_extra_coords(text: str) -> List[Tuple[float, float]]:
+    """Parse Eingabe 'lat1,lon1;lat2,lon2' zu Float-Tupeln (Namen ignoriert)."""
+    return [(lat, lon) for lat, lon, _ in _parse_locations(text)]
+
+
+def _convert_warnings(data: dict | None, convert: Callable) -> dict | None:
+    """Warnungen in den Daten (gesamt und je Ort) umwandeln, für den Speicher."""
+    if data is None:
+        return None
 
+    def _properties(properties: dict) -> dict:
+        return {
+            **properties,
+            "warnings": [convert(warning) for warning in properties.get("warnings", [])],
+        }
 
-def _get_end_ts(warning: dict) -> int:
-    raw = warning.get("properties", {}).get("rawinfo", {})
-    try:
-        return int(raw.get("end", 0))
-    except (TypeError, ValueError):
-        return 0
+    converted = {**data, "properties": _properties(data.get("properties", {}))}
+    if "locations" in data:
+        converted["locations"] = {
+            label: {**location, "properties": _properties(location["properties"])}
+            for label, location in data["locations"].items()
+        }
+    return converted
 
 
-def _copy_with_end(warning: dict, new_end: int) -> dict:
-    props = dict(warning.get("properties", {}))
-    raw = dict(props.get("rawinfo", {}))
-    raw["end"] = new_end
-    props["rawinfo"] = raw
-    copy = dict(warning)
-    copy["properties"] = props
-    return copy
+def _stored_state(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
 
 
-def _extend_if_grace_applies(
-    warning: dict, now_ts: int, grace_seconds: int, allow_invalid_end: bool
-) -> dict | None:
-    end_ts = _get_end_ts(warning)
-    if end_ts <= 0:
-        return warning if allow_invalid_end else None
-    if now_ts <= end_ts:
-        return warning
-    if now_ts <= end_ts + grace_seconds:
-        return _copy_with_end(warning, end_ts + grace_seconds)
-    return None
+async def async_remove_stored_state(hass: HomeAssistant, entry_id: str) -> None:
+    """Gespeicherten Stand eines Config-Entries löschen."""
+    await _stored_state(hass, entry_id).async_remove()
 
 
 class geosphereCoordinator(DataUpdateCoordinator):
@@ -104,154 +149,980 @@ class geosphereCoordinator(DataUpdateCoordinator):
         # Felder für API-Status
         self.last_http_status: int | None = None
         self.last_http_response: str | None = None
+        # Fehler des letzten Zyklus als (Position in den Koordinaten, Fehler),
+        # für die Diagnose ohne Koordinaten
+        self.last_errors: List[Tuple[int, str]] = []
+        # Im letzten Zyklus abgefragte Koordinaten; Bezug für diese Positionen
+        self.last_coords: List[Tuple[float, float]] = []
         self.had_partial_failure: bool = False
+        # Lieferte im letzten Zyklus mindestens eine Abfrage Daten?
+        self.last_cycle_success: bool = False
         self._last_successful_data: dict | None = None
         self._last_non_empty_data: dict | None = None
         self._last_non_empty_utc = None
-        self._warning_cache: dict[str, dict] = {}
+        self._warning_cache = GraceCache(GRACE_CACHE_MAX_ENTRIES)
         self.last_request_utc = None
+        # Zustand/Circuit-Breaker je Koordinate ("lat,lon") und Zyklusdauer
+        self.coordinate_health: dict[str, CoordinateHealth] = {}
+        self.last_cycle_duration: float | None = None
+        # Modus "je Ort": je Koordinate Zeitpunkt der letzten Meldung je
+        # Warnung und Snapshots je Ort
+        self._location_seen: Dict[str, Dict[str, int]] = {}
+        self._location_snapshots: Dict[str, WarningSnapshot] = {}
+        # Orte mit Listenern und der zuletzt an sie verteilte Stand
+        self._location_labels: set[str] = set()
+        self._dispatched: Dict[str, Tuple[WarningSnapshot, bool]] = {}
+        # Rollierende Messwerte (Latenz, Bytes, Dekodier-/Merge-/Fan-out-Zeit)
+        self.metrics = UpdateMetrics()
+        self._snapshot: WarningSnapshot | None = None
+        # Lebenszyklus-Events aus dem Vergleich aufeinanderfolgender Snapshots
+        self.events = WarningEvents()
+        # Gemeinsame Abfrage-Schicht aller Einträge; je URL der Body-Hash der
+        # zuletzt von diesem Koordinator verarbeiteten Antwort
+        self._fetcher = async_get_fetcher(hass)
+        self._seen_digests: dict[str, bytes] = {}
+        # Profil-Lauf: gemeinsame Abfrage-Schicht und Abkürzungen für
+        # unveränderte Daten umgehen, damit der ganze Zyklus gemessen wird
+        self._uncached: bool = False
+        self._current_coords: List[Tuple[float, float]] = []
+        self._current_warnings: list = []
+        self._current_warning_keys: List[str] = []
+        self._current_keys: set[str] = set()
+        # Key -> Bitmaske der Koordinaten, die die Warnung zuletzt gemeldet haben
+        self._coverage: Dict[str, int] = {}
+        # Koordinaten, auf deren Reihenfolge sich die Bits beziehen
+        self._coverage_coords: List[Tuple[float, float]] = []
+        self._current_seen_ts: int = 0
+        self.unchanged_responses: int = 0
+        self.changed_responses: int = 0
+        self.unchanged_cycles: int = 0
+        # Koordinaten-Cache: Abfragen je Koordinate / davon ohne eigene
+        # HTTP-Abfrage bedient (gleiche Zelle, anderer Eintrag, Dienst)
+        self.coord_lookups: int = 0
+        self.coord_hits: int = 0
+        self.last_cells: int = 0
+        # Adaptives Polling: Fehlerserie und Zeitpunkt der letzten neuen Warnung
+        self._error_streak: int = 0
+        self._last_issued_ts: int = 0
+        # Gespeicherter Stand (Warnungen + Halte-Cache) für schnellen Neustart
+        self._store = _stored_state(hass, config_entry.entry_id)
+        # Zeitpunkt des wiederhergestellten Stands, bis ein Abruf gelingt
+        self.restored_from: datetime | None = None
+        self.setup_duration: float | None = None
+        # Geschriebene bzw. (weil unverändert) unterdrückte Entitäts-States
+        self.state_writes: int = 0
+        self.suppressed_writes: int = 0
+        # Entitäten, die auch ohne neue Warnungsdaten jeden Zyklus aktualisieren
+        self._status_listeners: list[CALLBACK_TYPE] = []
+        # Timer auf die nächste Start-/Endgrenze einer Warnung
+        self._unsub_boundary: CALLBACK_TYPE | None = None
+        # Entitäten mit zeitabhängigen Attributen und deren Takt
+        self._time_listeners: list[CALLBACK_TYPE] = []
+        self._unsub_time_tick: CALLBACK_TYPE | None = None
 
         scan_interval = self._get_entry_value(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        # Überschreibbar (nur per Entry-Daten), z.B. für lokale Lasttests
+        self._api_base_url: str = str(
+            self._get_entry_value(CONF_API_BASE_URL, DEFAULT_API_BASE_URL)
+        ).rstrip("/")
+        self.coord_precision = int(
+            self._get_entry_value(CONF_COORD_PRECISION, DEFAULT_COORD_PRECISION)
+        )
 
         super().__init__(
             hass,
             _NOOP_LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            always_update=False,
+        )
+        # Zonen/Personen/Device-Tracker als zusätzliche Abfragepunkte
+        self.tracker = LocationTracker(
+            hass,
+            self._get_entry_value(CONF_TRACKED_ENTITIES, DEFAULT_TRACKED_ENTITIES),
+            float(
+                self._get_entry_value(CONF_TRACKER_DISTANCE, DEFAULT_TRACKER_DISTANCE)
+            ),
+            self.logger,
+            self.async_request_refresh,
         )
 
     async def _async_update_data(self):
+        """Daten holen und danach das nächste Abfrage-Intervall festlegen."""
+        try:
+            data = await self._async_fetch_warnings()
+        except UpdateFailed:
+            self._adapt_update_interval(None, failed=True)
+            raise
+        # Teilausfälle übernimmt der Breaker je Koordinate; verlangsamt wird
+        # nur, wenn keine einzige Abfrage Daten lieferte
+        self._adapt_update_interval(data, failed=not self.last_cycle_success)
+        return data
+
+    async def _async_fetch_warnings(self):
         """Daten von der ZAMG / Geosphere API holen."""
         self.last_request_utc = dt_util.utcnow()
+        self.last_errors = []
         grace_seconds = self._get_entry_value(
             CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD
         )
 
-        zone = self.hass.states.get("zone.home")
-        if zone is None:
-            self.last_http_status = None
-            self.last_http_response = "zone.home not found"
-            raise UpdateFailed("zone.home not found")
+        coords: List[Tuple[float, float]] = []
+        if self._get_entry_value(CONF_INCLUDE_HOME, DEFAULT_INCLUDE_HOME):
+            zone = self.hass.states.get("zone.home")
+            if zone is None:
+                self.last_http_status = None
+                self.last_http_response = "zone.home not found"
+                raise UpdateFailed("zone.home not found")
 
-        lon = zone.attributes.get("longitude")
-        lat = zone.attributes.get("latitude")
-        if lon is None or lat is None:
-            self.last_http_status = None
-            self.last_http_response = "zone.home has no coordinates"
-            raise UpdateFailed("zone.home has no coordinates")
+            lon = zone.attributes.get("longitude")
+            lat = zone.attributes.get("latitude")
+            if lon is None or lat is None:
+                self.last_http_status = None
+                self.last_http_response = "zone.home has no coordinates"
+                raise UpdateFailed("zone.home has no coordinates")
 
-        coords: List[Tuple[float, float]] = []
-        try:
-            coords.append((float(lat), float(lon)))
-        except (TypeError, ValueError):
-            self.last_http_status = None
-            self.last_http_response = "zone.home has invalid coordinates"
-            raise UpdateFailed("zone.home has invalid coordinates")
+            try:
+                coords.append((float(lat), float(lon)))
+            except (TypeError, ValueError):
+                self.last_http_status = None
+                self.last_http_response = "zone.home has invalid coordinates"
+                raise UpdateFailed("zone.home has invalid coordinates")
 
         extra = self._get_entry_value(CONF_EXTRA_COORDS, DEFAULT_EXTRA_COORDS)
         coords.extend(_parse_extra_coords(extra))
+        for lat_val, lon_val, _ in self.tracker.points():
+            if (lat_val, lon_val) not in coords:
+                coords.append((lat_val, lon_val))
         if not coords:
             self.last_http_status = None
             self.last_http_response = "no coordinates to query"
             raise UpdateFailed("no coordinates to query")
+        self.last_coords = coords
 
-        session = async_get_clientsession(self.hass)
-        combined_warnings: list = []
+        # Je Warnung (Key) nur ein Exemplar; Bitmaske der meldenden Koordinaten
+        combined_warnings: List[WarningRecord] = []
+        coverage: Dict[str, int] = {}
         any_success = False
         max_http_status: int | None = None
-        error_messages: list[str] = []
+        now_ts = int(self.last_request_utc.timestamp())
 
-        for lat_val, lon_val in coords:
-            url = (
-                "https://warnungen.zamg.at/wsapp/api/getWarningsForCoords"
-                f"?lon={lon_val}&lat={lat_val}&lang=de"
-            )
-            try:
-                async with session.get(url, timeout=10) as resp:
-                    status = resp.status
-                    if max_http_status is None or status > max_http_status:
-                        max_http_status = status
-
-                    if status != 200:
-                        try:
-                            text = await resp.text()
-                        except Exception:  # noqa: BLE001
-                            text = "<no body>"
-                        error_messages.append(
-                            f"{lat_val},{lon_val}: HTTP {status} {text}"
-                        )
-                        continue
-
-                    data = await resp.json()
-                    any_success = True
-
-                    props = data.get("properties", {}) or {}
-                    warnings = props.get("warnings", []) or []
-                    combined_warnings.extend(warnings)
-
-            except Exception as err:  # noqa: BLE001
-                error_messages.append(f"{lat_val},{lon_val}: {err!r}")
+        cycle_started = time.monotonic()
+        region_mode = self._get_entry_value(CONF_REGION_INDEX, DEFAULT_REGION_INDEX)
+        if region_mode:
+            results = await self._async_fetch_regions(coords)
+        else:
+            self.last_cells = len({self._query_point(*coord) for coord in coords})
+            results = await self._async_fetch_all(coords)
+        self.last_cycle_duration = round(time.monotonic() - cycle_started, 3)
+        self.metrics.record(METRIC_CYCLE, self.last_cycle_duration * 1000)
+
+        # Im Regionen-Modus gab es nur eine Abfrage für alle Koordinaten
+        if region_mode and results and not results[0].get("skipped"):
+            self._record_request_metrics(REGIONS_HEALTH_LABEL, results[0])
+
+        # Zusammenführen in Koordinaten-Reihenfolge, wie beim sequentiellen Abruf
+        for idx, ((lat_val, lon_val), result) in enumerate(zip(coords, results)):
+            if not region_mode and not result.get("skipped"):
+                label = f"{lat_val},{lon_val}"
+                self._record_request_metrics(label, result)
+                health = self._health(label)
+                if result.get("error") is None:
+                    health.record_success(result.get("duration"), now_ts)
+                else:
+                    health.record_failure(
+                        result["error"], result.get("duration"), now_ts
+                    )
+
+            status = result.get("status")
+            if status is not None and (
+                max_http_status is None or status > max_http_status
+            ):
+                max_http_status = status
+
+            error = result.get("error")
+            if error is not None:
+                self.last_errors.append((idx, error))
                 continue
 
-        self.had_partial_failure = bool(error_messages)
+            any_success = True
+            bit = 1 << idx
+            for warning in result.get("warnings", []):
+                key = warning.key
+                mask = coverage.get(key)
+                if mask is None:
+                    combined_warnings.append(warning)
+                    coverage[key] = bit
+                else:
+                    coverage[key] = mask | bit
+
+        # Nur aktuell konfigurierte Koordinaten behalten (auch die Body-Hashes:
+        # jede Tracker-Zelle hat eine eigene URL)
+        if region_mode:
+            labels = [REGIONS_HEALTH_LABEL]
+            urls = {self._regions_url()}
+        else:
+            labels = [f"{lat_val},{lon_val}" for lat_val, lon_val in coords]
+            urls = {self._coord_url(lat_val, lon_val) for lat_val, lon_val in coords}
+        for url in [url for url in self._seen_digests if url not in urls]:
+            del self._seen_digests[url]
+        for label in list(self.coordinate_health):
+            if label not in labels:
+                del self.coordinate_health[label]
+        self.metrics.prune(labels)
+
+        self.had_partial_failure = bool(self.last_errors)
+        self.last_cycle_success = any_success
         if max_http_status is None:
             max_http_status = 200 if any_success else None
         self.last_http_status = max_http_status
+        # Fehler mit Ortsnamen statt Koordinaten (verfolgte Positionen)
+        error_messages: list[str] = []
+        if self.last_errors:
+            names = self.location_names()
+            for idx, error in self.last_errors:
+                lat_val, lon_val = coords[idx]
+                name = names.get(f"{lat_val},{lon_val}", f"Ort {idx + 1}")
+                error_messages.append(f"{name}: {error}")
         self.last_http_response = "; ".join(error_messages) if error_messages else None
 
         if any_success:
-            now_ts = int(self.last_request_utc.timestamp())
-            current_keys: set[str] = set()
-            warnings_with_grace: list = []
-
-            for warning in combined_warnings:
-                key = _warning_key(warning)
-                current_keys.add(key)
-                self._warning_cache[key] = {
-                    "warning": warning,
-                    "last_seen_ts": now_ts,
-                }
-                extended = _extend_if_grace_applies(
-                    warning, now_ts, grace_seconds, allow_invalid_end=True
+            unchanged = (
+                not error_messages
+                and coords == self._current_coords
+                and all(result.get("unchanged") for result in results)
+            )
+
+            merge_started = time.perf_counter()
+            warnings_with_grace, merged_keys = self._merge_with_grace(
+                combined_warnings, coords, now_ts, grace_seconds, unchanged
+            )
+            result = {"properties": {"warnings": warnings_with_grace}}
+            if len(coords) > 1:
+                result["properties"].update(
+                    self._coverage_properties(coords, coverage, merged_keys)
                 )
-                if extended is not None:
-                    warnings_with_grace.append(extended)
-
-            expired_keys: list[str] = []
-            for key, entry in self._warning_cache.items():
-                if key in current_keys:
-                    continue
-                cached = entry.get("warning", {})
-                last_seen_ts = entry.get("last_seen_ts", 0)
-                if grace_seconds <= 0 or not last_seen_ts:
-                    expired_keys.append(key)
-                    continue
-                if now_ts - last_seen_ts > grace_seconds:
-                    expired_keys.append(key)
-                    continue
-                extended = _extend_if_grace_applies(
-                    cached, now_ts, grace_seconds, allow_invalid_end=False
+            if self.per_location:
+                result["locations"] = self._build_locations(
+                    coords, results, warnings_with_grace, merged_keys, now_ts,
+                    grace_seconds,
                 )
-                if extended is not None:
-                    warnings_with_grace.append(extended)
-                else:
-                    expired_keys.append(key)
+            self.metrics.record(
+                METRIC_GRACE_MERGE, (time.perf_counter() - merge_started) * 1000
+            )
 
-            for key in expired_keys:
-                self._warning_cache.pop(key, None)
+            previous = self._last_successful_data
+            if not self._uncached and previous is not None and previous == result:
+                # Gleiches Objekt zurückgeben: keine Benachrichtigung der
+                # Entitäten (always_update=False) und der Snapshot bleibt gültig.
+                self.restored_from = None
+                self._async_notify_status_listeners()
+                return previous
 
-            result = {"properties": {"warnings": warnings_with_grace}}
             self._last_successful_data = result
+            self.restored_from = None
+            self._store.async_delay_save(self._storage_data, STORAGE_SAVE_DELAY)
             if warnings_with_grace:
                 self._last_non_empty_data = result
                 self._last_non_empty_utc = self.last_request_utc
             return result
 
         if self._last_successful_data is not None:
+            self._async_notify_status_listeners()
             return self._last_successful_data
 
         raise UpdateFailed("Error fetching data: all requests failed")
 
+    def _merge_with_grace(
+        self,
+        combined_warnings: list,
+        coords: List[Tuple[float, float]],
+        now_ts: int,
+        grace_seconds: int,
+        unchanged: bool,
+    ) -> Tuple[List[WarningRecord], List[str]]:
+        """Aktuelle Warnungen cachen und mit denen in der Halte-Frist zusammenführen.
+
+        Liefert die Warnungen und parallel dazu ihre Keys.
+        """
+        if unchanged:
+            # Gleiche Antworten wie zuletzt: Cache nicht neu schreiben,
+            # nur die Halte-Frist neu bewerten.
+            self.unchanged_cycles += 1
+            combined_warnings = self._current_warnings
+            combined_keys = self._current_warning_keys
+        else:
+            # Nicht mehr gemeldete Warnungen bekommen den Zeitpunkt des letzten
+            # (evtl. unveränderten) Zyklus; ab da läuft ihre Halte-Frist.
+            previous_keys = self._current_keys
+            self._current_keys = set()
+            combined_keys = [warning.key for warning in combined_warnings]
+            for key, warning in zip(combined_keys, combined_warnings):
+                self._current_keys.add(key)
+                if key not in self._warning_cache:
+                    self._last_issued_ts = now_ts
+                self._warning_cache.seen(key, warning, now_ts)
+            for key in previous_keys - self._current_keys:
+                self._warning_cache.release(key, self._current_seen_ts)
+            self._current_warnings = combined_warnings
+            self._current_warning_keys = combined_keys
+            self._current_coords = coords
+        self._current_seen_ts = now_ts
+
+        cache = self._warning_cache
+        cache.expire(now_ts, grace_seconds)
+        warnings_with_grace: List[WarningRecord] = []
+        merged_keys: List[str] = []
+        for key, warning in zip(combined_keys, combined_warnings):
+            extended = cache.extend(
+                key, warning, now_ts, grace_seconds, allow_invalid_end=True
+            )
+            if extended is not None:
+                warnings_with_grace.append(extended)
+                merged_keys.append(key)
+
+        # Nach ``expire`` liegen alle gehaltenen Warnungen in der Halte-Frist
+        for key, cached in cache.held():
+            extended = cache.extend(
+                key, cached, now_ts, grace_seconds, allow_invalid_end=False
+            )
+            if extended is not None:
+                warnings_with_grace.append(extended)
+                merged_keys.append(key)
+
+        return warnings_with_grace, merged_keys
+
+    def _coverage_properties(
+        self,
+        coords: List[Tuple[float, float]],
+        coverage: Dict[str, int],
+        keys: List[str],
+    ) -> dict:
+        """Meldende Koordinaten je Warnung als Bitmaske über ``coordinates``.
+
+        Gehaltene Warnungen behalten die Maske ihrer letzten Meldung; ändern
+        sich die Koordinaten (Tracker, Konfiguration), werden ihre Bits auf
+        die neuen Positionen umgelegt, weggefallene Koordinaten entfallen.
+        Die Masken stehen als Hex-Text parallel zu ``warnings`` in den Daten
+        (gespeicherter Stand verträgt keine beliebig großen Zahlen).
+        """
+        known = self._coverage
+        if coords != self._coverage_coords:
+            known = self._remap_coverage(known, self._coverage_coords, coords)
+            self._coverage_coords = list(coords)
+        known.update(coverage)
+        self._coverage = {key: known.get(key, 0) for key in keys}
+        names = self.location_names()
+        return {
+            "coordinates": [
+                names.get(label, label)
+                for label in (f"{lat_val},{lon_val}" for lat_val, lon_val in coords)
+            ],
+            "coverage": [format(self._coverage[key], "x") for key in keys],
+        }
+
+    @staticmethod
+    def _remap_coverage(
+        masks: Dict[str, int],
+        old_coords: List[Tuple[float, float]],
+        new_coords: List[Tuple[float, float]],
+    ) -> Dict[str, int]:
+        """Bitmasken von ``old_coords`` auf die Positionen in ``new_coords``."""
+        position = {coord: idx for idx, coord in enumerate(new_coords)}
+        moves = [
+            (old_idx, position[coord])
+            for old_idx, coord in enumerate(old_coords)
+            if coord in position
+        ]
+        remapped: Dict[str, int] = {}
+        for key, mask in masks.items():
+            new_mask = 0
+            for old_idx, new_idx in moves:
+                if mask >> old_idx & 1:
+                    new_mask |= 1 << new_idx
+            remapped[key] = new_mask
+        return remapped
+
+    def _build_locations(
+        self,
+        coords: List[Tuple[float, float]],
+        results: list[dict],
+        warnings: list,
+        keys: List[str],
+        now_ts: int,
+        grace_seconds: int,
+    ) -> Dict[str, dict]:
+        """Warnungen je Koordinate ("lat,lon") für den Modus "je Ort".
+
+        Eine Warnung gehört zu einem Ort, solange dessen letzte erfolgreiche
+        Antwort sie enthielt oder die Halte-Frist seit der letzten Meldung
+        noch läuft. Orte mit gleichen Warnungen behalten ihr bisheriges
+        Objekt, damit ihr Snapshot gültig bleibt und nichts geschrieben wird.
+        """
+        previous = (self._last_successful_data or {}).get("locations") or {}
+        by_key = dict(zip(keys, warnings))
+        locations: Dict[str, dict] = {}
+        for (lat_val, lon_val), result in zip(coords, results):
+            label = f"{lat_val},{lon_val}"
+            seen = self._location_seen.setdefault(label, {})
+            if result.get("error") is None:
+                for warning in result.get("warnings", []):
+                    seen[warning.key] = now_ts
+            for key in [
+                key
+                for key, seen_ts in seen.items()
+                if key not in by_key or now_ts - seen_ts > grace_seconds
+            ]:
+                del seen[key]
+
+            location_warnings = [by_key[key] for key in seen]
+            old = previous.get(label)
+            if old is not None and old["properties"]["warnings"] == location_warnings:
+                locations[label] = old
+            else:
+                locations[label] = {"properties": {"warnings": location_warnings}}
+
+        for label in list(self._location_seen):
+            if label not in locations:
+                del self._location_seen[label]
+                self._location_snapshots.pop(label, None)
+        return locations
+
+    async def _async_fetch_all(self, coords: List[Tuple[float, float]]) -> list[dict]:
+        """Alle Koordinaten parallel abfragen (begrenzt + Gesamt-Deadline).
+
+        Liefert je Koordinate (gleiche Reihenfolge wie ``coords``) ein Dict mit
+        ``status``, ``warnings``, ``error`` und ``duration``.
+        """
+        max_parallel = max(
+            MIN_PARALLEL_REQUESTS,
+            int(
+                self._get_entry_value(
+                    CONF_MAX_PARALLEL_REQUESTS, DEFAULT_MAX_PARALLEL_REQUESTS
+                )
+            ),
+        )
+        deadline = float(
+            self._get_entry_value(CONF_UPDATE_DEADLINE, DEFAULT_UPDATE_DEADLINE)
+        )
+        semaphore = asyncio.Semaphore(max_parallel)
+        now_ts = int(dt_util.utcnow().timestamp())
+
+        async def _limited(lat_val: float, lon_val: float) -> dict:
+            async with semaphore:
+                return await self._async_fetch_coord(lat_val, lon_val)
+
+        # Koordinaten mit offenem Circuit-Breaker überspringen; ihre letzten
+        # Warnungen laufen dann über die Halte-Frist weiter.
+        tasks: list[asyncio.Task | None] = []
+        for lat_val, lon_val in coords:
+            if self._health(f"{lat_val},{lon_val}").allow_request(now_ts):
+                tasks.append(asyncio.create_task(_limited(lat_val, lon_val)))
+            else:
+                tasks.append(None)
+
+        started = [task for task in tasks if task is not None]
+        pending: set = set()
+        if started:
+            _, pending = await asyncio.wait(started, timeout=deadline)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results: list[dict] = []
+        for (lat_val, lon_val), task in zip(coords, tasks):
+            if task is None:
+                health = self._health(f"{lat_val},{lon_val}")
+                results.append(
+                    {
+                        "status": None,
+                        "error": f"skipped, circuit open ({health.last_error})",
+                        "skipped": True,
+                        "duration": None,
+                    }
+                )
+            elif task in pending:
+                results.append(
+                    {"error": f"deadline of {deadline:g}s exceeded", "duration": None}
+                )
+            else:
+                results.append(task.result())
+        return results
+
+    def _record_request_metrics(self, label: str, result: dict) -> None:
+        duration = result.get("duration")
+        self.metrics.record_request(
+            label,
+            duration * 1000 if duration is not None else None,
+            result.get("bytes"),
+            result.get("decode_time"),
+        )
+
+    def _health(self, label: str) -> CoordinateHealth:
+        health = self.coordinate_health.get(label)
+        if health is None:
+            health = self.coordinate_health[label] = CoordinateHealth()
+        return health
+
+    def _query_point(self, lat_val: float, lon_val: float) -> Tuple[float, float]:
+        """Abgefragter Punkt: Mitte der Geohash-Zelle bzw. die Koordinate selbst."""
+        if self.coord_precision <= 0:
+            return lat_val, lon_val
+        return cell_center(lat_val, lon_val, self.coord_precision)
+
+    def _coord_url(self, lat_val: float, lon_val: float) -> str:
+        lat_val, lon_val = self._query_point(lat_val, lon_val)
+        return (
+            f"{self._api_base_url}/getWarningsForCoords"
+            f"?lon={lon_val}&lat={lat_val}&lang=de"
+        )
+
+    def _regions_url(self) -> str:
+        # Alle aktuellen Warnungen Österreichs inkl. Regionsgeometrien
+        return f"{self._api_base_url}/getWarnstatus?lang=de"
+
+    async def _async_fetch_coord(self, lat_val: float, lon_val: float) -> dict:
+        """Eine Koordinate über ``getWarningsForCoords`` abfragen."""
+        url = self._coord_url(lat_val, lon_val)
+        result = await self._async_fetch_shared(url, self._async_decode_warnings)
+        result["warnings"] = result.pop("payload", None) or []
+        self.coord_lookups += 1
+        if result.get("shared"):
+            self.coord_hits += 1
+        return result
+
+    async def async_query(
+        self, lat_val: float, lon_val: float, max_age: float
+    ) -> dict:
+        """Beliebige Koordinate abfragen (Dienst ``get_warnings``).
+
+        Läuft über die gemeinsame Abfrage-Schicht auf demselben Weg wie die
+        eigenen Abrufe (je Koordinate bzw. über den Regionen-Index), aber
+        ohne Änderungserkennung, Halte-Frist und Circuit-Breaker. Ergebnisse
+        jünger als ``max_age`` kosten keine Abfrage.
+        """
+        if self._get_entry_value(CONF_REGION_INDEX, DEFAULT_REGION_INDEX):
+            result = await self._fetcher.async_fetch(
+                self._regions_url(),
+                self._async_build_region_index,
+                max_age,
+            )
+            index = result.pop("payload", None)
+            result["warnings"] = (
+                index.warnings_for(lat_val, lon_val) if index is not None else []
+            )
+        else:
+            result = await self._fetcher.async_fetch(
+                self._coord_url(lat_val, lon_val),
+                self._async_decode_warnings,
+                max_age,
+            )
+            result["warnings"] = result.pop("payload", None) or []
+        result.pop("digest", None)
+        return result
+
+    async def _async_fetch_regions(
+        self, coords: List[Tuple[float, float]]
+    ) -> list[dict]:
+        """Alle Koordinaten über eine Österreich-weite Abfrage auflösen.
+
+        Die Regionen aus ``getWarnstatus`` werden nur bei geänderter Antwort
+        neu indiziert; die Zuordnung der Koordinaten läuft im Executor.
+        """
+        deadline = float(
+            self._get_entry_value(CONF_UPDATE_DEADLINE, DEFAULT_UPDATE_DEADLINE)
+        )
+        now_ts = int(dt_util.utcnow().timestamp())
+        health = self._health(REGIONS_HEALTH_LABEL)
+        if not health.allow_request(now_ts):
+            return [
+                {
+                    "status": None,
+                    "error": f"skipped, circuit open ({health.last_error})",
+                    "skipped": True,
+                    "duration": None,
+                }
+                for _ in coords
+            ]
+
+        try:
+            async with asyncio.timeout(deadline):
+                url = self._regions_url()
+                bulk = await self._async_fetch_shared(
+                    url, self._async_build_region_index
+                )
+                if bulk["error"] is None:
+                    resolved = await self.hass.async_add_executor_job(
+                        bulk["payload"].resolve, coords
+                    )
+        except TimeoutError:
+            bulk = {
+                "status": None,
+                "error": f"deadline of {deadline:g}s exceeded",
+                "duration": None,
+            }
+
+        if bulk["error"] is not None:
+            health.record_failure(bulk["error"], bulk["duration"], now_ts)
+            return [dict(bulk) for _ in coords]
+        health.record_success(bulk["duration"], now_ts)
+        return [
+            {
+                "status": bulk["status"],
+                "warnings": warnings,
+                "error": None,
+                "unchanged": bulk["unchanged"],
+                "duration": bulk["duration"],
+                "bytes": bulk.get("bytes"),
+                "decode_time": bulk.get("decode_time"),
+            }
+            for warnings in resolved
+        ]
+
+    async def _async_decode_warnings(self, body: bytes) -> List[WarningRecord]:
+        return decode_warnings(body)
+
+    async def _async_build_region_index(self, body: bytes) -> RegionIndex:
+        return await self.hass.async_add_executor_job(RegionIndex.from_body, body)
+
+    async def _async_fetch_shared(self, url: str, decode) -> dict:
+        """URL über die gemeinsame Abfrage-Schicht holen.
+
+        Fehler werden im Ergebnis vermerkt. ``unchanged`` ist gesetzt, wenn
+        die Antwort derjenigen entspricht, die dieser Koordinator zuletzt
+        verarbeitet hat (gleicher Body-Hash, auch bei HTTP 304 oder einem
+        von einem anderen Eintrag geteilten Ergebnis).
+        """
+        max_age = (
+            self.update_interval.total_seconds() * SHARED_MAX_AGE_FACTOR
+            if self.update_interval is not None
+            else 0
+        )
+        result = await self._fetcher.async_fetch(
+            url, decode, max_age, force=self._uncached
+        )
+        if result["error"] is None:
+            digest = result.pop("digest")
+            result["unchanged"] = (
+                not self._uncached and self._seen_digests.get(url) == digest
+            )
+            self._seen_digests[url] = digest
+            if result["unchanged"]:
+                self.unchanged_responses += 1
+            else:
+                self.changed_responses += 1
+        return result
+
+    async def async_refresh_uncached(self) -> None:
+        """Vollständiger Abruf-Zyklus für Profil-Läufe.
+
+        Jede URL wird abgefragt und dekodiert, auch wenn die gemeinsame
+        Abfrage-Schicht ein frisches Ergebnis hat, und alle Entitäten werden
+        neu bewertet; ob geschrieben wird, entscheidet weiter ihr Fingerprint.
+        """
+        self._uncached = True
+        self.always_update = True
+        self._dispatched.clear()
+        try:
+            await self.async_refresh()
+        finally:
+            self._uncached = False
+            self.always_update = False
+
+    async def async_restore(self) -> bool:
+        """Gespeicherten Stand laden, damit Entitäten sofort Daten haben.
+
+        Gibt ``True`` zurück, wenn ein Stand wiederhergestellt wurde.
+        """
+        stored = await self._store.async_load()
+        if not stored or not stored.get("data"):
+            return False
+        self._warning_cache.load(stored.get("warning_cache") or {})
+        data = _convert_warnings(stored["data"], WarningRecord.from_stored)
+        self._last_successful_data = data
+        self.data = data
+        # Was seit dem Speichern neu ist, wird nach dem ersten Abruf gemeldet
+        self.events.prime(self.snapshot)
+        self.restored_from = dt_util.parse_datetime(stored.get("saved_at") or "")
+        return True
+
+    @callback
+    def _storage_data(self) -> dict:
+        # Aktuell gemeldete Warnungen mit dem Zeitpunkt des letzten Zyklus sichern
+        cache = self._warning_cache.as_dict()
+        for key in self._current_keys:
+            if key in cache:
+                cache[key] = {**cache[key], "last_seen_ts": self._current_seen_ts}
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "data": _convert_warnings(
+                self._last_successful_data, WarningRecord.as_dict
+            ),
+            "warning_cache": cache,
+        }
+
+    def coordinate_cache_stats(self) -> dict[str, Any]:
+        """Trefferquote der Abfragen je Koordinate (gerundet auf Zellen)."""
+        return {
+            "precision": self.coord_precision,
+            "coordinates": len(self._current_coords),
+            "cells": self.last_cells,
+            "lookups": self.coord_lookups,
+            "hits": self.coord_hits,
+            "hit_rate": (
+                round(self.coord_hits / self.coord_lookups, 3)
+                if self.coord_lookups
+                else None
+            ),
+        }
+
+    @property
+    def grace_cache(self) -> GraceCache:
+        """Halte-Cache (aktuelle und nicht mehr gemeldete Warnungen)."""
+        return self._warning_cache
+
+    @property
+    def snapshot(self) -> WarningSnapshot:
+        """Gemeinsamer Snapshot der aktuellen Daten für alle Entitäten.
+
+        Wird nur neu gebaut, wenn neue Daten vorliegen oder eine Warnung seit
+        dem letzten Bau begonnen/geendet hat.
+        """
+        now_ts = int(dt_util.utcnow().timestamp())
+        snap = self._snapshot
+        if snap is None or not snap.is_current(self.data, now_ts):
+            snap = self._snapshot = WarningSnapshot(self.data, now_ts)
+        return snap
+
+    def location_snapshot(self, label: str) -> WarningSnapshot:
+        """Snapshot der Warnungen eines Orts (Modus "je Ort").
+
+        Wie ``snapshot``, aber je Ort: unveränderte Orte behalten ihr
+        Datenobjekt und damit ihren Snapshot.
+        """
+        now_ts = int(dt_util.utcnow().timestamp())
+        data = ((self.data or {}).get("locations") or {}).get(label)
+        snap = self._location_snapshots.get(label)
+        if snap is None or not snap.is_current(data, now_ts):
+            snap = self._location_snapshots[label] = WarningSnapshot(data, now_ts)
+        return snap
+
+    @property
+    def per_location(self) -> bool:
+        """Eigene Entitäten je Koordinate?"""
+        return bool(self._get_entry_value(CONF_PER_LOCATION, DEFAULT_PER_LOCATION))
+
+    def configured_locations(self) -> Dict[str, str]:
+        """Label ("lat,lon") -> Anzeigename aller konfigurierten Koordinaten."""
+        locations: Dict[str, str] = {}
+        if self._get_entry_value(CONF_INCLUDE_HOME, DEFAULT_INCLUDE_HOME):
+            zone = self.hass.states.get("zone.home")
+            try:
+                lat = float(zone.attributes["latitude"])
+                lon = float(zone.attributes["longitude"])
+            except (AttributeError, KeyError, TypeError, ValueError):
+                pass
+            else:
+                locations[f"{lat},{lon}"] = HOME_LOCATION_NAME
+        extra = self._get_entry_value(CONF_EXTRA_COORDS, DEFAULT_EXTRA_COORDS)
+        for lat, lon, name in _parse_locations(extra):
+            label = f"{lat},{lon}"
+            locations.setdefault(label, name or label)
+        return locations
+
+    def location_names(self) -> Dict[str, str]:
+        """Wie ``configured_locations``, zusätzlich die verfolgten Positionen."""
+        names = self.configured_locations()
+        for lat_val, lon_val, name in self.tracker.points():
+            names.setdefault(f"{lat_val},{lon_val}", name)
+        return names
+
+    @callback
+    def async_add_status_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listener für API-Status, der auch bei unveränderten Daten läuft."""
+        self._status_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._status_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_status_listeners(self) -> None:
+        for update_callback in list(self._status_listeners):
+            update_callback()
+
+    @callback
+    def async_add_time_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listener für zeitabhängige Attribute, solange eine Warnung aktiv ist.
+
+        Unveränderte Daten lösen keine Entitäts-Updates aus; die Restdauer
+        würde sonst bis zur nächsten Änderung stehen bleiben.
+        """
+        self._time_listeners.append(update_callback)
+        self._async_schedule_time_tick()
+
+        @callback
+        def remove_listener() -> None:
+            self._time_listeners.remove(update_callback)
+            if not self._time_listeners:
+                self._async_cancel_time_tick()
+
+        return remove_listener
+
+    @callback
+    def _async_schedule_time_tick(self) -> None:
+        """Takt nur laufen lassen, wenn Listener und aktive Warnungen da sind."""
+        if not self._time_listeners or self.data is None or not self.snapshot.active:
+            self._async_cancel_time_tick()
+            return
+        if self._unsub_time_tick is None:
+            self._unsub_time_tick = async_track_time_interval(
+                self.hass,
+                self._async_handle_time_tick,
+                timedelta(seconds=REMAINING_REFRESH_INTERVAL),
+            )
+
+    @callback
+    def _async_handle_time_tick(self, _now: datetime) -> None:
+        if self.data is None or not self.snapshot.active:
+            self._async_cancel_time_tick()
+            return
+        for update_callback in list(self._time_listeners):
+            update_callback()
+
+    @callback
+    def _async_cancel_time_tick(self) -> None:
+        if self._unsub_time_tick is not None:
+            self._unsub_time_tick()
+            self._unsub_time_tick = None
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listener registrieren; Kontext eines Orts-Listeners ist das Label."""
+        if context is not None:
+            self._location_labels.add(context)
+        return super().async_add_listener(update_callback, context)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Entitäten aktualisieren und Timer auf die nächste Grenze setzen.
+
+        Entitäten eines Orts werden nur aufgerufen, wenn sich dessen Snapshot
+        oder die Verfügbarkeit geändert hat; bei hunderten Orten bleibt ein
+        Tick so bei einer Prüfung je Ort statt je Entität.
+        """
+        started = time.perf_counter()
+        changed = self._async_changed_locations()
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+        self.metrics.record(METRIC_FANOUT, (time.perf_counter() - started) * 1000)
+        self._async_fire_events()
+        self._async_schedule_boundary()
+        self._async_schedule_time_tick()
+
+    @callback
+    def _async_fire_events(self) -> None:
+        """Neue, geänderte und abgelaufene Warnungen auf den Bus melden."""
+        if self.data is None:
+            return
+        entry_id = self.config_entry.entry_id
+        for event_type, event_data in self.events.diff(self.snapshot):
+            event_data["config_entry"] = entry_id
+            self.hass.bus.async_fire(event_type, event_data)
+
+    @callback
+    def _async_changed_locations(self) -> set[str]:
+        if not self._location_labels:
+            return set()
+        available = self.last_update_success
+        changed: set[str] = set()
+        for label in self._location_labels:
+            snapshot = self.location_snapshot(label)
+            last = self._dispatched.get(label)
+            if last is None or last[0] is not snapshot or last[1] != available:
+                self._dispatched[label] = (snapshot, available)
+                changed.add(label)
+        return changed
+
+    @callback
+    def _async_schedule_boundary(self) -> None:
+        """Genau einen Timer für den nächsten aktiv/zukünftig-Wechsel setzen.
+
+        Die Grenzen kommen aus ``start``/``end`` der Warnungen in ``data``
+        (inkl. durch die Halte-Frist verlängerter Enden).
+        """
+        self._async_cancel_boundary()
+        valid_until = self.snapshot.valid_until
+        if valid_until is None:
+            return
+        self._unsub_boundary = async_track_point_in_utc_time(
+            self.hass,
+            self._async_handle_boundary,
+            datetime.fromtimestamp(valid_until, tz=dt_util.UTC),
+        )
+
+    @callback
+    def _async_handle_boundary(self, _now: datetime) -> None:
+        """Grenze erreicht: Entitäten lokal neu bewerten, ohne HTTP-Abruf."""
+        self._unsub_boundary = None
+        self.async_update_listeners()
+
+    @callback
+    def _async_cancel_boundary(self) -> None:
+        if self._unsub_boundary is not None:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+
+    async def async_shutdown(self) -> None:
+        """Geplante Abrufe und die Timer beenden, Stand sichern."""
+        self._async_cancel_boundary()
+        self._async_cancel_time_tick()
+        await super().async_shutdown()
+        if self._last_successful_data is not None:
+            await self._store.async_save(self._storage_data())
+
+    def _adapt_update_interval(self, data: dict | None, failed: bool) -> None:
+        """Nächstes Intervall aus Warnungslage und API-Zustand ableiten.
+
+        Das eingestellte Scan-Intervall bleibt Obergrenze für schnelles und
+        Untergrenze für langsames Abfragen.
+        """
+        if not self._get_entry_value(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+            return
+        base = int(self._get_entry_value(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        now_ts = int(dt_util.utcnow().timestamp())
+
+        if failed:
+            # Exponentielles Backoff mit Jitter, damit nicht alle gleichzeitig
+            # wieder anfragen; ab der Obergrenze wird nicht weiter gezählt
+            if base << self._error_streak < ADAPTIVE_MAX_INTERVAL:
+                self._error_streak += 1
+            seconds = min(base << self._error_streak, ADAPTIVE_MAX_INTERVAL)
+            seconds *= random.uniform(1 - ADAPTIVE_JITTER, 1 + ADAPTIVE_JITTER)
+            self.set_update_interval(max(base, min(int(seconds), ADAPTIVE_MAX_INTERVAL)))
+            return
+
+        self._error_streak = 0
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.is_current(data, now_ts):
+            snapshot = self._snapshot = WarningSnapshot(data, now_ts)
+        next_start = snapshot.next_start
+        if now_ts - self._last_issued_ts <= ADAPTIVE_ISSUED_HOLD or (
+            next_start is not None and next_start - now_ts <= ADAPTIVE_LEAD_TIME
+        ):
+            seconds = min(ADAPTIVE_FAST_INTERVAL, base)
+        elif not snapshot.active and not snapshot.future:
+            seconds = max(base, min(base * ADAPTIVE_IDLE_FACTOR, ADAPTIVE_MAX_INTERVAL))
+        else:
+            seconds = base
+        self.set_update_interval(seconds)
+
     def set_update_interval(self, seconds: int) -> None:
         """Update-Intervall ändern (falls du später doch Optionen nutzt)."""
         self.update_interval = timedelta(seconds=seconds)
@@ -261,4 +1132,4 @@ class geosphereCoordinator(DataUpdateCoordinator):
         return self.config_entry.options.get(
             key, self.config_entry.data.get(key, default)
         )
-
+
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_EXTRA_COORDS, DATA_FETCHER
+from .coordinator import REGIONS_HEALTH_LABEL, geosphereCoordinator
+
+# Koordinaten verraten Wohn- und Aufenthaltsorte
+TO_REDACT = {CONF_EXTRA_COORDS}
+
+
+def _labels(coordinator: geosphereCoordinator) -> dict[str, str]:
+    """Koordinaten-Label -> Position in den zuletzt abgefragten Koordinaten.
+
+    Eine Zuordnung für alle Abschnitte, damit ``coordinate_<n>`` überall
+    denselben Ort meint. Die Reihenfolge ist die der Abfrage: ``zone.home``
+    (falls abgefragt), Zusatzkoordinaten, verfolgte Positionen.
+    """
+    labels = {
+        f"{lat_val},{lon_val}": f"coordinate_{idx}"
+        for idx, (lat_val, lon_val) in enumerate(coordinator.last_coords)
+    }
+    labels[REGIONS_HEALTH_LABEL] = REGIONS_HEALTH_LABEL
+    return labels
+
+
+def _anonymize(per_label: dict[str, Any], labels: dict[str, str]) -> dict[str, Any]:
+    """Koordinaten-Labels durch ihre Position ersetzen."""
+    result: dict[str, Any] = {}
+    for label, value in per_label.items():
+        # Nicht mehr abgefragte Koordinaten (werden im nächsten Zyklus entfernt)
+        name = labels.get(label) or f"coordinate_stale_{len(result)}"
+        result[name] = value
+    return result
+
+
+def _anonymized_response(coordinator: geosphereCoordinator) -> str | None:
+    """``last_http_response`` mit Positionen statt Ortsnamen."""
+    if not coordinator.last_errors:
+        # Ohne Abruf-Fehler steht dort nur ein Hinweis zu zone.home o.ä.
+        return coordinator.last_http_response
+    return "; ".join(
+        f"coordinate_{idx}: {error}" for idx, error in coordinator.last_errors
+    )
+
+
+def _without_locations(bucket: dict[str, Any]) -> dict[str, Any]:
+    bucket["details"] = [
+        {key: value for key, value in item.items() if key != "locations"}
+        for item in bucket["details"]
+    ]
+    return bucket
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Diagnose-Download: Messwerte, Zustand je Koordinate und Zähler."""
+    coordinator: geosphereCoordinator = hass.data[DOMAIN][entry.entry_id][
+        "coordinator"
+    ]
+    metrics = coordinator.metrics.as_dict()
+    warnings = (coordinator.data or {}).get("properties", {}).get("warnings", [])
+    snapshot = coordinator.snapshot
+    labels = _labels(coordinator)
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "update": {
+            "last_update_success": coordinator.last_update_success,
+            "last_http_status": coordinator.last_http_status,
+            "last_http_response": _anonymized_response(coordinator),
+            "had_partial_failure": coordinator.had_partial_failure,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval is not None
+                else None
+            ),
+            "setup_duration": coordinator.setup_duration,
+            "warnings": len(warnings),
+        },
+        "metrics": {
+            "cycle": metrics["cycle"],
+            "per_coordinate": _anonymize(metrics["per_coordinate"], labels),
+        },
+        "coordinate_health": _anonymize(
+            {
+                label: health.as_dict()
+                for label, health in coordinator.coordinate_health.items()
+            },
+            labels,
+        ),
+        "change_detection": {
+            "hits": coordinator.unchanged_responses,
+            "misses": coordinator.changed_responses,
+            "unchanged_cycles": coordinator.unchanged_cycles,
+        },
+        "grace_cache": coordinator.grace_cache.stats(),
+        "coordinate_cache": coordinator.coordinate_cache_stats(),
+        # Verfolgte Zonen/Personen (ohne Positionen)
+        "tracking": coordinator.tracker.stats(),
+        # Gefeuerte Lebenszyklus-Events je Event-Typ
+        "events_fired": dict(coordinator.events.fired),
+        # Nicht aufgezeichnete Attribute der Summen-Sensoren (ohne Ortsnamen)
+        "warnings": {
+            "active": _without_locations(snapshot.active.as_dict()),
+            "upcoming": _without_locations(snapshot.future.as_dict()),
+        },
+        # Gemeinsame Abfrage-Schicht aller Einträge
+        "shared_fetcher": (
+            hass.data[DATA_FETCHER].as_dict() if DATA_FETCHER in hass.data else None
+        ),
+        "state_writes": {
+            "written": coordinator.state_writes,
+            "suppressed": coordinator.suppressed_writes,
+        },
+    }
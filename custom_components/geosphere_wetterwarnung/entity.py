@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, CONF_NAME
+from .coordinator import geosphereCoordinator
+from .snapshot import WarningSnapshot
+
+
+class GeosphereEntity(CoordinatorEntity):
+    """Basis für alle Entitäten: gemeinsames Gerät und Schreiben nur bei Änderung.
+
+    Mit ``location`` ("lat,lon") gehört die Entität zum Gerät dieses Orts und
+    wertet nur dessen Warnungen aus (Modus "je Ort"). Der Ort ist der Kontext
+    des Listeners; der Koordinator ruft ihn nur auf, wenn sich der Ort
+    geändert hat.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: geosphereCoordinator,
+        entry_id: str,
+        location: str | None = None,
+        location_name: str | None = None,
+    ):
+        super().__init__(coordinator, context=location)
+        self._entry_id = entry_id
+        self._location = location
+        self._location_name = location_name
+        # Präfix der unique_id; ohne Ort wie bisher nur die Entry-ID
+        self._id_prefix = entry_id if location is None else f"{entry_id}_{location}"
+        self._last_fingerprint: tuple[Any, ...] | None = None
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        if self._location is not None:
+            return DeviceInfo(
+                identifiers={(DOMAIN, self._id_prefix)},
+                name=f"GeoSphere {self._location_name or self._location}",
+                manufacturer="ZAMG / Geosphere Austria",
+                via_device=(DOMAIN, self._entry_id),
+            )
+        # Je Eintrag ein Gerät; der Name unterscheidet mehrere Einträge
+        device_name = "GeoSphere Wetterwarnungen"
+        if name := self.coordinator.config_entry.data.get(CONF_NAME):
+            device_name = f"{device_name} {name}"
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry_id)},
+            name=device_name,
+            manufacturer="ZAMG / Geosphere Austria",
+        )
+
+    @property
+    def snapshot(self) -> WarningSnapshot:
+        """Snapshot des Eintrags bzw. des Orts dieser Entität."""
+        if self._location is None:
+            return self.coordinator.snapshot
+        return self.coordinator.location_snapshot(self._location)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Entspricht dem State, den Home Assistant beim Hinzufügen schreibt
+        self._last_fingerprint = self._state_fingerprint()
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Alles, was im geschriebenen State landet."""
+        return (
+            self.available,
+            self.state,
+            self.icon,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """State nur schreiben, wenn sich Zustand oder Attribute geändert haben."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_fingerprint:
+            self.coordinator.suppressed_writes += 1
+            return
+        self._last_fingerprint = fingerprint
+        self.coordinator.state_writes += 1
+        self.async_write_ha_state()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    EVENT_WARNING_EXPIRED,
+    EVENT_WARNING_ISSUED,
+    EVENT_WARNING_LEVEL_CHANGED,
+    EVENT_WARNING_UPDATED,
+    WARNING_TYPES,
+)
+from .model import WarningRecord
+from .snapshot import WarningSnapshot
+
+
+def _iso(ts: int) -> str:
+    return dt_util.as_local(datetime.fromtimestamp(ts, tz=dt_util.UTC)).isoformat()
+
+
+class WarningEvents:
+    """Lebenszyklus der Warnungen aus dem Vergleich zweier Snapshots.
+
+    Verglichen werden die aktiven und zukünftigen Warnungen je Key. Der erste
+    Snapshot (bzw. der wiederhergestellte Stand) ist nur die Basis. Ein durch
+    die Halte-Frist verlängertes Ende gilt nicht als Änderung.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: WarningSnapshot | None = None
+        self._warnings: Dict[str, WarningRecord] | None = None
+        # Anzahl gefeuerter Events je Event-Typ
+        self.fired: Dict[str, int] = {}
+
+    def prime(self, snapshot: WarningSnapshot) -> None:
+        """Basis setzen, ohne Events zu erzeugen."""
+        self._snapshot = snapshot
+        self._warnings = self._index(snapshot)
+
+    def diff(self, snapshot: WarningSnapshot) -> List[Tuple[str, dict[str, Any]]]:
+        """Events seit dem letzten Snapshot als (Event-Typ, Daten)."""
+        if snapshot is self._snapshot:
+            return []
+        previous = self._warnings
+        previous_snapshot = self._snapshot
+        current = self._index(snapshot)
+        self._snapshot = snapshot
+        self._warnings = current
+        if previous is None:
+            return []
+
+        now_ts = snapshot.built_ts
+        changes: List[Tuple[str, WarningRecord, WarningRecord | None]] = []
+        for key, warning in current.items():
+            old = previous.get(key)
+            if old is None:
+                changes.append((EVENT_WARNING_ISSUED, warning, None))
+            elif old is warning:
+                continue
+            elif old.level != warning.level:
+                changes.append((EVENT_WARNING_LEVEL_CHANGED, warning, old))
+            elif (
+                old.wtype != warning.wtype
+                or old.start != warning.start
+                or old.text != warning.text
+                or (old.end != warning.end and old.end >= now_ts)
+            ):
+                changes.append((EVENT_WARNING_UPDATED, warning, old))
+        for key, old in previous.items():
+            if key not in current:
+                changes.append((EVENT_WARNING_EXPIRED, old, None))
+        if not changes:
+            return []
+
+        locations = self._locations(snapshot)
+        # Abgelaufene Warnungen fehlen in den neuen Daten: Orte aus den alten
+        expired_locations = (
+            self._locations(previous_snapshot)
+            if previous_snapshot is not None
+            and any(change[0] == EVENT_WARNING_EXPIRED for change in changes)
+            else None
+        )
+        events: List[Tuple[str, dict[str, Any]]] = []
+        for event_type, warning, old in changes:
+            data = self._event_data(warning)
+            if old is not None and event_type == EVENT_WARNING_LEVEL_CHANGED:
+                data["previous_level"] = old.level
+            where = (
+                expired_locations if event_type == EVENT_WARNING_EXPIRED else locations
+            )
+            if where is not None:
+                data["locations"] = list(where.get(warning.key, ()))
+            events.append((event_type, data))
+            self.fired[event_type] = self.fired.get(event_type, 0) + 1
+        return events
+
+    @staticmethod
+    def _index(snapshot: WarningSnapshot) -> Dict[str, WarningRecord]:
+        index = {w.key: w for w in snapshot.active.warnings}
+        for w in snapshot.future.warnings:
+            index.setdefault(w.key, w)
+        return index
+
+    @staticmethod
+    def _locations(snapshot: WarningSnapshot) -> Dict[str, tuple] | None:
+        """Key -> meldende Orte (nur bei mehreren Koordinaten)."""
+        props = (snapshot.data or {}).get("properties", {})
+        coordinates = props.get("coordinates")
+        coverage = props.get("coverage")
+        if not coordinates or not coverage:
+            return None
+        return {
+            w.key: tuple(
+                name
+                for idx, name in enumerate(coordinates)
+                if int(mask, 16) >> idx & 1
+            )
+            for w, mask in zip(props.get("warnings") or (), coverage)
+        }
+
+    @staticmethod
+    def _event_data(warning: WarningRecord) -> dict[str, Any]:
+        return {
+            "key": warning.key,
+            "type": WARNING_TYPES.get(warning.wtype, str(warning.wtype)),
+            "wtype": warning.wtype,
+            "level": warning.level,
+            "start": _iso(warning.start),
+            "end": _iso(warning.end),
+            "text": warning.text,
+        }
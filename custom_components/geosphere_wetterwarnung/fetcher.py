@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+import zlib
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+from aiohttp.hdrs import ACCEPT, ACCEPT_ENCODING, CONTENT_ENCODING, USER_AGENT
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    DATA_FETCHER,
+    DOMAIN,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_READ_TIMEOUT,
+    HTTP_USER_AGENT_URL,
+    REQUEST_TIMEOUT,
+    SHARED_CACHE_EVICT_INTERVAL,
+    SHARED_CACHE_TTL,
+)
+
+Decoder = Callable[[bytes], Awaitable[Any]]
+
+# gzip und zlib/deflate (automatische Erkennung am Header); manche Server
+# senden "deflate" ohne zlib-Header
+_ZLIB_WBITS = 47
+_RAW_DEFLATE_WBITS = -15
+
+
+@callback
+def async_get_fetcher(hass: HomeAssistant) -> SharedFetcher:
+    """Gemeinsame Abfrage-Schicht aller Config-Entries (wird bei Bedarf angelegt)."""
+    fetcher = hass.data.get(DATA_FETCHER)
+    if fetcher is None:
+        fetcher = hass.data[DATA_FETCHER] = SharedFetcher(hass)
+    return fetcher
+
+
+class SharedFetcher:
+    """Eine HTTP-Abfrage je URL, geteilt von allen Koordinatoren.
+
+    Läuft für eine URL bereits eine Abfrage, warten weitere Aufrufer auf
+    deren Ergebnis. Ist das letzte erfolgreiche Ergebnis jünger als
+    ``max_age``, wird es ohne Abfrage zurückgegeben. ETag/Last-Modified und
+    Body-Hash sorgen dafür, dass unveränderte Antworten nicht neu dekodiert
+    werden; ob sich etwas geändert hat, entscheidet jeder Koordinator selbst
+    anhand von ``digest``.
+
+    Abgefragt wird über eine eigene ``ClientSession`` statt der geteilten von
+    Home Assistant: Keep-Alive länger als das Scan-Intervall, Verbindungs-
+    limit je Host, DNS-Cache, komprimierte Übertragung, getrennte Timeouts
+    für Verbindungsaufbau und Lesen und ein eigener User-Agent.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        # url -> etag, last_modified, digest, payload, status, fetched_at, last_used
+        self._cache: dict[str, dict] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._last_evict = time.monotonic()
+        self._session: aiohttp.ClientSession | None = None
+        self._unsub_close: CALLBACK_TYPE | None = None
+        # Ausgeführte HTTP-Abfragen / ohne eigene Abfrage bediente Aufrufe
+        self.requests: int = 0
+        self.shared: int = 0
+        # Neue / wiederverwendete Verbindungen, DNS-Cache, übertragene
+        # (ggf. komprimierte) und entpackte Bytes
+        self.connections_created: int = 0
+        self.connections_reused: int = 0
+        self.dns_cache_hits: int = 0
+        self.dns_cache_misses: int = 0
+        self.wire_bytes: int = 0
+        self.body_bytes: int = 0
+
+    async def async_fetch(
+        self, url: str, decode: Decoder, max_age: float, force: bool = False
+    ) -> dict:
+        """URL abfragen oder ein geteiltes Ergebnis liefern.
+
+        Ergebnis: ``status``, ``payload``, ``error``, ``digest``, ``shared``
+        und ``duration``; bei eigener Abfrage zusätzlich ``bytes`` und (falls
+        dekodiert wurde) ``decode_time``. Mit ``force`` wird ohne ``max_age``,
+        ETag und Body-Hash abgefragt und immer dekodiert (Profil-Läufe).
+        """
+        started = time.monotonic()
+        self._evict(started)
+
+        cached = self._cache.get(url)
+        if cached is not None:
+            cached["last_used"] = started
+        if (
+            not force
+            and cached is not None
+            and started - cached["fetched_at"] < max_age
+        ):
+            self.shared += 1
+            return {
+                "status": cached["status"],
+                "payload": cached["payload"],
+                "error": None,
+                "digest": cached["digest"],
+                "shared": True,
+                # Keine Abfrage, daher auch keine Latenz
+                "duration": None,
+            }
+
+        task = self._inflight.get(url)
+        shared = task is not None
+        if task is None:
+            task = self._inflight[url] = asyncio.create_task(
+                self._async_request(url, decode, force)
+            )
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        else:
+            self.shared += 1
+
+        # Abbruch eines Aufrufers (z.B. dessen Deadline) beendet nicht die
+        # Abfrage, auf die andere Koordinatoren noch warten.
+        result = dict(await asyncio.shield(task))
+        if shared:
+            result.pop("bytes", None)
+            result.pop("decode_time", None)
+        result["shared"] = shared
+        result["duration"] = round(time.monotonic() - started, 3)
+        return result
+
+    async def _async_request(self, url: str, decode: Decoder, force: bool) -> dict:
+        cached = None if force else self._cache.get(url)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        self.requests += 1
+        session = self._async_session()
+        result: dict = {"status": None, "payload": None, "error": None, "digest": None}
+        try:
+            try:
+                resp = await session.get(url, headers=headers)
+            except aiohttp.ServerDisconnectedError:
+                # Keep-Alive-Verbindung wurde vom Server geschlossen: einmal
+                # über eine neue Verbindung wiederholen
+                resp = await session.get(url, headers=headers)
+            async with resp:
+                status = resp.status
+                result["status"] = status
+
+                if status == 304 and cached is not None:
+                    # Für den API-Status wie eine erfolgreiche Antwort behandeln
+                    result["status"] = 200
+                    result["payload"] = cached["payload"]
+                    result["digest"] = cached["digest"]
+                    etag = cached.get("etag")
+                    last_modified = cached.get("last_modified")
+                elif status != 200:
+                    try:
+                        text = (await self._async_read(resp)).decode(
+                            resp.get_encoding(), "replace"
+                        )
+                    except Exception:  # noqa: BLE001
+                        text = "<no body>"
+                    result["error"] = f"HTTP {status} {text}"
+                    return result
+                else:
+                    body = await self._async_read(resp)
+                    result["bytes"] = len(body)
+                    digest = hashlib.sha1(body).digest()
+                    result["digest"] = digest
+                    if cached is not None and cached["digest"] == digest:
+                        result["payload"] = cached["payload"]
+                    else:
+                        decode_started = time.perf_counter()
+                        result["payload"] = await decode(body)
+                        result["decode_time"] = (
+                            time.perf_counter() - decode_started
+                        ) * 1000
+                    etag = resp.headers.get("ETag")
+                    last_modified = resp.headers.get("Last-Modified")
+
+        except Exception as err:  # noqa: BLE001
+            result["error"] = repr(err)
+            return result
+
+        self._cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "digest": result["digest"],
+            "payload": result["payload"],
+            "status": result["status"],
+            "fetched_at": time.monotonic(),
+            "last_used": time.monotonic(),
+        }
+        return result
+
+    async def _async_read(self, resp: aiohttp.ClientResponse) -> bytes:
+        """Body lesen und entpacken; zählt übertragene und entpackte Bytes."""
+        raw = await resp.read()
+        self.wire_bytes += len(raw)
+        encoding = resp.headers.get(CONTENT_ENCODING, "").lower()
+        if encoding in ("gzip", "deflate"):
+            try:
+                body = zlib.decompress(raw, _ZLIB_WBITS)
+            except zlib.error:
+                if encoding != "deflate":
+                    raise
+                body = zlib.decompress(raw, _RAW_DEFLATE_WBITS)
+        else:
+            body = raw
+        self.body_bytes += len(body)
+        return body
+
+    @callback
+    def _async_session(self) -> aiohttp.ClientSession:
+        """Eigene Session, beim ersten Abruf angelegt."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._async_count("connections_created"))
+        trace.on_connection_reuseconn.append(self._async_count("connections_reused"))
+        trace.on_dns_cache_hit.append(self._async_count("dns_cache_hits"))
+        trace.on_dns_cache_miss.append(self._async_count("dns_cache_misses"))
+
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_MAX_CONNECTIONS,
+            limit_per_host=HTTP_MAX_CONNECTIONS,
+            keepalive_timeout=HTTP_KEEPALIVE,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            ssl=get_default_context(),
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=REQUEST_TIMEOUT,
+                sock_connect=HTTP_CONNECT_TIMEOUT,
+                sock_read=HTTP_READ_TIMEOUT,
+            ),
+            headers={
+                USER_AGENT: f"{SERVER_SOFTWARE} {DOMAIN} (+{HTTP_USER_AGENT_URL})",
+                ACCEPT: "application/json",
+                ACCEPT_ENCODING: "gzip, deflate",
+            },
+            # Selbst entpacken, um die übertragenen Bytes zu zählen
+            auto_decompress=False,
+            trace_configs=[trace],
+        )
+        if self._unsub_close is None:
+            self._unsub_close = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_handle_close
+            )
+        return self._session
+
+    def _async_count(self, counter: str) -> Callable[..., Awaitable[None]]:
+        async def _count(
+            _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+        ) -> None:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+        return _count
+
+    async def _async_handle_close(self, _event: Event) -> None:
+        self._unsub_close = None
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Session schließen (letzter Eintrag entladen bzw. HA beendet)."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _evict(self, now: float) -> None:
+        """URLs vergessen, die länger nicht mehr abgefragt wurden."""
+        if now - self._last_evict < SHARED_CACHE_EVICT_INTERVAL:
+            return
+        self._last_evict = now
+        for url in [
+            url
+            for url, cached in self._cache.items()
+            if now - cached["last_used"] > SHARED_CACHE_TTL
+        ]:
+            del self._cache[url]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "shared": self.shared,
+            "cached_urls": len(self._cache),
+            "in_flight": len(self._inflight),
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+            "wire_bytes": self.wire_bytes,
+            "body_bytes": self.body_bytes,
+        }
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from math import cos, radians
+from typing import Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def _bounds(
+    lat: float, lon: float, precision: int
+) -> Tuple[str, float, float, float, float]:
+    """Geohash und Grenzen (lat_min, lat_max, lon_min, lon_max) der Zelle."""
+    lat_min, lat_max = -90.0, 90.0
+    lon_min, lon_max = -180.0, 180.0
+    chars = []
+    bits = 0
+    value = 0
+    even = True  # Bits abwechselnd Länge, Breite (Länge zuerst)
+    while len(chars) < precision:
+        if even:
+            mid = (lon_min + lon_max) / 2
+            if lon >= mid:
+                value = value << 1 | 1
+                lon_min = mid
+            else:
+                value <<= 1
+                lon_max = mid
+        else:
+            mid = (lat_min + lat_max) / 2
+            if lat >= mid:
+                value = value << 1 | 1
+                lat_min = mid
+            else:
+                value <<= 1
+                lat_max = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars), lat_min, lat_max, lon_min, lon_max
+
+
+def encode(lat: float, lon: float, precision: int) -> str:
+    """Geohash mit ``precision`` Zeichen."""
+    return _bounds(lat, lon, precision)[0]
+
+
+def cell_center(lat: float, lon: float, precision: int) -> Tuple[float, float]:
+    """Mittelpunkt der Geohash-Zelle, auf 6 Nachkommastellen gerundet.
+
+    Alle Punkte einer Zelle liefern exakt dieselben Werte und damit dieselbe
+    Abfrage-URL.
+    """
+    _, lat_min, lat_max, lon_min, lon_max = _bounds(lat, lon, precision)
+    return round((lat_min + lat_max) / 2, 6), round((lon_min + lon_max) / 2, 6)
+
+
+def cell_size(lat: float, precision: int) -> Tuple[float, float]:
+    """Ungefähre Zellgröße (Höhe, Breite) in Metern auf Breitengrad ``lat``."""
+    lon_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    height = 180 / 2**lat_bits * 111_320
+    width = 360 / 2**lon_bits * 111_320 * cos(radians(lat))
+    return round(height), round(width)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import heapq
+from typing import Any, Iterator, Tuple
+
+from .model import WarningRecord
+
+# Ablaufzeit für gehaltene Warnungen, die sofort verfallen
+_EXPIRED = -1
+
+
+class GraceCache:
+    """Zuletzt gemeldete Warnungen samt Halte-Frist, nach Ablaufzeit sortiert.
+
+    Aktuell gemeldete Warnungen verfallen nicht. Wird eine Warnung nicht mehr
+    gemeldet, kommt sie mit ihrer Ablaufzeit (letzte Meldung bzw. Ende plus
+    Halte-Frist, das Frühere) in einen Heap; ``expire`` arbeitet nur die
+    abgelaufenen Einträge ab. Über ``max_entries`` werden die gehaltenen
+    Warnungen mit der frühesten Ablaufzeit verdrängt. Um die Halte-Frist
+    verlängerte Kopien werden je Warnung wiederverwendet.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        # key -> {"warning": WarningRecord, "last_seen_ts"}
+        self._entries: dict[str, dict] = {}
+        # Nicht mehr gemeldete Warnungen: key -> Ablaufzeit
+        self._held: dict[str, int] = {}
+        # (Ablaufzeit, key); veraltete Einträge werden beim Entnehmen verworfen
+        self._heap: list[Tuple[int, str]] = []
+        self._grace_seconds: int | None = None
+        # key -> (Warnung, neues Ende, verlängerte Kopie)
+        self._extended: dict[str, Tuple[WarningRecord, int, WarningRecord]] = {}
+        self.expired: int = 0
+        self.evicted: int = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def seen(self, key: str, warning: WarningRecord, now_ts: int) -> None:
+        """Warnung ist in der aktuellen Antwort enthalten."""
+        self._entries[key] = {"warning": warning, "last_seen_ts": now_ts}
+        self._held.pop(key, None)
+
+    def release(self, key: str, last_seen_ts: int) -> None:
+        """Warnung wird nicht mehr gemeldet; ab jetzt läuft die Halte-Frist."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry["last_seen_ts"] = last_seen_ts
+        self._hold(key, entry)
+
+    def expire(self, now_ts: int, grace_seconds: int) -> None:
+        """Abgelaufene gehaltene Warnungen entfernen und die Größe begrenzen."""
+        if grace_seconds != self._grace_seconds:
+            # Neue Halte-Frist (oder geladener Stand): Ablaufzeiten neu berechnen
+            self._grace_seconds = grace_seconds
+            self._heap = []
+            for key in self._held:
+                self._hold(key, self._entries[key])
+        heap = self._heap
+        while heap and heap[0][0] < now_ts:
+            if self._pop_held():
+                self.expired += 1
+        while len(self._entries) > self.max_entries and heap:
+            if self._pop_held():
+                self.evicted += 1
+
+    def held(self) -> Iterator[Tuple[str, WarningRecord]]:
+        """Gehaltene (nicht mehr gemeldete) Warnungen in Einfüge-Reihenfolge."""
+        entries = self._entries
+        for key in self._held:
+            yield key, entries[key]["warning"]
+
+    def extend(
+        self,
+        key: str,
+        warning: WarningRecord,
+        now_ts: int,
+        grace_seconds: int,
+        allow_invalid_end: bool,
+    ) -> WarningRecord | None:
+        """Warnung mit um die Halte-Frist verlängertem Ende, oder ``None``.
+
+        Verlängert wird schon vor dem Ende: Snapshot und Grenz-Timer sehen
+        so dasselbe Ende wie der Cache, und die Warnung endet genau einmal,
+        wenn ihre Halte-Frist abläuft (statt am API-Ende kurz zu verschwinden
+        und beim nächsten Abruf gehalten wiederzukommen).
+        """
+        end_ts = warning.end
+        if end_ts <= 0:
+            return warning if allow_invalid_end else None
+        new_end = end_ts + max(grace_seconds, 0)
+        if now_ts > new_end:
+            return None
+        if new_end == end_ts:
+            return warning
+        cached = self._extended.get(key)
+        if cached is not None and cached[0] is warning and cached[1] == new_end:
+            return cached[2]
+        copy = warning.with_end(new_end)
+        self._extended[key] = (warning, new_end, copy)
+        return copy
+
+    def load(self, entries: dict[str, dict]) -> None:
+        """Gespeicherten Stand übernehmen; alle Einträge gelten als gehalten."""
+        self._entries = {
+            key: {
+                "warning": WarningRecord.from_stored(entry.get("warning") or {}),
+                "last_seen_ts": entry.get("last_seen_ts", 0),
+            }
+            for key, entry in entries.items()
+        }
+        self._held = dict.fromkeys(self._entries, _EXPIRED)
+        self._heap = []
+        self._grace_seconds = None
+        self._extended = {}
+
+    def as_dict(self) -> dict[str, dict]:
+        """Einträge im Format des gespeicherten Stands."""
+        return {
+            key: {
+                "warning": entry["warning"].as_dict(),
+                "last_seen_ts": entry["last_seen_ts"],
+            }
+            for key, entry in self._entries.items()
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "held": len(self._held),
+            "max_entries": self.max_entries,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+    def _hold(self, key: str, entry: dict) -> None:
+        expires = self._expiry(entry)
+        self._held[key] = expires
+        if self._grace_seconds is not None:
+            heapq.heappush(self._heap, (expires, key))
+
+    def _expiry(self, entry: dict) -> int:
+        grace_seconds = self._grace_seconds or 0
+        last_seen_ts = entry.get("last_seen_ts", 0)
+        end_ts = entry["warning"].end
+        if grace_seconds <= 0 or not last_seen_ts or end_ts <= 0:
+            return _EXPIRED
+        return min(last_seen_ts, end_ts) + grace_seconds
+
+    def _pop_held(self) -> bool:
+        """Frühesten Heap-Eintrag entnehmen; ``True``, wenn er noch galt."""
+        expires, key = heapq.heappop(self._heap)
+        if self._held.get(key) != expires:
+            return False
+        del self._held[key]
+        del self._entries[key]
+        self._extended.pop(key, None)
+        return True
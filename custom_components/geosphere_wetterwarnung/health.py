@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_OPEN_SECONDS,
+    BREAKER_MAX_OPEN_SECONDS,
+)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CoordinateHealth:
+    """Zustand und Circuit-Breaker einer abgefragten Koordinate.
+
+    closed: normal abfragen. Nach ``BREAKER_FAILURE_THRESHOLD`` Fehlern in
+    Folge -> open: bis ``open_until`` überspringen. Danach half_open: eine
+    Probe-Abfrage; Erfolg schließt, Fehler öffnet erneut mit doppelter Dauer.
+    """
+
+    __slots__ = (
+        "state",
+        "consecutive_failures",
+        "last_latency",
+        "last_error",
+        "last_success_ts",
+        "open_until",
+        "_open_seconds",
+    )
+
+    def __init__(self) -> None:
+        self.state: str = STATE_CLOSED
+        self.consecutive_failures: int = 0
+        self.last_latency: float | None = None
+        self.last_error: str | None = None
+        self.last_success_ts: int | None = None
+        self.open_until: int | None = None
+        self._open_seconds: int = BREAKER_OPEN_SECONDS
+
+    def allow_request(self, now_ts: int) -> bool:
+        """Darf die Koordinate in diesem Zyklus abgefragt werden?"""
+        if self.state == STATE_OPEN:
+            if self.open_until is not None and now_ts < self.open_until:
+                return False
+            self.state = STATE_HALF_OPEN
+        return True
+
+    def record_success(self, latency: float | None, now_ts: int) -> None:
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.last_latency = latency
+        self.last_error = None
+        self.last_success_ts = now_ts
+        self.open_until = None
+        self._open_seconds = BREAKER_OPEN_SECONDS
+
+    def record_failure(self, error: str, latency: float | None, now_ts: int) -> None:
+        self.consecutive_failures += 1
+        self.last_latency = latency
+        self.last_error = error
+        if self.state == STATE_HALF_OPEN:
+            # Probe fehlgeschlagen: länger offen lassen
+            self._open_seconds = min(self._open_seconds * 2, BREAKER_MAX_OPEN_SECONDS)
+        elif self.consecutive_failures < BREAKER_FAILURE_THRESHOLD:
+            return
+        self.state = STATE_OPEN
+        self.open_until = now_ts + self._open_seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "last_latency": self.last_latency,
+            "last_error": self.last_error,
+            "open_until": (
+                dt_util.as_local(
+                    datetime.fromtimestamp(self.open_until, tz=dt_util.UTC)
+                ).isoformat()
+                if self.open_until is not None
+                else None
+            ),
+        }
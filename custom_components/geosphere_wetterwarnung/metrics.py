@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Iterable
+
+from .const import METRICS_WINDOW
+
+# Messgrößen je Zyklus (Millisekunden bzw. Bytes)
+METRIC_CYCLE = "cycle_duration"
+METRIC_REQUEST_LATENCY = "request_latency"
+METRIC_RESPONSE_BYTES = "response_bytes"
+METRIC_DECODE_TIME = "decode_time"
+METRIC_GRACE_MERGE = "grace_merge_time"
+METRIC_FANOUT = "fanout_time"
+
+CYCLE_METRICS = (
+    METRIC_CYCLE,
+    METRIC_REQUEST_LATENCY,
+    METRIC_RESPONSE_BYTES,
+    METRIC_DECODE_TIME,
+    METRIC_GRACE_MERGE,
+    METRIC_FANOUT,
+)
+# Je Koordinate werden nur die Messgrößen einer Abfrage geführt
+REQUEST_METRICS = (METRIC_REQUEST_LATENCY, METRIC_RESPONSE_BYTES, METRIC_DECODE_TIME)
+
+
+class RollingStat:
+    """Die letzten ``METRICS_WINDOW`` Werte mit p50/p95/max."""
+
+    __slots__ = ("_values", "count", "last")
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        self._values: deque[float] = deque(maxlen=window)
+        self.count: int = 0
+        self.last: float | None = None
+
+    def record(self, value: float) -> None:
+        self._values.append(value)
+        self.count += 1
+        self.last = value
+
+    def percentile(self, pct: float) -> float | None:
+        if not self._values:
+            return None
+        ordered = sorted(self._values)
+        return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "last": _round(self.last),
+            "p50": _round(self.percentile(50)),
+            "p95": _round(self.percentile(95)),
+            "max": _round(max(self._values)) if self._values else None,
+            "count": self.count,
+        }
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
+
+
+class UpdateMetrics:
+    """Rollierende Messwerte des Koordinators: je Zyklus und je Koordinate."""
+
+    __slots__ = ("cycle", "per_coordinate")
+
+    def __init__(self) -> None:
+        self.cycle: dict[str, RollingStat] = {
+            name: RollingStat() for name in CYCLE_METRICS
+        }
+        self.per_coordinate: dict[str, dict[str, RollingStat]] = {}
+
+    def record(self, name: str, value: float) -> None:
+        self.cycle[name].record(value)
+
+    def record_request(
+        self,
+        label: str,
+        latency_ms: float | None,
+        response_bytes: int | None,
+        decode_ms: float | None,
+    ) -> None:
+        """Messwerte einer Abfrage für den Zyklus und die Koordinate merken."""
+        stats = self.per_coordinate.get(label)
+        if stats is None:
+            stats = self.per_coordinate[label] = {
+                name: RollingStat() for name in REQUEST_METRICS
+            }
+        for name, value in (
+            (METRIC_REQUEST_LATENCY, latency_ms),
+            (METRIC_RESPONSE_BYTES, response_bytes),
+            (METRIC_DECODE_TIME, decode_ms),
+        ):
+            if value is not None:
+                self.cycle[name].record(value)
+                stats[name].record(value)
+
+    def prune(self, labels: Iterable[str]) -> None:
+        """Nur aktuelle Koordinaten behalten, in deren Reihenfolge."""
+        self.per_coordinate = {
+            label: self.per_coordinate[label]
+            for label in labels
+            if label in self.per_coordinate
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "cycle": {name: stat.as_dict() for name, stat in self.cycle.items()},
+            "per_coordinate": {
+                label: {name: stat.as_dict() for name, stat in stats.items()}
+                for label, stats in self.per_coordinate.items()
+            },
+        }
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+try:
+    # Mit Home Assistant immer vorhanden; etwa doppelt so schnell wie ``json``
+    from orjson import loads as json_loads
+except ImportError:  # nur außerhalb von Home Assistant (Benchmarks)
+    from json import loads as json_loads
+
+
+def _to_int(value: Any) -> int:
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _warning_key(raw: dict[str, Any]) -> str:
+    for key in ("id", "awcode", "warnid", "wcode"):
+        val = raw.get(key)
+        if val:
+            return f"{key}:{val}"
+    return "|".join(
+        [
+            str(raw.get("wtype", "")),
+            str(raw.get("wlevel", "")),
+            str(raw.get("start", "")),
+            str(raw.get("end", "")),
+        ]
+    )
+
+
+class WarningRecord:
+    """Eine Warnung, beim Dekodieren einmal geprüft und umgewandelt.
+
+    Hält nur die ausgewerteten Felder der API-Antwort (``rawinfo`` und
+    ``text``), Zahlen bereits als ``int`` (ungültig -> 0). ``key`` erkennt
+    dieselbe Warnung über Abfragen und Koordinaten hinweg wieder und bleibt
+    auch bei um die Halte-Frist verlängertem Ende gleich.
+    """
+
+    __slots__ = ("key", "wtype", "level", "start", "end", "text")
+
+    def __init__(
+        self, key: str, wtype: int, level: int, start: int, end: int, text: str
+    ) -> None:
+        self.key = key
+        self.wtype = wtype
+        self.level = level
+        self.start = start
+        self.end = end
+        self.text = text
+
+    @classmethod
+    def from_feature(cls, feature: dict[str, Any]) -> WarningRecord:
+        """Warnung aus einem Feature von ``getWarningsForCoords``/``getWarnstatus``."""
+        props = feature.get("properties") or {}
+        raw = props.get("rawinfo") or props
+        get = raw.get
+        text = props.get("text") or ""
+        return cls(
+            _warning_key(raw),
+            _to_int(get("wtype", 0)),
+            _to_int(get("wlevel", 0)),
+            _to_int(get("start", 0)),
+            _to_int(get("end", 0)),
+            text if type(text) is str else str(text),
+        )
+
+    @classmethod
+    def from_stored(cls, stored: dict[str, Any]) -> WarningRecord:
+        """Warnung aus dem gespeicherten Stand (älterer Stand: Roh-Feature)."""
+        if "properties" in stored:
+            return cls.from_feature(stored)
+        return cls(
+            str(stored.get("key", "")),
+            _to_int(stored.get("wtype", 0)),
+            _to_int(stored.get("level", 0)),
+            _to_int(stored.get("start", 0)),
+            _to_int(stored.get("end", 0)),
+            str(stored.get("text") or ""),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Form für den gespeicherten Stand."""
+        return {
+            "key": self.key,
+            "wtype": self.wtype,
+            "level": self.level,
+            "start": self.start,
+            "end": self.end,
+            "text": self.text,
+        }
+
+    def with_end(self, end: int) -> WarningRecord:
+        return WarningRecord(
+            self.key, self.wtype, self.level, self.start, end, self.text
+        )
+
+    def _fields(self) -> tuple:
+        return (self.key, self.wtype, self.level, self.start, self.end, self.text)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WarningRecord):
+            return NotImplemented
+        return self is other or self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        return (
+            f"WarningRecord({self.key!r}, wtype={self.wtype}, level={self.level}, "
+            f"start={self.start}, end={self.end})"
+        )
+
+
+def decode_warnings(body: bytes) -> List[WarningRecord]:
+    """Body von ``getWarningsForCoords`` direkt in Warnungen umwandeln.
+
+    Vom dekodierten JSON wird nur ``properties.warnings`` gelesen; die
+    Roh-Features werden nicht weitergereicht und sind danach freigegeben.
+    """
+    props = json_loads(body).get("properties") or {}
+    from_feature = WarningRecord.from_feature
+    return [from_feature(feature) for feature in props.get("warnings") or ()]
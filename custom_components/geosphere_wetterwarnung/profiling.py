@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    ATTR_CONFIG_ENTRY,
+    ATTR_CYCLES,
+    ATTR_TOP,
+    PROFILE_MAX_CYCLES,
+    PROFILE_DEFAULT_TOP,
+)
+from .coordinator import geosphereCoordinator
+from .services import get_coordinators
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY): cv.string,
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_CYCLES)
+        ),
+        vol.Optional(ATTR_TOP, default=PROFILE_DEFAULT_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+    }
+)
+
+# Es kann nur ein cProfile gleichzeitig aktiv sein
+_RUNNING_KEY = f"{DOMAIN}_profile_running"
+
+
+def _write_stats(profiler: cProfile.Profile, path: str, top: int) -> list[dict]:
+    """Stats speichern (für snakeviz/pstats) und die teuersten Funktionen liefern."""
+    profiler.dump_stats(path)
+    stats = pstats.Stats(profiler)
+    rows = sorted(
+        stats.stats.items(),  # type: ignore[attr-defined]
+        key=lambda item: item[1][3],
+        reverse=True,
+    )
+    return [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "tottime": round(tottime, 6),
+            "cumtime": round(cumtime, 6),
+        }
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in rows[:top]
+    ]
+
+
+async def async_handle_profile(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """N vollständige Abruf-Zyklen samt Entitäts-Aktualisierung profilen.
+
+    Die Zyklen umgehen gemeinsame Abfrage-Schicht und Änderungserkennung,
+    sonst wären HTTP, Dekodieren und Attribute nicht im Profil. Der
+    Profiler existiert nur während des Aufrufs; außerhalb entsteht kein
+    Overhead.
+    """
+    coordinators: list[geosphereCoordinator] = get_coordinators(
+        hass, call.data.get(ATTR_CONFIG_ENTRY)
+    )
+    cycles: int = call.data[ATTR_CYCLES]
+    if hass.data.get(_RUNNING_KEY):
+        raise HomeAssistantError("A profile run is already active")
+
+    profiler = cProfile.Profile()
+    hass.data[_RUNNING_KEY] = True
+    durations: list[float] = []
+    try:
+        try:
+            profiler.enable()
+        except ValueError as err:
+            # z.B. Profiler-Integration von Home Assistant läuft bereits
+            raise HomeAssistantError(f"Cannot start profiler: {err}") from err
+        try:
+            for _ in range(cycles):
+                for coordinator in coordinators:
+                    started = time.perf_counter()
+                    await coordinator.async_refresh_uncached()
+                    durations.append(round(time.perf_counter() - started, 4))
+        finally:
+            profiler.disable()
+    finally:
+        hass.data.pop(_RUNNING_KEY, None)
+
+    path = hass.config.path(
+        f"{DOMAIN}_profile_{dt_util.utcnow().strftime('%Y%m%d_%H%M%S')}.prof"
+    )
+    top_functions = await hass.async_add_executor_job(
+        _write_stats, profiler, path, call.data[ATTR_TOP]
+    )
+    response: dict[str, Any] = {
+        "file": path,
+        "cycles": cycles,
+        "cycle_durations": durations,
+        "top_functions": top_functions,
+    }
+    return response
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable, List, Sequence, Tuple
+
+from .model import WarningRecord, json_loads
+
+# Kantenlänge einer Gitterzelle in Grad
+GRID_SIZE = 0.1
+
+_Ring = Sequence[Sequence[float]]
+_Polygon = Sequence[_Ring]
+
+def _polygons(geometry: dict[str, Any] | None) -> List[_Polygon]:
+    if not geometry:
+        return []
+    gtype = geometry.get("type")
+    coordinates = geometry.get("coordinates") or []
+    if gtype == "Polygon":
+        return [coordinates]
+    if gtype == "MultiPolygon":
+        return list(coordinates)
+    if gtype == "GeometryCollection":
+        result: List[_Polygon] = []
+        for part in geometry.get("geometries") or []:
+            result.extend(_polygons(part))
+        return result
+    return []
+
+
+def _point_in_polygon(lon: float, lat: float, polygon: _Polygon) -> bool:
+    """Even-odd-Regel über Außenring und Löcher."""
+    inside = False
+    for ring in polygon:
+        count = len(ring)
+        if count < 3:
+            continue
+        x1, y1 = ring[count - 1][0], ring[count - 1][1]
+        for point in ring:
+            x2, y2 = point[0], point[1]
+            if (y2 > lat) != (y1 > lat):
+                x_cross = x2 + (lat - y2) * (x1 - x2) / (y1 - y2)
+                if lon < x_cross:
+                    inside = not inside
+            x1, y1 = x2, y2
+    return inside
+
+
+def _bbox(polygons: Iterable[_Polygon]) -> Tuple[float, float, float, float] | None:
+    min_lon = min_lat = math.inf
+    max_lon = max_lat = -math.inf
+    for polygon in polygons:
+        for ring in polygon[:1]:
+            for point in ring:
+                lon, lat = point[0], point[1]
+                min_lon = min(min_lon, lon)
+                max_lon = max(max_lon, lon)
+                min_lat = min(min_lat, lat)
+                max_lat = max(max_lat, lat)
+    if min_lon is math.inf:
+        return None
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def _cell(value: float) -> int:
+    return math.floor(value / GRID_SIZE)
+
+
+class RegionIndex:
+    """Gitter-Index über die Warnregionen aus ``getWarnstatus``.
+
+    Koordinaten werden lokal per Punkt-in-Polygon-Test ihren Warnungen
+    zugeordnet. Ohne Home-Assistant-Abhängigkeiten, läuft im Executor.
+    """
+
+    __slots__ = ("_regions", "_grid")
+
+    def __init__(self, collection: dict[str, Any]):
+        # (Bounding-Box, Polygone, Warnung) je Region
+        self._regions: list[
+            tuple[Tuple[float, float, float, float], List[_Polygon], WarningRecord]
+        ] = []
+        self._grid: dict[tuple[int, int], list[int]] = {}
+
+        for feature in collection.get("features", []) or []:
+            polygons = _polygons(feature.get("geometry"))
+            bbox = _bbox(polygons)
+            if bbox is None:
+                continue
+            idx = len(self._regions)
+            self._regions.append((bbox, polygons, WarningRecord.from_feature(feature)))
+            min_lon, min_lat, max_lon, max_lat = bbox
+            for cx in range(_cell(min_lon), _cell(max_lon) + 1):
+                for cy in range(_cell(min_lat), _cell(max_lat) + 1):
+                    self._grid.setdefault((cx, cy), []).append(idx)
+
+    @classmethod
+    def from_body(cls, body: bytes) -> RegionIndex:
+        """Index direkt aus dem HTTP-Body bauen (für den Executor)."""
+        return cls(json_loads(body))
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def warnings_for(self, lat: float, lon: float) -> list[WarningRecord]:
+        """Alle Warnungen der Regionen, in denen der Punkt liegt."""
+        result: list[WarningRecord] = []
+        for idx in self._grid.get((_cell(lon), _cell(lat)), ()):
+            (min_lon, min_lat, max_lon, max_lat), polygons, warning = self._regions[
+                idx
+            ]
+            if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+                continue
+            if any(_point_in_polygon(lon, lat, polygon) for polygon in polygons):
+                result.append(warning)
+        return result
+
+    def resolve(
+        self, coords: Sequence[Tuple[float, float]]
+    ) -> list[list[WarningRecord]]:
+        """Warnungen für viele Koordinaten (lat, lon) auf einmal."""
+        return [self.warnings_for(lat, lon) for lat, lon in coords]
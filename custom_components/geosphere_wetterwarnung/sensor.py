@@ -3,12 +3,15 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -18,6 +21,25 @@ from .const import (
     ATTR_UNTIL,
 )
 from .coordinator import geosphereCoordinator
+from .entity import GeosphereEntity
+from .metrics import (
+    METRIC_CYCLE,
+    METRIC_DECODE_TIME,
+    METRIC_FANOUT,
+    METRIC_GRACE_MERGE,
+    METRIC_REQUEST_LATENCY,
+    METRIC_RESPONSE_BYTES,
+)
+
+# Diagnose-Sensoren: Messgröße -> (Name, Einheit)
+METRIC_SENSORS = {
+    METRIC_CYCLE: ("Abruf-Zyklus", UnitOfTime.MILLISECONDS),
+    METRIC_REQUEST_LATENCY: ("Abfrage-Latenz", UnitOfTime.MILLISECONDS),
+    METRIC_RESPONSE_BYTES: ("Antwortgröße", UnitOfInformation.BYTES),
+    METRIC_DECODE_TIME: ("Dekodierzeit", UnitOfTime.MILLISECONDS),
+    METRIC_GRACE_MERGE: ("Grace-Merge", UnitOfTime.MILLISECONDS),
+    METRIC_FANOUT: ("Entitäten-Aktualisierung", UnitOfTime.MILLISECONDS),
+}
 
 
 async def async_setup_entry(
@@ -42,76 +64,39 @@ async def async_setup_entry(
             )
         )
 
-    async_add_entities(entities)
-
+    # Modus "je Ort": Level-Sensoren je Koordinate, alle in einem Aufruf
+    if coordinator.per_location:
+        for location, location_name in coordinator.configured_locations().items():
+            for wtype in WARNING_TYPES:
+                if wtype == 0:
+                    continue
+                entities.append(
+                    WarningLevelSensor(
+                        coordinator=coordinator,
+                        entry_id=entry.entry_id,
+                        wtype=wtype,
+                        location=location,
+                        location_name=location_name,
+                    )
+                )
+
+    # Diagnose-Sensoren je Messgröße (p95 der letzten Zyklen)
+    for metric in METRIC_SENSORS:
+        entities.append(
+            UpdateMetricSensor(
+                coordinator=coordinator,
+                entry_id=entry.entry_id,
+                metric=metric,
+            )
+        )
 
-def _get_warnings(data: dict[str, Any]) -> list[dict[str, Any]]:
-    return data.get("properties", {}).get("warnings", []) or []
+    async_add_entities(entities)
 
 
 def _now_ts() -> int:
     return int(dt_util.utcnow().timestamp())
 
 
-def _split_warnings_by_time(
-    data: dict[str, Any]
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    warnings = _get_warnings(data)
-    now_ts = _now_ts()
-    active: list[dict[str, Any]] = []
-    future: list[dict[str, Any]] = []
-    for w in warnings:
-        raw = w.get("properties", {}).get("rawinfo", {})
-        start = int(raw.get("start", 0))
-        end = int(raw.get("end", 0))
-        if start <= now_ts <= end:
-            active.append(w)
-        elif start > now_ts:
-            future.append(w)
-    return active, future
-
-
-def _filter_by_type(
-    warnings: list[dict[str, Any]], wtype: int
-) -> list[dict[str, Any]]:
-    res: list[dict[str, Any]] = []
-    for w in warnings:
-        raw = w.get("properties", {}).get("rawinfo", {})
-        try:
-            wt = int(raw.get("wtype", 0))
-        except (TypeError, ValueError):
-            wt = 0
-        if wt == wtype:
-            res.append(w)
-    return res
-
-
-def _highest_level(warnings: list[dict[str, Any]]) -> int:
-    level = 0
-    for w in warnings:
-        raw = w.get("properties", {}).get("rawinfo", {})
-        try:
-            lv = int(raw.get("wlevel", 0))
-        except (TypeError, ValueError):
-            lv = 0
-        if lv > level:
-            level = lv
-    return level
-
-
-def _last_end(warnings: list[dict[str, Any]]) -> int | None:
-    last: int | None = None
-    for w in warnings:
-        raw = w.get("properties", {}).get("rawinfo", {})
-        try:
-            end = int(raw.get("end", 0))
-        except (TypeError, ValueError):
-            continue
-        if last is None or end > last:
-            last = end
-    return last
-
-
 def _icon_color_for_level(level: int) -> str:
     if level <= 0:
         return "green"
@@ -140,49 +125,52 @@ def _icon_for_type(wtype: int) -> str:
     return "mdi:alert-circle"
 
 
-class WarningLevelSensor(CoordinatorEntity, SensorEntity):
-    _attr_has_entity_name = True
+class WarningLevelSensor(GeosphereEntity, SensorEntity):
 
-    def __init__(self, coordinator: geosphereCoordinator, entry_id: str, wtype: int):
-        super().__init__(coordinator)
-        self._entry_id = entry_id
+    def __init__(
+        self,
+        coordinator: geosphereCoordinator,
+        entry_id: str,
+        wtype: int,
+        location: str | None = None,
+        location_name: str | None = None,
+    ):
+        super().__init__(coordinator, entry_id, location, location_name)
         self._wtype = wtype
 
         typename = WARNING_TYPES.get(wtype, f"Typ {wtype}")
-        self._attr_unique_id = f"{entry_id}_wlevel_{wtype}"
+        self._attr_unique_id = f"{self._id_prefix}_wlevel_{wtype}"
         self._attr_name = f"{typename} Warnungslevel"
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Restdauer läuft auch bei unveränderten Daten weiter
+        self.async_on_remove(
+            self.coordinator.async_add_time_listener(self._handle_time_tick)
+        )
+
+    @callback
+    def _handle_time_tick(self) -> None:
+        if self.snapshot.type_level.get(self._wtype, 0) > 0:
+            self._handle_coordinator_update()
+
     @property
     def icon(self) -> str:
         return _icon_for_type(self._wtype)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-            name="GeoSphere Wetterwarnungen",
-            manufacturer="ZAMG / Geosphere Austria",
-        )
-
     @property
     def native_value(self) -> int:
-        data = self.coordinator.data or {}
-        active, _ = _split_warnings_by_time(data)
-        active_for_type = _filter_by_type(active, self._wtype)
-        level = _highest_level(active_for_type)
-        return level
+        return self.snapshot.type_level.get(self._wtype, 0)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        active, _ = _split_warnings_by_time(data)
-        active_for_type = _filter_by_type(active, self._wtype)
+        snapshot = self.snapshot
 
         attrs: dict[str, Any] = {}
 
-        level = _highest_level(active_for_type)
+        level = snapshot.type_level.get(self._wtype, 0)
 
-        last_end = _last_end(active_for_type)
+        last_end = snapshot.type_last_end.get(self._wtype)
         now_ts = _now_ts()
 
         if last_end is not None and last_end > now_ts and level > 0:
@@ -202,3 +190,41 @@ class WarningLevelSensor(CoordinatorEntity, SensorEntity):
         return attrs
 
 
+class UpdateMetricSensor(GeosphereEntity, SensorEntity):
+    """p95 einer Messgröße des Koordinators; p50/max/Anzahl als Attribute."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator: geosphereCoordinator, entry_id: str, metric: str):
+        super().__init__(coordinator, entry_id)
+        self._metric = metric
+
+        name, unit = METRIC_SENSORS[metric]
+        self._attr_unique_id = f"{entry_id}_metric_{metric}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        if unit == UnitOfInformation.BYTES:
+            self._attr_device_class = SensorDeviceClass.DATA_SIZE
+            self._attr_icon = "mdi:download-network-outline"
+        else:
+            self._attr_device_class = SensorDeviceClass.DURATION
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Messwerte gibt es jeden Zyklus, auch bei unveränderten Warnungen
+        self.async_on_remove(
+            self.coordinator.async_add_status_listener(
+                self._handle_coordinator_update
+            )
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.metrics.cycle[self._metric].as_dict()["p95"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self.coordinator.metrics.cycle[self._metric].as_dict()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    ATTR_CONFIG_ENTRY,
+    ATTR_LATITUDE,
+    ATTR_LOCATION,
+    ATTR_LONGITUDE,
+    QUERY_CACHE_TTL,
+)
+from .coordinator import geosphereCoordinator
+from .snapshot import WarningSnapshot
+
+DETAILS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY): cv.string,
+        vol.Optional(ATTR_LOCATION): cv.string,
+    }
+)
+
+WARNINGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_LATITUDE): cv.latitude,
+        vol.Required(ATTR_LONGITUDE): cv.longitude,
+        vol.Optional(ATTR_CONFIG_ENTRY): cv.string,
+    }
+)
+
+
+def get_coordinators(
+    hass: HomeAssistant, entry_id: str | None
+) -> list[geosphereCoordinator]:
+    """Koordinatoren eines bzw. aller geladenen Einträge."""
+    entries = hass.data.get(DOMAIN, {})
+    if entry_id is not None:
+        if entry_id not in entries:
+            raise ServiceValidationError(f"Unknown config entry {entry_id}")
+        return [entries[entry_id]["coordinator"]]
+    if not entries:
+        raise ServiceValidationError("No GeoSphere Wetterwarnung entry loaded")
+    return [data["coordinator"] for data in entries.values()]
+
+
+def _find_location(
+    coordinator: geosphereCoordinator, location: str
+) -> tuple[str, str] | None:
+    """Ort per Label ("lat,lon") oder Name; ``None``, wenn nicht konfiguriert."""
+    for label, name in coordinator.configured_locations().items():
+        if location in (label, name):
+            return label, name
+    return None
+
+
+async def async_handle_details(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Warnungsdetails, die nicht im Recorder landen, je Eintrag (bzw. Ort).
+
+    Entspricht den Attributen ``Warnung``/``Vorwarnung Daten`` und ``Text``
+    der Summen-Sensoren.
+    """
+    coordinators = get_coordinators(hass, call.data.get(ATTR_CONFIG_ENTRY))
+    location: str | None = call.data.get(ATTR_LOCATION)
+
+    entries: list[dict[str, Any]] = []
+    for coordinator in coordinators:
+        entry = coordinator.config_entry
+        item: dict[str, Any] = {
+            "config_entry": entry.entry_id,
+            "title": entry.title,
+            "location": None,
+        }
+        if location is None:
+            snapshot = coordinator.snapshot
+        else:
+            found = None
+            if coordinator.per_location:
+                found = _find_location(coordinator, location)
+            if found is None:
+                continue
+            label, item["location"] = found
+            snapshot = coordinator.location_snapshot(label)
+        item["active"] = snapshot.active.as_dict()
+        item["upcoming"] = snapshot.future.as_dict()
+        entries.append(item)
+
+    if location is not None and not entries:
+        raise ServiceValidationError(
+            f"Location {location} not found in an entry with per-location entities"
+        )
+    return {"entries": entries}
+
+
+async def async_handle_warnings(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Aktuelle Warnungen und Vorwarnungen an einer beliebigen Koordinate.
+
+    Die Abfrage läuft über die gemeinsame Abfrage-Schicht: gleiche
+    Koordinaten innerhalb von ``QUERY_CACHE_TTL`` (auch die eines Eintrags)
+    und gleichzeitige Aufrufe kosten keine weitere HTTP-Abfrage.
+    """
+    coordinator = get_coordinators(hass, call.data.get(ATTR_CONFIG_ENTRY))[0]
+    lat: float = call.data[ATTR_LATITUDE]
+    lon: float = call.data[ATTR_LONGITUDE]
+    result = await coordinator.async_query(lat, lon, QUERY_CACHE_TTL)
+    if result["error"] is not None:
+        raise HomeAssistantError(f"Query for {lat},{lon} failed: {result['error']}")
+
+    now_ts = int(dt_util.utcnow().timestamp())
+    snapshot = WarningSnapshot(
+        {"properties": {"warnings": result["warnings"]}}, now_ts
+    )
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "cached": result["shared"],
+        "active": snapshot.active.as_dict(),
+        "upcoming": snapshot.future.as_dict(),
+    }
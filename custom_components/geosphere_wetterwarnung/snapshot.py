@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
+
+from homeassistant.util import dt as dt_util
+
+from .const import WARNING_TYPES
+from .model import WarningRecord
+
+
+def _get_warnings(data: dict[str, Any]) -> list[WarningRecord]:
+    return data.get("properties", {}).get("warnings", []) or []
+
+
+def _build_summary_lines(grouped: Mapping[int, Mapping[str, Any]]) -> List[str]:
+    items = [
+        (wtype, data["level"], data.get("text", ""))
+        for wtype, data in grouped.items()
+    ]
+    items.sort(key=lambda x: x[1], reverse=True)
+
+    lines: List[str] = []
+    for wtype, level, text in items:
+        typename = WARNING_TYPES.get(wtype, str(wtype))
+        if text:
+            lines.append(f"Level {level}: {typename} – {text}")
+        else:
+            lines.append(f"Level {level}: {typename}")
+    return lines
+
+
+def _decode_coverage(
+    masks: Mapping[int, int], coordinates: List[str]
+) -> Dict[int, tuple[str, ...]]:
+    """Bitmaske je Typ -> Namen der meldenden Koordinaten."""
+    return {
+        wtype: tuple(
+            name for idx, name in enumerate(coordinates) if mask >> idx & 1
+        )
+        for wtype, mask in masks.items()
+    }
+
+
+def _build_details(
+    grouped: Mapping[int, Mapping[str, Any]],
+    locations: Mapping[int, tuple[str, ...]] | None = None,
+) -> List[Dict[str, Any]]:
+    """Liste für die Attribute ``Warnung Daten`` / ``Vorwarnung Daten``.
+
+    Mit ``locations`` (mehrere Koordinaten) steht je Typ dabei, an welchen
+    Orten er gemeldet wurde.
+    """
+    details: List[Dict[str, Any]] = []
+    for wtype, info in grouped.items():
+        typename = WARNING_TYPES.get(wtype, str(wtype))
+        start_dt = dt_util.as_local(
+            datetime.fromtimestamp(info["start"], tz=dt_util.UTC)
+        )
+        end_dt = dt_util.as_local(datetime.fromtimestamp(info["end"], tz=dt_util.UTC))
+        item = {
+            "type": typename,
+            "level": info["level"],
+            "text": info.get("text", ""),
+            "start": start_dt.isoformat(),
+            "end": end_dt.isoformat(),
+        }
+        if locations is not None:
+            item["locations"] = list(locations.get(wtype, ()))
+        details.append(item)
+    return details
+
+
+class WarningBucket:
+    """Aktive oder zukünftige Warnungen, nach Typ indiziert."""
+
+    __slots__ = (
+        "warnings",
+        "by_type",
+        "grouped",
+        "level",
+        "lines",
+        "text",
+        "details",
+    )
+
+    def __init__(
+        self,
+        warnings: list[WarningRecord],
+        locations: Mapping[int, tuple[str, ...]] | None = None,
+    ):
+        by_type: dict[int, list[WarningRecord]] = {}
+        grouped: dict[int, Mapping[str, Any]] = {}
+
+        for w in warnings:
+            wtype = w.wtype
+            by_type.setdefault(wtype, []).append(w)
+
+            if wtype == 0:
+                continue
+            entry = grouped.get(wtype)
+            if entry is None or w.level > entry["level"]:
+                grouped[wtype] = MappingProxyType(
+                    {
+                        "level": w.level,
+                        "text": w.text,
+                        "start": w.start,
+                        "end": w.end,
+                    }
+                )
+
+        self.warnings: tuple[WarningRecord, ...] = tuple(warnings)
+        self.by_type: Mapping[int, tuple[WarningRecord, ...]] = MappingProxyType(
+            {wtype: tuple(items) for wtype, items in by_type.items()}
+        )
+        self.grouped: Mapping[int, Mapping[str, Any]] = MappingProxyType(grouped)
+        self.level: int = max((info["level"] for info in grouped.values()), default=0)
+        self.lines: tuple[str, ...] = tuple(_build_summary_lines(grouped))
+        self.text: str = "\n".join(self.lines) if grouped else "Keine"
+        self.details: tuple[Mapping[str, Any], ...] = tuple(
+            MappingProxyType(item) for item in _build_details(grouped, locations)
+        )
+
+    def __len__(self) -> int:
+        return len(self.warnings)
+
+    def for_type(self, wtype: int) -> tuple[WarningRecord, ...]:
+        return self.by_type.get(wtype, ())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Level, Text und Details, z.B. für Dienst-Antwort und Diagnose."""
+        return {
+            "level": self.level,
+            "text": self.text,
+            "details": [dict(item) for item in self.details],
+        }
+
+
+class WarningSnapshot:
+    """Unveränderlicher, indizierter Stand der Warnungen zu einem Zeitpunkt.
+
+    Wird einmal pro Coordinator-Daten (bzw. pro Zeitgrenze) gebaut und von
+    allen Entitäten gelesen, statt dass jede Entität die Rohdaten scannt.
+    """
+
+    __slots__ = (
+        "data",
+        "built_ts",
+        "valid_until",
+        "next_start",
+        "active",
+        "future",
+        "type_level",
+        "type_relevant_level",
+        "type_first_start",
+        "type_last_end",
+    )
+
+    def __init__(self, data: dict[str, Any] | None, now_ts: int):
+        active: list[WarningRecord] = []
+        future: list[WarningRecord] = []
+        # Nächster Zeitpunkt, ab dem sich die Einteilung aktiv/zukünftig ändert
+        valid_until: int | None = None
+
+        type_level: dict[int, int] = {}
+        type_relevant_level: dict[int, int] = {}
+        type_first_start: dict[int, int] = {}
+        type_last_end: dict[int, int] = {}
+
+        # Meldende Koordinaten je Warnung (Hex-Bitmaske über ``coordinates``),
+        # nur bei mehreren Koordinaten vorhanden
+        props = (data or {}).get("properties", {})
+        coverage = props.get("coverage") or ()
+        coordinates = props.get("coordinates") or ()
+        active_masks: dict[int, int] = {}
+        future_masks: dict[int, int] = {}
+
+        for idx, w in enumerate(_get_warnings(data or {})):
+            start = w.start
+            end = w.end
+            if start <= now_ts <= end:
+                active.append(w)
+                boundary = end + 1
+                is_active = True
+            elif start > now_ts:
+                future.append(w)
+                boundary = start
+                is_active = False
+            else:
+                continue
+
+            if valid_until is None or boundary < valid_until:
+                valid_until = boundary
+
+            wtype = w.wtype
+            if idx < len(coverage):
+                masks = active_masks if is_active else future_masks
+                masks[wtype] = masks.get(wtype, 0) | int(coverage[idx], 16)
+            level = w.level
+            if level > type_relevant_level.get(wtype, 0):
+                type_relevant_level[wtype] = level
+            if wtype not in type_first_start or start < type_first_start[wtype]:
+                type_first_start[wtype] = start
+            if is_active:
+                if level > type_level.get(wtype, 0):
+                    type_level[wtype] = level
+                if wtype not in type_last_end or end > type_last_end[wtype]:
+                    type_last_end[wtype] = end
+
+        self.data = data
+        self.built_ts = now_ts
+        self.valid_until = valid_until
+        # Frühester Beginn einer zukünftigen Warnung
+        self.next_start: int | None = min((w.start for w in future), default=None)
+        if coordinates:
+            self.active = WarningBucket(
+                active, _decode_coverage(active_masks, coordinates)
+            )
+            self.future = WarningBucket(
+                future, _decode_coverage(future_masks, coordinates)
+            )
+        else:
+            self.active = WarningBucket(active)
+            self.future = WarningBucket(future)
+        self.type_level: Mapping[int, int] = MappingProxyType(type_level)
+        self.type_relevant_level: Mapping[int, int] = MappingProxyType(
+            type_relevant_level
+        )
+        self.type_first_start: Mapping[int, int] = MappingProxyType(type_first_start)
+        self.type_last_end: Mapping[int, int] = MappingProxyType(type_last_end)
+
+    def is_current(self, data: Any, now_ts: int) -> bool:
+        """Gilt der Snapshot noch für diese Daten und diesen Zeitpunkt?"""
+        if data is not self.data:
+            return False
+        return self.valid_until is None or now_ts < self.valid_until
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util.location import distance
+
+from .const import TRACKER_AREA_CACHE, TRACKER_DEBOUNCE
+
+
+def _position(state: State | None) -> Tuple[float, float, float | None] | None:
+    """(lat, lon, GPS-Genauigkeit) aus einem Zustand, sonst ``None``."""
+    if state is None:
+        return None
+    attrs = state.attributes
+    try:
+        lat = float(attrs["latitude"])
+        lon = float(attrs["longitude"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    try:
+        accuracy = float(attrs["gps_accuracy"])
+    except (KeyError, TypeError, ValueError):
+        accuracy = None
+    return lat, lon, accuracy
+
+
+class LocationTracker:
+    """Zonen, Personen und Device-Tracker als zusätzliche Abfragepunkte.
+
+    Abgefragt wird je Entität ein Ankerpunkt. Er wandert erst, wenn sich
+    die Position um mindestens ``min_distance`` Meter entfernt hat; GPS-
+    Sprünge darunter und Positionen ungenauer als ``min_distance`` werden
+    ignoriert. Neue Anker rasten auf einen der zuletzt genutzten Anker der
+    Entität ein, wenn er nah genug liegt: Pendeln zwischen denselben Orten
+    trifft so dieselbe URL und damit die gemeinsame Abfrage-Schicht. Eine
+    neue Abfrage wird höchstens alle ``TRACKER_DEBOUNCE`` Sekunden angestoßen.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_ids: List[str],
+        min_distance: float,
+        logger: Any,
+        on_moved: Callable[[], Awaitable[None]],
+    ) -> None:
+        self._hass = hass
+        self.entity_ids = list(dict.fromkeys(entity_ids))
+        self.min_distance = min_distance
+        # entity_id -> aktueller Anker (lat, lon) bzw. zuletzt genutzte Anker
+        self._anchors: Dict[str, Tuple[float, float]] = {}
+        self._areas: Dict[str, List[Tuple[float, float]]] = {}
+        self._debouncer = Debouncer(
+            hass, logger, cooldown=TRACKER_DEBOUNCE, immediate=False, function=on_moved
+        )
+        # Zähler: Ankerwechsel, ignorierte Sprünge/ungenaue Positionen,
+        # wiederverwendete Anker
+        self.moves: int = 0
+        self.jitter_skipped: int = 0
+        self.inaccurate_skipped: int = 0
+        self.area_hits: int = 0
+
+    def points(self) -> List[Tuple[float, float, str]]:
+        """Aktuelle Ankerpunkte (lat, lon, Name) aller Entitäten mit Position."""
+        points: List[Tuple[float, float, str]] = []
+        for entity_id in self.entity_ids:
+            state = self._hass.states.get(entity_id)
+            anchor = self._anchors.get(entity_id)
+            if anchor is None:
+                position = _position(state)
+                if position is None:
+                    continue
+                anchor = self._move(entity_id, position[0], position[1])
+            name = state.name if state is not None else entity_id
+            points.append((anchor[0], anchor[1], name))
+        return points
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Positionsänderungen verfolgen; liefert die Abmelde-Funktion."""
+        if not self.entity_ids:
+            return lambda: None
+        unsub = async_track_state_change_event(
+            self._hass, self.entity_ids, self._async_state_changed
+        )
+
+        @callback
+        def stop() -> None:
+            unsub()
+            self._debouncer.async_cancel()
+
+        return stop
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        entity_id = event.data["entity_id"]
+        position = _position(event.data.get("new_state"))
+        if position is None:
+            return
+        lat, lon, accuracy = position
+        if accuracy is not None and accuracy > self.min_distance:
+            self.inaccurate_skipped += 1
+            return
+        anchor = self._anchors.get(entity_id)
+        if anchor is not None and self._distance(anchor, lat, lon) < self.min_distance:
+            self.jitter_skipped += 1
+            return
+        self._move(entity_id, lat, lon)
+        self._hass.async_create_task(self._debouncer.async_call())
+
+    def _move(self, entity_id: str, lat: float, lon: float) -> Tuple[float, float]:
+        """Neuen Anker setzen (bzw. einen nahen früheren wiederverwenden)."""
+        areas = self._areas.setdefault(entity_id, [])
+        anchor = next(
+            (
+                area
+                for area in areas
+                if self._distance(area, lat, lon) < self.min_distance
+            ),
+            None,
+        )
+        if anchor is None:
+            anchor = (lat, lon)
+        else:
+            areas.remove(anchor)
+            self.area_hits += 1
+        areas.append(anchor)
+        del areas[:-TRACKER_AREA_CACHE]
+        if entity_id in self._anchors:
+            self.moves += 1
+        self._anchors[entity_id] = anchor
+        return anchor
+
+    @staticmethod
+    def _distance(anchor: Tuple[float, float], lat: float, lon: float) -> float:
+        return distance(anchor[0], anchor[1], lat, lon) or 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entities": len(self.entity_ids),
+            "min_distance": self.min_distance,
+            "moves": self.moves,
+            "area_hits": self.area_hits,
+            "jitter_skipped": self.jitter_skipped,
+            "inaccurate_skipped": self.inaccurate_skipped,
+        }